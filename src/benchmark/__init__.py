@@ -0,0 +1,3 @@
+from .dataset import DatasetGenerator
+from .runner import BenchmarkRunner, compare_results
+from .stand_in import StandInConnector, StandInDatabase
@@ -0,0 +1,124 @@
+"""
+Benchmark Main Module
+
+This module contains the entry point of the benchmark, run from the src directory
+through command "python -m benchmark".
+
+Functions:
+    arguments(): Creates an argument parser for the benchmark.
+    main(): Runs the benchmark and writes its result as JSON.
+
+"""
+
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from configuration_loader import ConfigLoader
+from database_manager import DataManager
+from .dataset import DatasetGenerator
+from .runner import BenchmarkRunner, compare_results
+from .stand_in import StandInConnector, StandInDatabase
+
+
+def arguments():
+    """
+    Creates an argument parser for the benchmark.
+
+    Returns:
+        argparse.ArgumentParser: An argument parser object configured for the benchmark.
+
+    """
+
+    info = 'Benchmark of the import, CRUD and report paths, run trough command "python -m benchmark"'
+    parser = argparse.ArgumentParser(formatter_class=argparse.MetavarTypeHelpFormatter, description=info)
+    parser.add_argument('--scale', type=int, default=1000,
+                        help='number of generated owners, other tables are sized proportionally')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the generated dataset')
+    parser.add_argument('--repeat', type=int, default=3, help='number of runs of every phase')
+    parser.add_argument('--batch-size', type=int, default=1000, help='number of rows parsed and imported at once')
+    parser.add_argument('--selects', type=int, default=1000, help='number of point selects of one run')
+    parser.add_argument('--server', action='store_true',
+                        help='run against the database configured in config.ini instead of the in-process stand-in')
+    parser.add_argument('--first-id', type=int, default=None,
+                        help='ID of the first generated row, defaults to 1 for the stand-in and 1000000 for a server')
+    parser.add_argument('--latency', type=float, default=0.0, help='milliseconds every stand-in statement waits')
+    parser.add_argument('--output', type=str, default=None, help='file the JSON result is written into')
+    parser.add_argument('--baseline', type=str, default=None, help='JSON result the run is compared with')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='allowed slowdown against the baseline, e.g. 0.2 for 20 %%')
+
+    return parser
+
+
+def main():
+    """
+    Runs the benchmark and writes its result as JSON. Exits with status 1 if a phase
+    is slower than in the baseline by more than the threshold.
+
+    """
+
+    args = arguments().parse_args()
+    conf_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../', 'config'))
+    conf_loader = ConfigLoader(f'{conf_path}/config.ini')
+    query_config = conf_loader.load_query_config()
+
+    if args.server:
+        from database_utils import connector
+
+        config, name, _ = conf_loader.load_config()
+        default_config = ['127.0.0.1', '3306', 'root', '', 'AUCTIONS', 3]
+        connection = connector.Connector(*config[:-1], default_conf=default_config,
+                                         pool_conf=conf_loader.load_pool_config())
+        first_id = args.first_id if args.first_id is not None else 1000000
+    else:
+        database = StandInDatabase(latency=args.latency / 1000)
+        connection = StandInConnector(database)
+        name = 'benchmark'
+        first_id = args.first_id if args.first_id is not None else 1
+
+    generator = DatasetGenerator.from_scale(args.scale, args.seed, first_id)
+    data_manager = DataManager(connection, name, query_conf=query_config,
+                               cache_conf=conf_loader.load_cache_config())
+
+    def reset():
+        if not args.server:
+            database.clear()
+            return
+        tables = data_manager.import_planner.order_tables(generator.counts)
+        for table in reversed(tables):
+            data_manager.execute_query(f'DELETE FROM {table.upper()} WHERE ID BETWEEN %s AND %s;',
+                                       [first_id, first_id + generator.counts[table] - 1])
+
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            runner = BenchmarkRunner(data_manager, generator, directory, reset, args.batch_size,
+                                     args.repeat, args.selects)
+            result = runner.run()
+            if args.server:
+                reset()
+    finally:
+        connection.close_connection()
+
+    result['backend'] = 'server' if args.server else 'stand-in'
+    output = json.dumps(result, indent=2, default=str)
+    if args.output is None:
+        print(output)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(output)
+
+    if args.baseline is not None:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            regressions = compare_results(result, json.load(file), args.threshold)
+        for phase, expected, measured, ratio in regressions:
+            print(f'Regression in {phase}: median {measured:.6f} s, baseline {expected:.6f} s ({ratio:.2f}x)',
+                  file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+"""
+Dataset Module
+
+This module defines the DatasetGenerator class generating synthetic auction data for benchmarks.
+
+Classes:
+    DatasetGenerator: A generator of synthetic rows for every table of the auction schema.
+
+"""
+
+
+import os
+import random
+import xml.etree.ElementTree as Et
+from datetime import datetime, timedelta
+from enum import Enum
+from database_manager.data_layer.import_planner import ImportPlanner
+from database_manager.data_layer.table import *
+
+
+class DatasetGenerator:
+    """
+    A generator of synthetic rows for every table of the auction schema. Columns and their types
+    are taken from the entity classes, foreign key columns reference generated rows of the referenced
+    table. Rows are generated as XML texts, the same way the import reads them from files.
+
+    Attributes:
+        TABLES (dict): The entity class of every table keyed by table name, in foreign key order.
+        SCALE (dict): The number of rows of every table generated per unit of scale.
+        counts (dict): The number of generated rows keyed by table name.
+        seed (int): The seed of the random generator, the same seed generates the same data.
+        first_id (int): The ID of the first generated row of every table.
+
+    Methods:
+        from_scale(scale, seed, first_id): Creates a generator with row counts proportional to a scale.
+        generate(table): Generates the rows of a table.
+        write_xml(directory): Writes the rows of every table into an XML import file.
+
+    """
+
+    TABLES = {
+        'owner': Owner,
+        'bidder': Bidder,
+        'item': Item,
+        'auction': Auction,
+        'offer': Offer,
+        'winning_offer': WinningOffer
+    }
+
+    SCALE = {'owner': 1, 'bidder': 1, 'item': 2, 'auction': 2, 'offer': 10, 'winning_offer': 1}
+
+    def __init__(self, counts: dict, seed: int = 0, first_id: int = 1):
+        """
+        Initializes the DatasetGenerator instance.
+
+        Args:
+            counts (dict): The number of generated rows keyed by table name, missing tables are not generated.
+            seed (int): The seed of the random generator.
+            first_id (int): The ID of the first generated row of every table.
+
+        """
+
+        self.counts = {table: counts.get(table, 0) for table in self.TABLES}
+        self.seed = seed
+        self.first_id = first_id
+
+    @classmethod
+    def from_scale(cls, scale: int, seed: int = 0, first_id: int = 1):
+        """
+        Creates a generator with row counts proportional to a scale.
+
+        Args:
+            scale (int): The number of owners, other tables are sized by SCALE.
+            seed (int): The seed of the random generator.
+            first_id (int): The ID of the first generated row of every table.
+
+        Returns:
+            DatasetGenerator: The generator.
+
+        """
+
+        return cls({table: scale * factor for table, factor in cls.SCALE.items()}, seed, first_id)
+
+    def generate(self, table: str):
+        """
+        Generates the rows of a table, each row is a dict of XML texts keyed by column name.
+
+        Args:
+            table (str): The name of the table, e.g. "winning_offer".
+
+        Returns:
+            list: The generated rows.
+
+        """
+
+        rng = random.Random(f'{self.seed}:{table}')
+        params = self.TABLES[table].__init__.__annotations__
+        foreign_keys = ImportPlanner.DEFAULT_FOREIGN_KEYS.get(table, {})
+
+        columns = []
+        for name, typeof in params.items():
+            if name == 'return':
+                continue
+            column = 'ID' if name == 'identifier' else name.upper()
+            reference = foreign_keys.get(column)
+            columns.append((column, typeof, reference[0] if reference else None))
+
+        rows = []
+        for index in range(self.counts[table]):
+            row = {}
+            for column, typeof, reference in columns:
+                if column == 'ID':
+                    row[column] = str(self.first_id + index)
+                elif reference is not None:
+                    row[column] = str(self.first_id + rng.randrange(max(self.counts[reference], 1)))
+                else:
+                    row[column] = self.generate_value(rng, column, typeof)
+            rows.append(row)
+
+        return rows
+
+    @staticmethod
+    def generate_value(rng: random.Random, column: str, typeof):
+        """
+        Generates the XML text of a value of a column.
+
+        Args:
+            rng (random.Random): The random generator.
+            column (str): The name of the column.
+            typeof (type): The data type of the column.
+
+        Returns:
+            str: The generated text.
+
+        """
+
+        if typeof is int:
+            return str(rng.randrange(10000, 99999))
+        if typeof is float:
+            return f'{rng.uniform(1, 10000):.2f}'
+        if typeof is bool:
+            return str(rng.randrange(2))
+        if typeof is datetime:
+            moment = datetime(2024, 1, 1) + timedelta(minutes=rng.randrange(525600))
+            return moment.strftime('%Y-%m-%d %H:%M:%S')
+        if type(typeof) is type(Enum):
+            return rng.choice(list(typeof)).value
+        if column == 'EMAIL':
+            return f'user{rng.randrange(1000000)}@example.com'
+        return ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randrange(5, 30))).title()
+
+    def write_xml(self, directory: str):
+        """
+        Writes the rows of every table into an XML import file, one file per table.
+
+        Args:
+            directory (str): The directory the files are written into.
+
+        Returns:
+            dict: The paths of the written files keyed by table name.
+
+        """
+
+        os.makedirs(directory, exist_ok=True)
+        paths = {}
+
+        for table in self.TABLES:
+            if not self.counts[table]:
+                continue
+            root = Et.Element('Import')
+            for row in self.generate(table):
+                element = Et.SubElement(root, table.upper())
+                for column, value in row.items():
+                    Et.SubElement(element, column).text = value
+            paths[table] = os.path.join(directory, f'{table}.xml')
+            Et.ElementTree(root).write(paths[table], encoding='utf-8', xml_declaration=True)
+
+        return paths
@@ -0,0 +1,226 @@
+"""
+Benchmark Runner Module
+
+This module defines the BenchmarkRunner class measuring the import, CRUD and report paths
+of the data layer, and a function comparing benchmark results.
+
+Classes:
+    BenchmarkRunner: A class running the benchmark phases on a generated dataset.
+
+Functions:
+    compare_results: Returns the phases of a result which are slower than in a baseline result.
+
+"""
+
+
+import platform
+import random
+import statistics
+import time
+from datetime import datetime
+from database_manager.application_layer.logics import iterate_xml, retype_data
+from .dataset import DatasetGenerator
+
+
+class BenchmarkRunner:
+    """
+    A class running the benchmark phases on a generated dataset. Every phase is run several times
+    and its run times are reported with the number of processed rows, so results of different runs
+    can be compared. Phases run in order, each one uses the output of the previous ones:
+
+    - parse: XML files parsed into batches of texts by iterate_xml.
+    - retype: batches retyped by retype_data.
+    - statements: multi-row insert statements generated by QueryBuilder.create_row_batches.
+    - import: rows imported by DataManager.import_data, tables in foreign key order.
+    - select: point selects by ID through DataManager.make_operation.
+    - report: every view read through DataManager.get_report, bypassing the report cache.
+
+    Attributes:
+        SUFFIX (str): The suffix of the generated XML files.
+        _data_manager: The DataManager object the data are imported and read through.
+        _generator (DatasetGenerator): The generator of the dataset.
+        _directory (str): The directory the XML files are written into.
+        _reset: A callable removing imported rows before every import run.
+        batch_size (int): The number of rows parsed, retyped and imported at once.
+        repeat (int): The number of runs of every phase.
+        selects (int): The number of point selects of one select run.
+        results (dict): The results of the finished phases keyed by phase name.
+
+    Methods:
+        run(): Runs all phases and returns the results.
+        measure(phase, function, rows): Runs a phase and records its run times.
+
+    """
+
+    SUFFIX = '.xml'
+
+    def __init__(self, data_manager, generator: DatasetGenerator, directory: str, reset, batch_size: int = 1000,
+                 repeat: int = 3, selects: int = 1000):
+        """
+        Initializes the BenchmarkRunner instance.
+
+        Args:
+            data_manager: The DataManager object the data are imported and read through.
+            generator (DatasetGenerator): The generator of the dataset.
+            directory (str): The directory the XML files are written into.
+            reset: A callable removing imported rows, called before every import run.
+            batch_size (int): The number of rows parsed, retyped and imported at once.
+            repeat (int): The number of runs of every phase.
+            selects (int): The number of point selects of one select run.
+
+        """
+
+        self._data_manager = data_manager
+        self._generator = generator
+        self._directory = directory
+        self._reset = reset
+        self.batch_size = batch_size
+        self.repeat = repeat
+        self.selects = selects
+        self.results = {}
+
+    def run(self):
+        """
+        Runs all phases and returns the results with the dataset and environment description.
+
+        Returns:
+            dict: The benchmark result, serializable to JSON.
+
+        """
+
+        data_manager = self._data_manager
+        data_manager.refresh_catalog()
+        data_manager.report_cache.clear()
+
+        start = time.perf_counter()
+        paths = self._generator.write_xml(self._directory)
+        generate_time = time.perf_counter() - start
+
+        tables = [table for table in DatasetGenerator.TABLES if table in paths]
+        rows = sum(self._generator.counts[table] for table in tables)
+        entities = {table: data_manager.get_class_attributes(table.replace('_', ' '), 'import', True)
+                    for table in tables}
+        parsed, retyped = {}, {}
+
+        def parse():
+            for table in tables:
+                parsed[table] = [batch for _, batch in iterate_xml(paths[table], self.SUFFIX, self.batch_size)]
+
+        def retype():
+            for table in tables:
+                retyped[table] = [retype_data(batch, entities[table][1]) for batch in parsed[table]]
+
+        max_rows, max_bytes = data_manager.insert_batch_rows, data_manager.get_max_packet()
+        entity_classes = {table: DatasetGenerator.TABLES[table] for table in tables}
+
+        def statements():
+            for table in tables:
+                for batch in retyped[table]:
+                    data_manager.query_builder.create_row_batches(entity_classes[table], batch, max_rows, max_bytes)
+
+        def import_data():
+            self._reset()
+            for table in data_manager.import_planner.order_tables(tables):
+                for batch in retyped[table]:
+                    data_manager.import_data(entities[table][0], batch)
+
+        self.measure('parse', parse, rows)
+        self.measure('retype', retype, rows)
+        self.measure('statements', statements, rows)
+        self.measure('import', import_data, rows)
+
+        rng = random.Random(self._generator.seed)
+        select_tables = [table for table in tables if self._generator.counts[table]]
+        lookups = []
+        for _ in range(self.selects):
+            table = rng.choice(select_tables)
+            class_name, params = entities[table]
+            identifier = self._generator.first_id + rng.randrange(self._generator.counts[table])
+            lookups.append((class_name, [identifier] + [None] * (len(params) - 1)))
+
+        def select():
+            for class_name, user_data in lookups:
+                data_manager.make_operation('select', list(user_data), class_name)
+
+        views = [view.replace(' ', '_') for view in data_manager.get_views()]
+        report_rows = 0
+
+        def report():
+            nonlocal report_rows
+            report_rows = 0
+            for view in views:
+                data_manager.report_cache.clear()
+                report_rows += len(data_manager.get_report(view)[1])
+
+        self.measure('select', select, len(lookups))
+        self.measure('report', report, None)
+        report_result = self.results['report']
+        report_result['rows'] = report_rows
+        report_result['rows_per_s'] = round(report_rows / report_result['median_s'], 1) \
+            if report_rows and report_result['median_s'] > 0 else None
+        report_result['views'] = views
+
+        return {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'dataset': {'counts': self._generator.counts, 'seed': self._generator.seed,
+                        'rows': rows, 'generate_s': round(generate_time, 6)},
+            'settings': {'batch_size': self.batch_size, 'repeat': self.repeat, 'selects': self.selects,
+                         'insert_batch_rows': data_manager.insert_batch_rows,
+                         'prepared_statements': data_manager.prepared_statements},
+            'phases': self.results
+        }
+
+    def measure(self, phase: str, function, rows):
+        """
+        Runs a phase repeatedly and records its run times and throughput.
+
+        Args:
+            phase (str): The name of the phase.
+            function: A callable running the phase once.
+            rows (int): The number of rows processed by one run, None if counted by the phase.
+
+        """
+
+        runs = []
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            function()
+            runs.append(time.perf_counter() - start)
+
+        median = statistics.median(runs)
+        self.results[phase] = {
+            'rows': rows,
+            'runs_s': [round(run, 6) for run in runs],
+            'min_s': round(min(runs), 6),
+            'median_s': round(median, 6),
+            'mean_s': round(statistics.mean(runs), 6),
+            'rows_per_s': round(rows / median, 1) if rows and median > 0 else None
+        }
+
+
+def compare_results(result: dict, baseline: dict, threshold: float):
+    """
+    Returns the phases of a result which are slower than in a baseline result. Median run
+    times are compared, phases missing in one of the results are skipped.
+
+    Args:
+        result (dict): The benchmark result.
+        baseline (dict): The baseline benchmark result.
+        threshold (float): The allowed slowdown, e.g. 0.2 for 20 %.
+
+    Returns:
+        list: Tuples of the phase name, baseline median, result median and the slowdown ratio.
+
+    """
+
+    regressions = []
+    for phase, measured in result['phases'].items():
+        expected = baseline.get('phases', {}).get(phase)
+        if expected is None or not expected['median_s']:
+            continue
+        ratio = measured['median_s'] / expected['median_s']
+        if ratio > 1 + threshold:
+            regressions.append((phase, expected['median_s'], measured['median_s'], round(ratio, 3)))
+    return regressions
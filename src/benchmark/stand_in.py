@@ -0,0 +1,582 @@
+"""
+Stand-In Database Module
+
+This module provides an in-process stand-in for a MySQL server and its connector, used to benchmark
+the data layer without a database server. It understands the statements the data layer sends:
+multi-row inserts, LOAD DATA of spool files, selects filtered by equal columns, reports of the
+auction schema views and the schema catalog query. Transactions are accepted but not isolated.
+
+Classes:
+    StandInDatabase: An in-memory store of the auction schema tables.
+    StandInConnector: A connector stand-in handing out connections to the store.
+    StandInConnection: A connection stand-in executing statements on the store.
+    StandInCursor: A cursor stand-in returning rows of the store.
+
+"""
+
+
+import re
+import threading
+import time
+from datetime import datetime
+from enum import Enum
+from database_manager.data_layer.bulk_loader import read_spool_rows
+from database_manager.data_layer.import_planner import ImportPlanner
+from .dataset import DatasetGenerator
+
+
+class StandInDatabase:
+    """
+    An in-memory store of the auction schema tables. Rows are kept as tuples in column order
+    and indexed by ID, the views of the schema are computed on every read.
+
+    Attributes:
+        VIEWS (dict): The columns of every view keyed by view name.
+        VIEW_TABLES (dict): The base tables of every view keyed by view name.
+        DATA_TYPES (dict): The column data type of every Python type.
+        max_packet (int): The max_allowed_packet reported to the data layer.
+        latency (float): Seconds every statement waits, simulating the network round-trip.
+        _tables (dict): Table metadata and rows keyed by table name.
+        _lock (threading.Lock): Serializes writes of concurrent connections.
+        statements (int): The number of executed statements.
+
+    Methods:
+        clear(): Removes all rows.
+        count(table): Returns the number of rows of a table.
+        execute(query, data): Executes a statement.
+
+    """
+
+    VIEWS = {
+        'auction_winners': ['SURNAME', 'LAST_NAME', 'AMOUNT', 'AUCTION_DESCRIPTION', 'ITEM_NAME',
+                            'ITEM_DESCRIPTION', 'OFFER_DATE'],
+        'offer_counts_by_bidder': ['AUCTION_DESCRIPTION', 'AUCTION_TYPE', 'SURNAME', 'LAST_NAME',
+                                   'OFFERS_COUNT', 'ITEM_NAME']
+    }
+
+    VIEW_TABLES = {
+        'auction_winners': ['offer', 'winning_offer', 'auction', 'item', 'bidder'],
+        'offer_counts_by_bidder': ['offer', 'auction', 'item', 'bidder']
+    }
+
+    DATA_TYPES = {int: 'int', float: 'float', str: 'varchar', bool: 'tinyint', datetime: 'datetime'}
+
+    _INSERT = re.compile(r'INSERT INTO (\w+)\((.*?)\) VALUES', re.IGNORECASE)
+    _SELECT = re.compile(r'SELECT \* FROM (\w+)(?: WHERE (.*?))?(?: ORDER BY .*?)?(?: LIMIT .*?)?;?$',
+                         re.IGNORECASE | re.DOTALL)
+    _LOAD = re.compile(r'LOAD DATA LOCAL INFILE %s INTO TABLE (\w+) .*\((.*)\)', re.IGNORECASE | re.DOTALL)
+    _CONDITION = re.compile(r'(\w+) = %s')
+
+    def __init__(self, max_packet: int = 64 * 1024 * 1024, latency: float = 0.0):
+        """
+        Initializes the StandInDatabase instance with empty tables.
+
+        Args:
+            max_packet (int): The max_allowed_packet reported to the data layer.
+            latency (float): Seconds every statement waits, simulating the network round-trip.
+
+        """
+
+        self.max_packet = max_packet
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._tables = {}
+        self.statements = 0
+
+        for table, entity in DatasetGenerator.TABLES.items():
+            self._tables[table] = {
+                'name': table,
+                'columns': [field.upper() for field in entity.FIELDS],
+                'types': [typeof for name, typeof in entity.__init__.__annotations__.items() if name != 'return'],
+                'rows': {},
+                'next_id': 1
+            }
+
+    def clear(self):
+        """
+        Removes all rows.
+
+        """
+
+        with self._lock:
+            for table in self._tables.values():
+                table['rows'] = {}
+                table['next_id'] = 1
+
+    def count(self, table: str):
+        """
+        Returns the number of rows of a table.
+
+        Args:
+            table (str): The name of the table.
+
+        Returns:
+            int: The number of rows.
+
+        """
+
+        return len(self._get_table(table)['rows'])
+
+    def execute(self, query: str, data=None):
+        """
+        Executes a statement.
+
+        Args:
+            query (str): The SQL statement.
+            data (list, optional): The data values of the statement.
+
+        Returns:
+            list: The result rows, empty for statements not returning rows.
+
+        Raises:
+            Exception: If a table does not exist or an inserted ID is duplicate, formatted like driver errors.
+
+        """
+
+        if self.latency:
+            time.sleep(self.latency)
+        self.statements += 1
+
+        statement = query.lstrip()
+        keyword = statement[:12].upper()
+
+        if '@@max_allowed_packet' in statement:
+            return [(self.max_packet,)]
+        if statement.startswith("SELECT 'column'"):
+            return self._get_catalog('VIEW_TABLE_USAGE' in statement)
+        if keyword.startswith('INSERT'):
+            match = self._INSERT.match(statement)
+            columns = [column.strip() for column in match.group(2).split(',')]
+            data = list(data or [])
+            self._insert(match.group(1), columns, [data[index:index + len(columns)]
+                                                   for index in range(0, len(data), len(columns))])
+            return []
+        if keyword.startswith('LOAD DATA'):
+            match = self._LOAD.match(statement)
+            columns = [column.strip() for column in match.group(2).split(',')]
+            types = self._get_table(match.group(1))['types']
+            for rows in read_spool_rows(data[0], 1000):
+                self._insert(match.group(1), columns, [[typeof(value) if value is not None and typeof in (int, float)
+                                                        else value for typeof, value in zip(types, row)]
+                                                       for row in rows])
+            return []
+        if keyword.startswith('DESCRIBE'):
+            name = statement.split()[1].rstrip(';')
+            columns = self.VIEWS.get(name.lower()) or self._get_table(name)['columns']
+            return [(column,) for column in columns]
+        if keyword.startswith('SELECT'):
+            match = self._SELECT.match(statement.strip())
+            if match is not None:
+                return self._select(match.group(1), match.group(2), list(data or []))
+        return []
+
+    def _get_table(self, name: str):
+        """
+        Returns the metadata and rows of a table.
+
+        Args:
+            name (str): The name of the table in any case.
+
+        Returns:
+            dict: The table.
+
+        Raises:
+            Exception: If the table does not exist.
+
+        """
+
+        table = self._tables.get(name.lower())
+        if table is None:
+            raise Exception(f"1146 (42S02): Table '{name}' doesn't exist")
+        return table
+
+    def _insert(self, name: str, columns: list, rows: list):
+        """
+        Inserts rows into a table.
+
+        Args:
+            name (str): The name of the table.
+            columns (list): The inserted columns.
+            rows (list): The rows of values in the order of columns.
+
+        Raises:
+            Exception: If the table does not exist or an ID is duplicate.
+
+        """
+
+        table = self._get_table(name)
+        positions = [columns.index(column) if column in columns else None for column in table['columns']]
+
+        with self._lock:
+            stored = table['rows']
+            for row in rows:
+                row = tuple(row[position] if position is not None else None for position in positions)
+                if row[0] is None:
+                    row = (table['next_id'], *row[1:])
+                elif row[0] in stored:
+                    raise Exception(f"1062 (23000): Duplicate entry '{row[0]}' for key 'PRIMARY'")
+                stored[row[0]] = row
+                table['next_id'] = max(table['next_id'], row[0] + 1)
+
+    def _select(self, name: str, conditions, data: list):
+        """
+        Selects rows of a table or a view, filtered by columns equal to the data values.
+
+        Args:
+            name (str): The name of the table or view.
+            conditions (str): The WHERE clause, None if not filtered.
+            data (list): The values of the conditions.
+
+        Returns:
+            list: The selected rows.
+
+        """
+
+        if name.lower() in self.VIEWS:
+            return getattr(self, f'_get_{name.lower()}')()
+
+        table = self._get_table(name)
+        columns = self._CONDITION.findall(conditions or '')
+        if not columns or len(columns) != len(data):
+            return list(table['rows'].values())
+
+        filters = dict(zip((table['columns'].index(column.upper()) for column in columns), data))
+        if 0 in filters:
+            row = table['rows'].get(filters.pop(0))
+            candidates = [row] if row is not None else []
+        else:
+            candidates = table['rows'].values()
+        return [row for row in candidates if all(row[index] == value for index, value in filters.items())]
+
+    def _get_auction_winners(self):
+        """
+        Computes the auction_winners view.
+
+        Returns:
+            list: The rows of the view.
+
+        """
+
+        offers, auctions = self._get_table('offer')['rows'], self._get_table('auction')['rows']
+        items, bidders = self._get_table('item')['rows'], self._get_table('bidder')['rows']
+
+        rows = []
+        for _, offer_id in self._get_table('winning_offer')['rows'].values():
+            offer = offers.get(offer_id)
+            auction = auctions.get(offer[3]) if offer else None
+            item = items.get(auction[5]) if auction else None
+            bidder = bidders.get(offer[4]) if offer else None
+            if item and bidder:
+                rows.append((bidder[1], bidder[2], offer[1], auction[4], item[1], item[2], offer[2]))
+        return sorted(rows, key=lambda row: (row[0], row[1]))
+
+    def _get_offer_counts_by_bidder(self):
+        """
+        Computes the offer_counts_by_bidder view.
+
+        Returns:
+            list: The rows of the view.
+
+        """
+
+        auctions, items = self._get_table('auction')['rows'], self._get_table('item')['rows']
+        bidders = self._get_table('bidder')['rows']
+
+        counts = {}
+        for offer in self._get_table('offer')['rows'].values():
+            auction = auctions.get(offer[3])
+            item = items.get(auction[5]) if auction else None
+            bidder = bidders.get(offer[4])
+            if item and bidder:
+                key = (auction[4], auction[3], bidder[1], bidder[2], item[1])
+                counts[key] = counts.get(key, 0) + 1
+        return [(*key[:4], count, key[4]) for key, count in counts.items()]
+
+    def _get_catalog(self, has_view_usage: bool):
+        """
+        Returns the rows of the schema catalog query.
+
+        Args:
+            has_view_usage (bool): Indicates whether view dependencies are included.
+
+        Returns:
+            list: The catalog rows.
+
+        """
+
+        rows = []
+        for table in self._tables.values():
+            for position, (column, typeof) in enumerate(zip(table['columns'], table['types']), 1):
+                data_type = 'enum' if type(typeof) is type(Enum) else self.DATA_TYPES.get(typeof, 'varchar')
+                rows.append(('column', table['name'], 'BASE TABLE', column, data_type,
+                             'PRI' if column == 'ID' else '', position))
+            for position, (column, (reference, referenced_column)) in enumerate(
+                    ImportPlanner.DEFAULT_FOREIGN_KEYS.get(table['name'], {}).items(), 1):
+                rows.append(('foreign_key', table['name'], None, column, reference, referenced_column, position))
+
+        for view, columns in self.VIEWS.items():
+            for position, column in enumerate(columns, 1):
+                rows.append(('column', view, 'VIEW', column, 'varchar', '', position))
+            if has_view_usage:
+                for table in self.VIEW_TABLES[view]:
+                    rows.append(('view_table', view, None, None, table, None, None))
+
+        return rows
+
+
+class StandInConnector:
+    """
+    A connector stand-in handing out connections to a StandInDatabase, with the interface of Connector.
+
+    Attributes:
+        database (StandInDatabase): The store the connections execute statements on.
+        pool_conf (dict): The pool settings, enabled when connections may be used concurrently.
+
+    Methods:
+        get_connection(): Returns a connection.
+        checkout(): Takes a connection.
+        checkin(connection): Returns a connection.
+        close_connection(): Closes the connector.
+
+    """
+
+    def __init__(self, database: StandInDatabase, pooled: bool = True):
+        """
+        Initializes the StandInConnector instance.
+
+        Args:
+            database (StandInDatabase): The store the connections execute statements on.
+            pooled (bool): Indicates whether the data layer may use connections concurrently.
+
+        """
+
+        self.database = database
+        self.pool_conf = {'enabled': pooled}
+
+    def get_connection(self):
+        """
+        Returns a connection.
+
+        Returns:
+            StandInConnection: A new connection.
+
+        """
+
+        return StandInConnection(self.database)
+
+    def checkout(self):
+        """
+        Takes a connection.
+
+        Returns:
+            StandInConnection: A new connection.
+
+        """
+
+        return StandInConnection(self.database)
+
+    def checkin(self, connection):
+        """
+        Returns a connection.
+
+        Args:
+            connection (StandInConnection): The connection taken by checkout().
+
+        """
+
+    def close_connection(self):
+        """
+        Closes the connector.
+
+        """
+
+
+class StandInConnection:
+    """
+    A connection stand-in executing statements on a StandInDatabase.
+
+    Attributes:
+        database (StandInDatabase): The store statements are executed on.
+
+    Methods:
+        cursor(**kwargs): Creates a cursor.
+        start_transaction(): Begins a transaction.
+        commit(): Commits the transaction.
+        rollback(): Rolls back the transaction.
+        is_connected(): Checks whether the connection is open.
+        reconnect(attempts): Opens the connection again.
+        consume_results(): Discards unread results.
+
+    """
+
+    def __init__(self, database: StandInDatabase):
+        """
+        Initializes the StandInConnection instance.
+
+        Args:
+            database (StandInDatabase): The store statements are executed on.
+
+        """
+
+        self.database = database
+
+    def cursor(self, **kwargs):
+        """
+        Creates a cursor, prepared and unbuffered cursors behave the same.
+
+        Args:
+            **kwargs: The cursor options of the driver.
+
+        Returns:
+            StandInCursor: A cursor.
+
+        """
+
+        return StandInCursor(self)
+
+    def start_transaction(self):
+        """
+        Begins a transaction.
+
+        """
+
+    def commit(self):
+        """
+        Commits the transaction.
+
+        """
+
+    def rollback(self):
+        """
+        Rolls back the transaction, rows already written are kept.
+
+        """
+
+    def is_connected(self):
+        """
+        Checks whether the connection is open.
+
+        Returns:
+            bool: Always True.
+
+        """
+
+        return True
+
+    def reconnect(self, attempts=1):
+        """
+        Opens the connection again.
+
+        Args:
+            attempts (int): The number of attempts.
+
+        """
+
+    def consume_results(self):
+        """
+        Discards unread results.
+
+        """
+
+
+class StandInCursor:
+    """
+    A cursor stand-in returning rows of a StandInDatabase.
+
+    Attributes:
+        connection (StandInConnection): The connection the cursor belongs to.
+        _rows (list): The unread rows of the last executed statement.
+        rowcount (int): The number of rows returned by the last executed statement, -1 before the first one.
+
+    Methods:
+        execute(query, data): Executes a statement.
+        executemany(query, data): Executes a statement once for every list of values.
+        fetchall(): Returns all unread rows.
+        fetchmany(size): Returns at most size unread rows.
+        close(): Closes the cursor.
+
+    """
+
+    def __init__(self, connection: StandInConnection):
+        """
+        Initializes the StandInCursor instance.
+
+        Args:
+            connection (StandInConnection): The connection the cursor belongs to.
+
+        """
+
+        self.connection = connection
+        self._rows = []
+        self.rowcount = -1
+
+    @property
+    def with_rows(self):
+        """
+        Checks whether the last executed statement returned rows.
+
+        Returns:
+            bool: True if there are unread rows, False otherwise.
+
+        """
+
+        return bool(self._rows)
+
+    def execute(self, query, data=None):
+        """
+        Executes a statement.
+
+        Args:
+            query (str): The SQL statement.
+            data (list, optional): The data values of the statement.
+
+        """
+
+        self._rows = self.connection.database.execute(query, data)
+        self.rowcount = len(self._rows)
+
+    def executemany(self, query, data):
+        """
+        Executes a statement once for every list of values.
+
+        Args:
+            query (str): The SQL statement.
+            data (list): The lists of data values.
+
+        """
+
+        for values in data:
+            self.execute(query, values)
+
+    def fetchall(self):
+        """
+        Returns all unread rows.
+
+        Returns:
+            list: The rows.
+
+        """
+
+        rows, self._rows = self._rows, []
+        return rows
+
+    def fetchmany(self, size=1):
+        """
+        Returns at most size unread rows.
+
+        Args:
+            size (int): The maximum number of rows.
+
+        Returns:
+            list: The rows.
+
+        """
+
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def close(self):
+        """
+        Closes the cursor.
+
+        """
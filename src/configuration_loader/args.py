@@ -23,5 +23,14 @@ def arguments():
 
     info = 'Program used for database management, run trough command "python main.py"'
     parser = argparse.ArgumentParser(formatter_class=argparse.MetavarTypeHelpFormatter, description=info)
+    parser.add_argument('--script', type=str, default=None,
+                        help='run commands from a script file ("-" for standard input) instead of the console')
+    parser.add_argument('--profile', type=str, default=None, choices=['cpu', 'memory', 'all'],
+                        help='profile the whole script, or every console command, with cProfile (cpu), '
+                             'tracemalloc (memory) or both (all)')
+    parser.add_argument('--profile-dir', type=str, default='../profile',
+                        help='directory the profile files are saved into')
+    parser.add_argument('--profile-top', type=int, default=20,
+                        help='number of printed functions and allocation sites of a profile')
 
     return parser
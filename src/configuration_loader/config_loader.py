@@ -21,6 +21,11 @@ class ConfigLoader:
 
     Methods:
         load_config(): Loads configuration settings from the specified file and returns them as a list.
+        load_pool_config(): Loads connection pool settings from the specified file and returns them as a dict.
+        load_query_config(): Loads query execution settings from the specified file and returns them as a dict.
+        load_import_config(): Loads data import settings from the specified file and returns them as a dict.
+        load_cache_config(): Loads cache settings from the specified file and returns them as a dict.
+        load_metrics_config(): Loads metrics settings from the specified file and returns them as a dict.
 
     """
 
@@ -69,3 +74,212 @@ class ConfigLoader:
 
         data_list = [ip, port, user, password, name, attempts, timeout, import_file]
         return data_list, name, logs
+
+    def load_pool_config(self):
+        """
+        Loads connection pool settings from the [CONNECTION] section of the specified file.
+        Missing keys fall back to defaults, pool mode is disabled unless Pool_Enabled is set.
+
+        Returns:
+            dict: A dict containing pool settings (enabled, min_size, max_size, idle_timeout,
+                  max_lifetime, checkout_timeout).
+
+        Raises:
+            TypeError: If the configuration data types are invalid.
+
+        """
+
+        config = configparser.ConfigParser()
+        config.read(self.path)
+        section = config['CONNECTION']
+
+        try:
+            pool_conf = {
+                'enabled': section.getboolean('Pool_Enabled', fallback=False),
+                'min_size': section.getint('Pool_Min_Size', fallback=1),
+                'max_size': section.getint('Pool_Max_Size', fallback=5),
+                'idle_timeout': section.getint('Pool_Idle_Timeout', fallback=300),
+                'max_lifetime': section.getint('Pool_Max_Lifetime', fallback=3600),
+                'checkout_timeout': section.getint('Pool_Checkout_Timeout', fallback=10)
+            }
+        except ValueError:
+            raise TypeError('Invalid config data types')
+
+        return pool_conf
+
+    def load_query_config(self):
+        """
+        Loads query execution settings from the [QUERY] section of the specified file.
+        Missing section or keys fall back to defaults.
+
+        Returns:
+            dict: A dict containing query settings (stream_results, fetch_chunk_size, insert_batch_rows,
+                  prepared_statements, prepared_cache_size, page_size, commit_rows).
+
+        Raises:
+            TypeError: If the configuration data types are invalid.
+
+        """
+
+        config = configparser.ConfigParser()
+        config.read(self.path)
+        if not config.has_section('QUERY'):
+            config.add_section('QUERY')
+        section = config['QUERY']
+
+        try:
+            query_conf = {
+                'stream_results': section.getboolean('Stream_Results', fallback=False),
+                'fetch_chunk_size': section.getint('Fetch_Chunk_Size', fallback=500),
+                'insert_batch_rows': section.getint('Insert_Batch_Rows', fallback=500),
+                'prepared_statements': section.getboolean('Prepared_Statements', fallback=False),
+                'prepared_cache_size': section.getint('Prepared_Cache_Size', fallback=64),
+                'page_size': section.getint('Page_Size', fallback=20),
+                'commit_rows': section.getint('Commit_Rows', fallback=0)
+            }
+        except ValueError:
+            raise TypeError('Invalid config data types')
+
+        if min(query_conf['fetch_chunk_size'], query_conf['insert_batch_rows'], query_conf['prepared_cache_size'],
+               query_conf['page_size']) < 1 or query_conf['commit_rows'] < 0:
+            raise TypeError('Invalid config data types')
+
+        return query_conf
+
+    def load_import_config(self):
+        """
+        Loads data import settings from the [IMPORT] section of the specified file.
+        Missing keys fall back to defaults.
+
+        Returns:
+            dict: A dict containing import settings (batch_size, mode, allow_local_infile,
+                  parse_workers, writer_workers, foreign_key_checks).
+
+        Raises:
+            TypeError: If the configuration data types are invalid.
+
+        """
+
+        config = configparser.ConfigParser()
+        config.read(self.path)
+        section = config['IMPORT']
+
+        try:
+            import_conf = {
+                'batch_size': section.getint('Batch_Size', fallback=1000),
+                'mode': section.get('Mode', fallback='insert').lower(),
+                'allow_local_infile': section.getboolean('Allow_Local_Infile', fallback=False),
+                'parse_workers': section.getint('Parse_Workers', fallback=0),
+                'writer_workers': section.getint('Writer_Workers', fallback=4),
+                'foreign_key_checks': section.getboolean('Foreign_Key_Checks', fallback=True)
+            }
+        except ValueError:
+            raise TypeError('Invalid config data types')
+
+        if (import_conf['batch_size'] < 1 or import_conf['mode'] not in ('insert', 'bulk')
+                or import_conf['parse_workers'] < 0 or import_conf['writer_workers'] < 1):
+            raise TypeError('Invalid config data types')
+
+        return import_conf
+
+    def load_cache_config(self):
+        """
+        Loads cache settings from the [CACHE] section of the specified file.
+        Missing section or keys fall back to defaults.
+
+        Returns:
+            dict: A dict containing cache settings (report_ttl, report_max_entries, report_max_rows,
+                  materialize_reports, materialize_max_keys).
+
+        Raises:
+            TypeError: If the configuration data types are invalid.
+
+        """
+
+        config = configparser.ConfigParser()
+        config.read(self.path)
+        if not config.has_section('CACHE'):
+            config.add_section('CACHE')
+        section = config['CACHE']
+
+        try:
+            cache_conf = {
+                'report_ttl': section.getint('Report_TTL', fallback=60),
+                'report_max_entries': section.getint('Report_Max_Entries', fallback=16),
+                'report_max_rows': section.getint('Report_Max_Rows', fallback=100000),
+                'materialize_reports': section.getboolean('Materialize_Reports', fallback=False),
+                'materialize_max_keys': section.getint('Materialize_Max_Keys', fallback=10000)
+            }
+        except ValueError:
+            raise TypeError('Invalid config data types')
+
+        if min(cache_conf.values()) < 0:
+            raise TypeError('Invalid config data types')
+
+        return cache_conf
+
+    def load_metrics_config(self):
+        """
+        Loads metrics settings from the [METRICS] section of the specified file.
+        Missing section or keys fall back to defaults.
+
+        Returns:
+            dict: A dict containing metrics settings (enabled, log_interval).
+
+        Raises:
+            TypeError: If the configuration data types are invalid.
+
+        """
+
+        config = configparser.ConfigParser()
+        config.read(self.path)
+        if not config.has_section('METRICS'):
+            config.add_section('METRICS')
+        section = config['METRICS']
+
+        try:
+            metrics_conf = {
+                'enabled': section.getboolean('Enabled', fallback=True),
+                'log_interval': section.getint('Log_Interval', fallback=60)
+            }
+        except ValueError:
+            raise TypeError('Invalid config data types')
+
+        if metrics_conf['log_interval'] < 0:
+            raise TypeError('Invalid config data types')
+
+        return metrics_conf
+
+    def load_slow_query_config(self):
+        """
+        Loads slow query log settings from the [SLOW_QUERY] section of the specified file.
+        Missing section or keys fall back to defaults.
+
+        Returns:
+            dict: A dict containing slow query log settings (enabled, threshold_ms, explain, log_file).
+
+        Raises:
+            TypeError: If the configuration data types are invalid.
+
+        """
+
+        config = configparser.ConfigParser()
+        config.read(self.path)
+        if not config.has_section('SLOW_QUERY'):
+            config.add_section('SLOW_QUERY')
+        section = config['SLOW_QUERY']
+
+        try:
+            slow_query_conf = {
+                'enabled': section.getboolean('Enabled', fallback=False),
+                'threshold_ms': section.getint('Threshold_Ms', fallback=500),
+                'explain': section.get('Explain', fallback='off').lower(),
+                'log_file': section.get('Log_File', fallback='../log/slow_queries.txt').replace('\'', '')
+            }
+        except ValueError:
+            raise TypeError('Invalid config data types')
+
+        if slow_query_conf['threshold_ms'] < 0 or slow_query_conf['explain'] not in ('off', 'explain', 'analyze'):
+            raise TypeError('Invalid config data types')
+
+        return slow_query_conf
@@ -1,3 +1,6 @@
 from .application_layer.application import Application
 from .data_layer.data_manager import DataManager
+from .data_layer.async_data_manager import AsyncDataManager
 from .presentation_layer.controller import Controller
+from .data_layer.metrics import Metrics
+from .data_layer.slow_query_log import SlowQueryLog
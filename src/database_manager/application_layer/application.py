@@ -9,10 +9,17 @@ Classes:
 """
 
 
+import itertools
+import os
+import time
 import xml.etree.ElementTree as Et
 from enum import Enum
 from .command import *
 from .logics import *
+from .parallel_import import ParallelImport
+from .profiler import Profiler
+from .report_exporter import ReportExporter
+from .script_runner import ScriptRunner
 
 
 class Application:
@@ -23,35 +30,60 @@ class Application:
         XML_SUFFIX (str): The suffix for XML files.
         is_running (bool): Indicates whether the application is running.
         is_in_manager_mode (bool): Indicates whether the application is in manager mode.
+        is_in_script_mode (bool): Indicates whether commands are read from a script instead of the console.
         _data_manager: The DataManager object for managing database operations.
         _controller: The Controller object for handling user interactions.
         database_name (str): The name of the database being managed.
         xml_path (str): The path to the XML file for data import.
+        import_batch_size (int): The number of XML rows parsed, retyped and inserted at once.
+        import_mode (str): The default import mode, "insert" for batched inserts or "bulk" for LOAD DATA.
+        parse_workers (int): The number of parser processes of a multi-file import, 0 for the number of CPUs.
+        writer_workers (int): The number of writer threads of a multi-file import.
+        foreign_key_checks (bool): Indicates whether foreign keys are checked while importing,
+                                   if not, they are verified after the import.
         _logger: The logger object for logging application events.
         invoker: The Invoker object for executing commands.
+        profile_directory (str): The directory profile files are saved into.
+        profile_top (int): The number of printed functions and allocation sites of a profile.
+        profiler (Profiler): The profiler commands run under when armed, created with the invoker.
 
     """
 
     XML_SUFFIX = '.xml'
 
-    def __init__(self, xml_import, logger):
+    def __init__(self, xml_import, logger, import_conf=None, profile_conf=None):
         """
         Initializes an Application object with the provided parameters.
 
         Args:
             xml_import (str): The path to the XML file for data import.
             logger: The logger object for logging application events.
+            import_conf (dict, optional): Import settings (batch_size, mode, parse_workers, writer_workers,
+                                          foreign_key_checks).
+            profile_conf (dict, optional): Profiling settings (directory, top).
 
         """
 
+        import_conf = import_conf or {}
+        profile_conf = profile_conf or {}
+
         self.is_running = False
         self.is_in_manager_mode = False
+        self.is_in_script_mode = False
         self._data_manager = None
         self._controller = None
         self.database_name = None
         self.xml_path = xml_import
+        self.import_batch_size = import_conf.get('batch_size', 1000)
+        self.import_mode = import_conf.get('mode', 'insert')
+        self.parse_workers = import_conf.get('parse_workers', 0)
+        self.writer_workers = import_conf.get('writer_workers', 4)
+        self.foreign_key_checks = import_conf.get('foreign_key_checks', True)
         self._logger = logger
         self.invoker = Invoker()
+        self.profile_directory = profile_conf.get('directory', '../profile')
+        self.profile_top = profile_conf.get('top', 20)
+        self.profiler = None
 
     class CRUDOperation(Enum):
         """
@@ -66,10 +98,13 @@ class Application:
 
     def initialize_invoker(self):
         """
-        Initializes the invoker object with commands.
+        Initializes the invoker object with commands and the profiler commands run under.
 
         """
 
+        self.profiler = Profiler(self.profile_directory, self._controller, self._logger, self.profile_top)
+        self.invoker.profiler = self.profiler
+
         self.invoker.add_command('help', Help(self))
         self.invoker.add_command('exit', Exit(self))
         self.invoker.add_command('connect', Connect(self))
@@ -81,6 +116,11 @@ class Application:
         self.invoker.add_command('delete', Delete(self))
         self.invoker.add_command('import', DataImport(self))
         self.invoker.add_command('report', Report(self))
+        self.invoker.add_command('refresh', Refresh(self))
+        self.invoker.add_command('stats', Stats(self))
+        self.invoker.add_command('profile', Profile(self))
+        self.invoker.add_command('advise', Advise(self))
+        self.invoker.add_command('export', Export(self))
 
     def set_controller(self, controller):
         """
@@ -95,7 +135,7 @@ class Application:
 
     def set_data_manager(self, data_manager):
         """
-        Sets the data manager object for the application.
+        Sets the data manager object for the application, commands are recorded into its metrics.
 
         Args:
             data_manager: The data manager object.
@@ -103,6 +143,7 @@ class Application:
         """
 
         self._data_manager = data_manager
+        self.invoker.metrics = data_manager.metrics
 
     def get_data_manager(self):
         """
@@ -134,32 +175,112 @@ class Application:
                 self._controller.print_error(e)
                 self._logger.error(e)
 
-    def crud_operation(self, operation: CRUDOperation):
+    def run_script(self, path):
+        """
+        Runs commands from a script file (or standard input for "-") instead of the console.
+
+        Args:
+            path (str): The path to the script file, "-" for standard input.
+
+        """
+
+        self.database_name = self._data_manager.database_name
+        ScriptRunner(self, self._controller, self._logger).run(path)
+
+    def crud_operation(self, operation: CRUDOperation, args=None):
         """
-        Executes a CRUD operation.
+        Executes a CRUD operation. Table name and column values are read from inline
+        arguments if given, otherwise the user is asked for them.
 
         Args:
             operation (CRUDOperation): The CRUD operation.
+            args (list, optional): Table name followed by column=value pairs.
+
+        Raises:
+            Exception: If the table does not exist or inline arguments are missing in script mode.
 
         """
 
         operation = operation.value
 
-        table_name = self._controller.get_input(subdir=[self.database_name, 'SELECT TABLE'])
-        if table_name == 'exit':
-            return
+        if args:
+            table_name = args[0].replace('_', ' ')
+        elif self.is_in_script_mode:
+            raise Exception('In script mode, table name and values must be given as inline arguments')
+        else:
+            table_name = self._controller.get_input(subdir=[self.database_name, 'SELECT TABLE'])
+            if table_name == 'exit':
+                return
         if str(table_name).lower() not in self._data_manager.get_tables():
             raise Exception(f'Table "{table_name}" does not exist')
 
         class_name, params = self._data_manager.get_class_attributes(table_name, operation, False)
-        values = self.get_user_table_data(class_name, params)
+        if args:
+            values = self.get_inline_table_data(params, args[1:])
+        else:
+            values = self.get_user_table_data(class_name, params)
 
-        lines = self._data_manager.make_operation(operation, values, class_name)
+        stream = operation == self.CRUDOperation.SELECT.value and self._data_manager.stream_results
+        lines = self._data_manager.make_operation(operation, values, class_name, stream)
         if operation == self.CRUDOperation.SELECT.value:
-            self._controller.print_table(list(params.keys()), lines)
+            self._controller.print_table(list(params.keys()), lines, stream)
         else:
             self._controller.print_message('Operation was successfully executed')
 
+    def paged_select(self, page_size=None):
+        """
+        Executes a select browsed page by page with keyset pagination on ID.
+        The user navigates with "next", "previous" and leaves with "exit".
+
+        Args:
+            page_size (int, optional): The number of rows on one page, defaults to the configured page size.
+
+        """
+
+        if self.is_in_script_mode:
+            raise Exception('Paged select is not available in script mode')
+
+        page_size = page_size or self._data_manager.page_size
+        operation = self.CRUDOperation.SELECT.value
+
+        table_name = self._controller.get_input(subdir=[self.database_name, 'SELECT TABLE'])
+        if table_name == 'exit':
+            return
+        if str(table_name).lower() not in self._data_manager.get_tables():
+            raise Exception(f'Table "{table_name}" does not exist')
+
+        class_name, params = self._data_manager.get_class_attributes(table_name, operation, False)
+        values = self.get_user_table_data(class_name, params)
+        headers = list(params.keys())
+
+        page = 1
+        lines = self._data_manager.get_page(class_name, values, None, page_size)
+        self._controller.print_table(headers, lines)
+
+        while True:
+            choice = self._controller.get_input(subdir=[self.database_name, class_name, f'PAGE {page}']).lower()
+            if choice == 'exit':
+                return
+            if choice in ('next', 'n'):
+                next_lines = []
+                if len(lines) == page_size:
+                    next_lines = self._data_manager.get_page(class_name, values, lines[-1][0], page_size)
+                if not next_lines:
+                    self._controller.print_message('Already on last page')
+                    continue
+                lines = next_lines
+                page += 1
+            elif choice in ('previous', 'p'):
+                if page == 1:
+                    self._controller.print_message('Already on first page')
+                    continue
+                lines = self._data_manager.get_page(class_name, values, lines[0][0], page_size, True)
+                page -= 1
+            else:
+                self._controller.print_error('Invalid choice, use "next", "previous" or "exit"')
+                continue
+            self._controller.print_table(headers, lines)
+
     def get_user_table_data(self, class_name, params):
         """
         Gets user input for table data.
@@ -178,67 +299,460 @@ class Application:
         for param in params:
             data_type = str(params[param]).split("'")[1].upper()
             user_data = self._controller.get_input(subdir=[self.database_name, class_name, f'{param}<{data_type}>'])
-            try:
-                if type(params[param]) is type(Enum):
-                    user_data = user_data.upper()
-                converted_input = validate_input(params[param], user_data)
-                user_params.append(converted_input)
-            except:
-                raise Exception(f'Invalid data type, expected "{data_type}"')
+            user_params.append(self.convert_user_data(params[param], user_data))
 
         return user_params
 
-    def xml_import(self, path):
+    def get_inline_table_data(self, params, args):
         """
-        Imports data from an XML file.
+        Gets table data from inline column=value arguments, missing columns are null.
 
         Args:
-            path (str): The path to the XML file.
+            params (dict): The parameters of the class.
+            args (list): A list of column=value pairs, "id" can be used for the identifier.
 
         Returns:
-            str: A message indicating the result of the import operation.
+            list: A list of table data in parameter order.
+
+        Raises:
+            Exception: If an argument is not a column=value pair or the column does not exist.
+
+        """
+
+        inline_data = {}
+        for arg in args:
+            if '=' not in arg:
+                raise Exception(f'Invalid argument "{arg}", expected column=value')
+            column, value = arg.split('=', 1)
+            column = column.strip().lower()
+            if column == 'id':
+                column = 'identifier'
+            if column not in params:
+                raise Exception(f'Column "{column}" does not exist')
+            inline_data[column] = value.strip()
+
+        return [self.convert_user_data(params[param], inline_data.get(param, '')) for param in params]
+
+    def convert_user_data(self, typeof, user_data):
+        """
+        Converts user provided text into the data type of a column.
+
+        Args:
+            typeof (type): The data type of the column.
+            user_data (str): The user-provided data, empty string for null.
+
+        Returns:
+            Any: The converted data.
+
+        Raises:
+            Exception: If the data cannot be converted.
 
         """
 
+        data_type = str(typeof).split("'")[1].upper()
         try:
-            xml_string = load_file(path, self.XML_SUFFIX)
-        except Exception as e:
-            raise Exception(str(e))
+            if type(typeof) is type(Enum):
+                user_data = user_data.upper()
+            return validate_input(typeof, user_data)
+        except:
+            raise Exception(f'Invalid data type, expected "{data_type}"')
+
+    def xml_import(self, path, mode=None, ordered=False):
+        """
+        Imports data from an XML file. The file is parsed incrementally and every batch
+        is retyped and inserted before the next one is read, rows of several tables are
+        inserted in file order. A directory, a glob pattern or an ordered import loads
+        the files in parallel, ordered by foreign keys.
+
+        Args:
+            path (str): The path to the XML file, a directory or a glob pattern.
+            mode (str, optional): The import mode ("insert" or "bulk"), defaults to import_mode.
+            ordered (bool): Indicates whether tables are loaded in foreign key order instead of file order.
+
+        Returns:
+            str: A message indicating the result of the import operation.
+
+        """
+
+        mode = mode or self.import_mode
+
+        if ordered or ParallelImport.is_multi_path(path):
+            parallel_import = ParallelImport(self._data_manager, self._controller, self._logger, self.XML_SUFFIX,
+                                             self.import_batch_size, self.parse_workers, self.writer_workers,
+                                             self.foreign_key_checks)
+            return parallel_import.run(parallel_import.resolve_paths(path), mode)
+
+        start = time.perf_counter()
+        imported = 0
+        read = 0
+        tables = []
+        failures = []
+
+        def data_batches(group):
+            nonlocal read
+            for _, _, data in group:
+                read += len(data)
+                yield data
 
         try:
-            root = Et.fromstring(xml_string)
-            element_name, element_data = load_xml(root)
+            for (element_name, class_name), group in itertools.groupby(self.load_import_batches(path),
+                                                                       key=lambda batch: batch[:2]):
+                if element_name not in tables:
+                    tables.append(element_name)
+
+                if mode == 'bulk':
+                    first_row = read
+                    successful = self._data_manager.bulk_import(class_name, data_batches(group), self.foreign_key_checks)
+                    if not successful:
+                        return 'Data import was unsuccessful'
+                    imported += read - first_row
+                else:
+                    rows, table_failures = self._data_manager.import_batches(class_name, data_batches(group),
+                                                                             self.foreign_key_checks, read + 1)
+                    imported += rows
+                    failures.extend((element_name, *failure) for failure in table_failures)
+
+            if not tables:
+                raise Exception(f'File "{path}" does not contain any data')
         except Et.ParseError:
             raise Exception(f'File not in "{self.XML_SUFFIX[1:]}" format')
         except Exception as e:
             raise Exception(str(e))
 
-        if root is None:
-            raise Exception(f'File "{path}" does not contain any data')
+        if failures:
+            self._controller.print_table(['TABLE', 'ROWS', 'ERROR'],
+                                         [[table, f'{first}-{last}', error] for table, first, last, error in failures])
+            for table, first, last, error in failures:
+                self._logger.error('Import of rows %s-%s into "%s" rolled back: %s', first, last, table, error)
+            if not imported:
+                return f'Data import was unsuccessful, {len(failures)} failed batches rolled back'
+
+        elapsed = time.perf_counter() - start
+        rate = imported / elapsed if elapsed > 0 else imported
+        names = ', '.join(f'"{table}"' for table in tables)
+        result = 'partially' if failures else 'successfully'
+        message = (f'Data {result} imported into table{"s" if len(tables) > 1 else ""} {names} '
+                   f'({imported} rows, {rate:.0f} rows/s)')
+
+        if failures:
+            message += f', {len(failures)} failed batches rolled back'
+
+        if not self.foreign_key_checks:
+            violations = [f'{table}.{column} ({count} rows without {reference})' for table in tables
+                          for column, reference, count in self._data_manager.verify_foreign_keys(table.lower())]
+            if violations:
+                for violation in violations:
+                    self._logger.warning('Foreign key %s violated after import of "%s"', violation, path)
+                message += f', warning: foreign keys are violated: {", ".join(violations)}'
+            else:
+                message += ', foreign keys verified'
+        return message
+
+    def load_import_batches(self, path):
+        """
+        Parses an XML file incrementally and retypes its data in batches, the file may
+        contain rows of several tables. Parsing and retyping of every batch are recorded in metrics.
+
+        Args:
+            path (str): The path to the XML file.
+
+        Yields:
+            tuple: A tuple containing the element name, class name and a batch of retyped rows in column order.
+
+        Raises:
+            Exception: If the table to be imported in does not exist.
 
-        if element_name.lower() not in self._data_manager.get_tables():
-            raise Exception('Invalid data, table to be imported in does not exist')
+        """
+
+        entities = {}
+        metrics = self._data_manager.metrics
+        batches = iterate_xml(path, self.XML_SUFFIX, self.import_batch_size, True)
+
+        while True:
+            with metrics.measure('import.parse') as timer:
+                batch = next(batches, None)
+                if batch is None:
+                    timer.bytes = os.path.getsize(path.replace('\'', ''))
+                else:
+                    timer.rows = len(batch[1])
+            if batch is None:
+                break
+
+            element_name, element_data = batch
+            table = element_name.lower().replace('_', ' ')
+            if table not in entities:
+                if table not in self._data_manager.get_tables():
+                    raise Exception('Invalid data, table to be imported in does not exist')
+                entities[table] = self._data_manager.get_class_attributes(table, self.CRUDOperation.INSERT, False)
+
+            class_name, params = entities[table]
+            with metrics.measure('import.retype', len(element_data)):
+                rows = retype_data(element_data, params)
+            yield element_name, class_name, rows
+
+    def stats(self, action=None):
+        """
+        Prints the metrics recorded for commands, queries, reports and import stages, or the slow
+        statements aggregated by fingerprint, or resets both or writes them to the log.
+
+        Args:
+            action (str, optional): "slow" prints the slow statements, "reset" drops the metrics and slow
+                                    statements, "log" writes them to the log.
+
+        Returns:
+            str: Message indicating the result of the action, None if the metrics were printed.
+
+        Raises:
+            Exception: If the action is unknown.
+
+        """
+
+        metrics = self._data_manager.metrics
+        slow_queries = self._data_manager.slow_queries
+
+        if action == 'slow':
+            return self.slow_query_stats()
+        if action == 'reset':
+            metrics.reset()
+            slow_queries.reset()
+            return 'Metrics were reset'
+        if action == 'log':
+            metrics.flush()
+            slow_queries.flush()
+            return 'Metrics were written to the log'
+        if action is not None:
+            raise Exception('Invalid stats action, use "stats", "stats slow", "stats reset" or "stats log"')
+
+        snapshot = metrics.snapshot()
+        if not snapshot:
+            return 'No metrics recorded yet'
+
+        headers = ['OPERATION', 'COUNT', 'ERRORS', 'AVG MS', 'P50 MS', 'P95 MS', 'P99 MS', 'MAX MS', 'ROWS', 'BYTES']
+        rows = [[name, value['count'], value['errors'], f'{value["avg_ms"]:.3f}', f'{value["p50_ms"]:.3f}',
+                 f'{value["p95_ms"]:.3f}', f'{value["p99_ms"]:.3f}', f'{value["max_ms"]:.3f}', value['rows'],
+                 value['bytes']] for name, value in snapshot.items()]
+        self._controller.print_table(headers, rows)
+
+    def profile(self, action=None, *args):
+        """
+        Arms or disarms the profiler, or runs a script under it.
+
+        Args:
+            action (str, optional): A mode ("cpu", "memory", "all") profiling the next command, "on [mode]"
+                                    profiling every following command, "off", "status", or "script <path> [mode]"
+                                    profiling a whole script. Without action, the next command is profiled by cProfile.
+            *args: The mode of "on", or the path and mode of "script".
+
+        Returns:
+            str: Message indicating the state of the profiler, None if a script was profiled.
+
+        Raises:
+            Exception: If the action or mode is invalid.
+
+        """
+
+        if action is None or action in Profiler.MODES:
+            self.profiler.arm(action or 'cpu')
+        elif action == 'on':
+            self.profiler.arm(args[0] if args else 'cpu', True)
+        elif action == 'off':
+            self.profiler.disarm()
+        elif action == 'script':
+            if not args:
+                raise Exception('Script path must be given, "profile script <path> [mode]"')
+            mode = args[1] if len(args) > 1 else 'cpu'
+            if mode not in Profiler.MODES:
+                raise Exception(f'Invalid profiling mode, use {", ".join(Profiler.MODES)}')
+            self.profiler.run('script', mode, self.run_script, args[0])
+            return None
+        elif action != 'status':
+            raise Exception('Invalid profile action, use "profile [cpu|memory|all]", "profile on [mode]", '
+                            '"profile off", "profile status" or "profile script <path> [mode]"')
+
+        return self.profiler.get_status()
+
+    def slow_query_stats(self):
+        """
+        Prints the slow statements aggregated by fingerprint, longest total run time first,
+        fingerprints longer than 100 characters are shortened.
+
+        Returns:
+            str: Message indicating the slow query log state, None if the statements were printed.
+
+        """
+
+        slow_queries = self._data_manager.slow_queries
+        if not slow_queries.enabled:
+            return 'Slow query log is disabled, enable it in section [SLOW_QUERY] of the config'
+
+        summary = slow_queries.get_summary()
+        if not summary:
+            return f'No statements slower than {slow_queries.threshold_ms} ms recorded yet'
+
+        headers = ['FINGERPRINT', 'COUNT', 'TOTAL MS', 'AVG MS', 'MAX MS', 'ROWS']
+        rows = [[entry['fingerprint'] if len(entry['fingerprint']) <= 100 else entry['fingerprint'][:97] + '...',
+                 entry['count'], f'{entry["total_ms"]:.3f}', f'{entry["avg_ms"]:.3f}',
+                 f'{entry["max_ms"]:.3f}', entry['rows']] for entry in summary]
+        self._controller.print_table(headers, rows)
+
+    def advise(self, action=None, choice=None):
+        """
+        Prints index proposals for the predicates of selects and deletes run so far, creates
+        proposed indexes or drops the recorded predicates.
+
+        Args:
+            action (str, optional): "create" creates proposed indexes, "reset" drops the recorded predicates.
+            choice (str, optional): The rank of the proposal created by "create", all proposals if not given.
+
+        Returns:
+            str: Message indicating the result of the action, None if the proposals were printed.
+
+        Raises:
+            Exception: If the action or the chosen proposal is invalid.
 
-        class_name, params = self._data_manager.get_class_attributes(element_name, self.CRUDOperation.INSERT, False)
-        retyped_data = retype_data(element_data, params)
+        """
+
+        if action == 'reset':
+            self._data_manager.index_advisor.reset()
+            return 'Recorded predicates were dropped'
+        if action not in (None, 'create'):
+            raise Exception('Invalid advise action, use "advise", "advise create [number]" or "advise reset"')
+
+        if not self._data_manager.index_advisor.get_predicates():
+            return 'No filtered selects or deletes recorded yet'
+
+        proposals = self._data_manager.advise_indexes()
+        if not proposals:
+            return 'Recorded predicates are served by existing indexes'
+
+        if action is None:
+            headers = ['#', 'TABLE', 'COLUMNS', 'USES', 'TABLE ROWS', 'ROWS READ NOW', 'ROWS READ', 'SCORE', 'INDEX']
+            rows = [[number, proposal['table'], ', '.join(proposal['columns']), proposal['uses'],
+                     proposal['table_rows'], f'{proposal["rows_now"]:.1f}', f'{proposal["rows"]:.1f}',
+                     f'{proposal["score"]:.0f}', proposal['name']]
+                    for number, proposal in enumerate(proposals, 1)]
+            self._controller.print_table(headers, rows)
+            return None
+
+        if choice is not None:
+            try:
+                choice = int(choice)
+            except ValueError:
+                raise Exception('Invalid choice selected')
+            if choice <= 0 or choice > len(proposals):
+                raise Exception(f'Choice must be between 1 and {len(proposals)}')
+            proposals = [proposals[choice - 1]]
+
+        for proposal in proposals:
+            self._data_manager.create_index(proposal)
+            self._logger.info('Index created: %s', proposal['statement'])
+
+        names = ', '.join(f'"{proposal["name"]}"' for proposal in proposals)
+        return f'Index{"es" if len(proposals) > 1 else ""} {names} created'
+
+    def report(self, choice=None, action=None):
+        """
+        Generates a report from the database, or prints the refresh state of materialized reports.
+
+        Args:
+            choice (str, optional): The number or name of the report, "status" prints the materialized reports,
+                                    the user is asked if not given.
+            action (str, optional): "rebuild" rebuilds the summary table of a materialized report before reading it.
 
-        if self._data_manager.import_data(class_name, retyped_data, list(params.keys())):
-            return f'Data successfully imported into table "{element_name}"'
+        Returns:
+            str: Message indicating the state of materialized reports, None if a table was printed.
+
+        Raises:
+            Exception: If the choice or action is invalid.
+
+        """
+
+        materialized = self._data_manager.materialized
+        if choice == 'status':
+            if not materialized.enabled:
+                return 'Materialized reports are off'
+            self._controller.print_table(['VIEW', 'TABLE', 'STALE', 'TRACKED KEYS'],
+                                         [list(state) for state in materialized.get_status()])
+            return None
+        if action not in (None, 'rebuild'):
+            raise Exception('Invalid report action, use "report <number|name> [rebuild]" or "report status"')
+
+        if choice is None:
+            if self.is_in_script_mode:
+                raise Exception('In script mode, report must be given as inline argument')
+            self._controller.print_choice(self._data_manager.get_views())
+            choice = self._controller.get_input(subdir=[self.database_name, 'REPORTS'])
+            if choice == 'exit':
+                return
+
+        selected_view = self.get_view_name(choice)
+        if action == 'rebuild':
+            if not materialized.is_materialized(selected_view):
+                raise Exception('Report is not materialized')
+            self._data_manager.refresh_materialized(selected_view, True)
+            self._data_manager.report_cache.clear()
+
+        if self._data_manager.stream_results:
+            headers, report_text = self._data_manager.stream_report(selected_view)
         else:
-            return 'Data import was unsuccessful'
+            headers, report_text = self._data_manager.get_report(selected_view)
 
-    def report(self):
+        self._controller.print_table(headers, report_text, self._data_manager.stream_results)
+
+    def export(self, choice=None, path=None):
         """
-        Generates a report from the database.
+        Exports a report into a CSV or JSON Lines file, gzip compressed if the path ends with ".gz".
+        The report is streamed in chunks from the server (or the report cache) straight into the file.
+
+        Args:
+            choice (str): The number or name of the report.
+            path (str): The path to the export file, e.g. "../export/auction_winners.csv.gz".
+
+        Returns:
+            str: Message indicating the number of exported rows and the size of the file.
+
+        Raises:
+            Exception: If the report or the file path is missing or invalid.
+
+        """
+
+        if choice is None or path is None:
+            raise Exception('Report and file must be given, e.g. "export 1 ../export/auction_winners.csv"')
+
+        exporter = ReportExporter()
+        exporter.get_format(path)
+        selected_view = self.get_view_name(choice)
+
+        start = time.perf_counter()
+        with self._data_manager.metrics.measure('report.export') as timer:
+            headers, chunks = self._data_manager.stream_report(selected_view)
+            timer.rows, timer.bytes = exporter.export(path, headers, chunks)
+        elapsed = time.perf_counter() - start
+
+        message = (f'Report "{selected_view}" exported to {path} '
+                   f'({timer.rows} rows, {timer.bytes / 1024:.1f} KB, {elapsed:.2f} s)')
+        self._logger.info(message)
+        return message
+
+    def get_view_name(self, choice: str):
+        """
+        Resolves the number or name of a report into the name of its view.
+
+        Args:
+            choice (str): The number or name of the report, e.g. "1", "auction winners" or "auction_winners".
+
+        Returns:
+            str: The name of the view, e.g. "auction_winners".
+
+        Raises:
+            Exception: If the choice is not a number or name of a report.
 
         """
 
         views = self._data_manager.get_views()
-        self._controller.print_choice(views)
 
-        choice = self._controller.get_input(subdir=[self.database_name, 'REPORTS'])
-        if choice == 'exit':
-            return
+        if choice.replace('_', ' ').lower() in [str(view).lower() for view in views]:
+            choice = [str(view).lower() for view in views].index(choice.replace('_', ' ').lower()) + 1
 
         try:
             choice = int(choice)
@@ -248,7 +762,4 @@ class Application:
         if choice <= 0 or choice > len(views):
             raise Exception(f'Choice must be between 1 and {len(views)}')
 
-        selected_view = str(views[choice - 1]).replace(' ', '_')
-        headers, report_text = self._data_manager.get_report(selected_view)
-
-        self._controller.print_table(headers, report_text)
+        return str(views[choice - 1]).replace(' ', '_')
@@ -10,3 +10,8 @@ from .select import Select
 from .delete import Delete
 from .data_import import DataImport
 from .report import Report
+from .refresh import Refresh
+from .stats import Stats
+from .profile import Profile
+from .advise import Advise
+from .export import Export
@@ -0,0 +1,56 @@
+"""
+Advise Command Module
+
+This module defines the Advise command class.
+
+Classes:
+    Advise: A command class for proposing and creating indexes.
+
+"""
+
+
+from .command import CommandInterface
+
+
+class Advise(CommandInterface):
+    """
+    Advise Command Class
+
+    A command class for proposing composite indexes for the predicates of selects and deletes
+    run so far, ranked by frequency and estimated selectivity, and optionally creating them.
+
+    Methods:
+        execute: Executes the advise command.
+
+    """
+
+    def __init__(self, application):
+        """
+        Initializes the Advise command with the application instance.
+
+        Args:
+            application: The application instance.
+
+        """
+
+        super().__init__(application)
+
+    def execute(self, *args):
+        """
+        Executes the advise command.
+
+        Args:
+            *args: Optional action, "create" followed by an optional proposal number, or "reset".
+
+        Returns:
+            str: Message indicating the result of the action, None if the proposals were printed.
+
+        Raises:
+            Exception: If the action is attempted outside manager mode.
+
+        """
+
+        if not self.application.is_in_manager_mode:
+            raise Exception('To perform this action, you must be in manager mode')
+        else:
+            return self.application.advise(*args[:2])
@@ -33,9 +33,12 @@ class CommandInterface(ABC):
         self.application = application
 
     @abstractmethod
-    def execute(self):
+    def execute(self, *args):
         """
         Abstract method to be implemented by concrete command classes.
 
+        Args:
+            *args: The inline arguments of the command.
+
         """
         raise NotImplementedError
@@ -34,10 +34,13 @@ class Connect(CommandInterface):
 
         super().__init__(application)
 
-    def execute(self):
+    def execute(self, *args):
         """
         Executes the connect command.
 
+        Args:
+            *args: The inline arguments of the command.
+
         Returns:
             str: A message indicating successful connection.
 
@@ -16,13 +16,22 @@ class DataImport(CommandInterface):
     """
     Data Import Command Class
 
-    A command class for importing data.
+    A command class for importing data. Optional inline arguments select the import mode
+    ("insert" or "bulk"), foreign key ordering ("ordered") and the path of the imported file,
+    e.g. "import bulk ordered ../data/import.xml".
+
+    Attributes:
+        MODES (tuple): The available import modes.
+        ORDERED (str): The argument loading tables in foreign key order instead of file order.
 
     Methods:
         execute: Executes the data import command.
 
     """
 
+    MODES = ('insert', 'bulk')
+    ORDERED = 'ordered'
+
     def __init__(self, application):
         """
         Initializes the DataImport command with the application instance.
@@ -34,10 +43,13 @@ class DataImport(CommandInterface):
 
         super().__init__(application)
 
-    def execute(self):
+    def execute(self, *args):
         """
         Executes the data import command.
 
+        Args:
+            *args: The import mode, "ordered" and/or the path of the imported file, directory or glob pattern.
+
         Returns:
             str: A message indicating success or failure of the data import.
 
@@ -48,5 +60,16 @@ class DataImport(CommandInterface):
 
         if not self.application.is_in_manager_mode:
             raise Exception('To perform this action, you must be in manager mode')
-        else:
-            return self.application.xml_import(self.application.xml_path)
+
+        mode = None
+        ordered = False
+        path = self.application.xml_path
+        for arg in args:
+            if arg.lower() in self.MODES:
+                mode = arg.lower()
+            elif arg.lower() == self.ORDERED:
+                ordered = True
+            else:
+                path = arg
+
+        return self.application.xml_import(path, mode, ordered)
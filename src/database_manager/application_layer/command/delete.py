@@ -34,10 +34,13 @@ class Delete(CommandInterface):
 
         super().__init__(application)
 
-    def execute(self):
+    def execute(self, *args):
         """
         Executes the delete command.
 
+        Args:
+            *args: Optional table name followed by column=value pairs, e.g. "bidder surname=Doe".
+
         Raises:
             Exception: If the action cannot be performed when not in manager mode.
 
@@ -46,4 +49,4 @@ class Delete(CommandInterface):
         if not self.application.is_in_manager_mode:
             raise Exception('To perform this action, you must be in manager mode')
         else:
-            self.application.crud_operation(self.application.CRUDOperation.DELETE)
+            self.application.crud_operation(self.application.CRUDOperation.DELETE, args)
@@ -34,10 +34,13 @@ class Exit(CommandInterface):
 
         super().__init__(application)
 
-    def execute(self):
+    def execute(self, *args):
         """
         Executes the exit command.
 
+        Args:
+            *args: The inline arguments of the command.
+
         Returns:
             str: A message indicating termination of the program.
 
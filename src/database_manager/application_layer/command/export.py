@@ -0,0 +1,56 @@
+"""
+Export Command Module
+
+This module defines the Export command class.
+
+Classes:
+    Export: A command class for exporting reports into files.
+
+"""
+
+
+from .command import CommandInterface
+
+
+class Export(CommandInterface):
+    """
+    Export Command Class
+
+    A command class for exporting reports into CSV or JSON Lines files, optionally gzip compressed.
+
+    Methods:
+        execute: Executes the export command.
+
+    """
+
+    def __init__(self, application):
+        """
+        Initializes the Export command with the application instance.
+
+        Args:
+            application: The application instance.
+
+        """
+
+        super().__init__(application)
+
+    def execute(self, *args):
+        """
+        Executes the export command.
+
+        Args:
+            *args: The number or name of the report followed by the file path,
+                   e.g. "export 1 ../export/auction_winners.csv.gz".
+
+        Returns:
+            str: Message indicating the result of the export.
+
+        Raises:
+            Exception: If the action is attempted outside manager mode.
+
+        """
+
+        if not self.application.is_in_manager_mode:
+            raise Exception('To perform this action, you must be in manager mode')
+        else:
+            return self.application.export(' '.join(args[:-1]) or None, args[-1] if args else None)
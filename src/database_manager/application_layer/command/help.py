@@ -34,10 +34,13 @@ class Help(CommandInterface):
 
         super().__init__(application)
 
-    def execute(self):
+    def execute(self, *args):
         """
         Executes the help command.
 
+        Args:
+            *args: The inline arguments of the command.
+
         Returns:
             str: A formatted menu of available commands.
 
@@ -49,13 +52,21 @@ class Help(CommandInterface):
                 '\n\t\texit \t- terminates the program'
                 '\n\t\tconnect - try connection to database'
                 '\n\t\tmanager - switch to database manager mode'
+                '\n\t\tstats \t- shows latencies of commands, queries and imports, "stats slow|reset|log"'
+                '\n\t\tprofile - profiles next command, "profile [cpu|memory|all]|on [mode]|off|status|script <path> [mode]"'
                 '\n\tManager commands:'
                 '\n\t\tinsert \t- inserts new row into database'
                 '\n\t\tupdate \t- updates specified row'
                 '\n\t\tdelete \t- deletes specified row'
-                '\n\t\tselect \t- returns specified row/all rows'
+                '\n\t\tselect \t- returns specified row/all rows, "select page [size]" browses pages'
                 '\n\t\ttables \t- returns all available tables'
-                '\n\t\timport \t- imports data into table'
-                '\n\t\treport \t- generates report')
+                '\n\t\timport \t- imports data into table, optionally "import [insert|bulk] [ordered] [path|directory|glob]"'
+                '\n\t\treport \t- generates report, "report <number|name> rebuild" rebuilds a materialized report, "report status"'
+                '\n\t\texport \t- exports report into file, "export <number|name> <path.csv|path.jsonl>[.gz]"'
+                '\n\t\trefresh - reloads database schema (tables, columns, views)'
+                '\n\t\tadvise \t- proposes indexes for filtered selects and deletes, "advise create [number]|reset"'
+                '\n\tInline arguments:'
+                '\n\t\tinsert|update|delete|select <table> [column=value ...], report <number|name>'
+                '\n\t\te.g. select bidder surname=Doe, update owner id=2 last_name="Anna Marie"')
 
         return menu
@@ -9,11 +9,20 @@ Classes:
 """
 
 
+import shlex
+
+
 class Invoker:
     """
     Invoker Class
 
-    A class to execute commands.
+    A class to execute commands. When metrics are set, the run time of every command is recorded
+    as operation "command.<name>". When a profiler is set and armed, commands run under it.
+
+    Attributes:
+        _commands (dict): The commands keyed by name.
+        metrics (Metrics): The metrics commands are recorded into, None if not recorded.
+        profiler (Profiler): The profiler commands run under when armed, None if not profiled.
 
     Methods:
         add_command: Adds a command to the invoker.
@@ -28,6 +37,8 @@ class Invoker:
         """
 
         self._commands = {}
+        self.metrics = None
+        self.profiler = None
 
     def add_command(self, name, command):
         """
@@ -43,22 +54,51 @@ class Invoker:
 
     def execute_command(self, name):
         """
-        Executes a command.
+        Executes a command. Words following the command name are passed to the command as inline arguments,
+        quotes can be used for arguments containing spaces, backslashes are kept as they are.
 
         Args:
-            name (str): The name of the command to execute.
+            name (str): The name of the command to execute, optionally followed by its arguments.
 
         Returns:
             str: The result of executing the command.
 
         Raises:
-            Exception: If the command is not found.
+            Exception: If the command is not found or its arguments cannot be parsed.
 
         """
 
-        if name == '':
+        if name.strip() == '':
             return None
+        lexer = shlex.shlex(name, posix=True)
+        lexer.whitespace_split = True
+        lexer.escape = ''
+        try:
+            name, *args = list(lexer)
+        except ValueError:
+            raise Exception('Invalid command arguments, check quotes')
         if name in self._commands.keys():
-            return self._commands[name].execute()
+            mode = self.profiler.take(name) if self.profiler is not None else None
+            if mode is not None:
+                return self.profiler.run(name, mode, self._run_command, name, args)
+            return self._run_command(name, args)
         else:
             raise Exception('Invalid command, type "help" for more info')
+
+    def _run_command(self, name, args):
+        """
+        Runs a command, recording its run time when metrics are set.
+
+        Args:
+            name (str): The name of the command.
+            args (list): The inline arguments of the command.
+
+        Returns:
+            str: The result of executing the command.
+
+        """
+
+        if self.metrics is None:
+            return self._commands[name].execute(*args)
+        with self.metrics.measure(f'command.{name}'):
+            return self._commands[name].execute(*args)
@@ -33,10 +33,13 @@ class Manager(CommandInterface):
 
         super().__init__(application)
 
-    def execute(self):
+    def execute(self, *args):
         """
         Executes the manager command.
 
+        Args:
+            *args: The inline arguments of the command.
+
         Returns:
             str: Message indicating the status of manager mode activation.
 
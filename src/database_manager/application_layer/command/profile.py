@@ -0,0 +1,52 @@
+"""
+Profile Command Module
+
+This module defines the Profile command class.
+
+Classes:
+    Profile: A command class for profiling commands and scripts.
+
+"""
+
+
+from .command import CommandInterface
+
+
+class Profile(CommandInterface):
+    """
+    Profile Command Class
+
+    A command class for running the next command, every following command or a whole script
+    under cProfile and/or tracemalloc, saving the profile files and printing the top functions
+    and allocation sites.
+
+    Methods:
+        execute: Executes the profile command.
+
+    """
+
+    def __init__(self, application):
+        """
+        Initializes the Profile command with the application instance.
+
+        Args:
+            application: The application instance.
+
+        """
+
+        super().__init__(application)
+
+    def execute(self, *args):
+        """
+        Executes the profile command.
+
+        Args:
+            *args: Optional action ("cpu", "memory", "all", "on", "off", "status" or "script")
+                   followed by its arguments.
+
+        Returns:
+            str: Message indicating the state of the profiler, None if a script was profiled.
+
+        """
+
+        return self.application.profile(*args)
@@ -0,0 +1,56 @@
+"""
+Refresh Command Module
+
+This module defines the Refresh command class.
+
+Classes:
+    Refresh: A command class for reloading the schema catalog.
+
+"""
+
+
+from .command import CommandInterface
+
+
+class Refresh(CommandInterface):
+    """
+    Refresh Command Class
+
+    A command class for reloading the schema catalog (tables, columns, keys and views) from the database.
+
+    Methods:
+        execute: Executes the refresh command.
+
+    """
+
+    def __init__(self, application):
+        """
+        Initializes the Refresh command with the application instance.
+
+        Args:
+            application: The application instance.
+
+        """
+
+        super().__init__(application)
+
+    def execute(self, *args):
+        """
+        Executes the refresh command.
+
+        Args:
+            *args: The inline arguments of the command.
+
+        Returns:
+            str: Message indicating the schema catalog was reloaded.
+
+        Raises:
+            Exception: If the action is attempted outside manager mode.
+
+        """
+
+        if not self.application.is_in_manager_mode:
+            raise Exception('To perform this action, you must be in manager mode')
+        else:
+            self.application.get_data_manager().refresh_catalog()
+            return 'Database schema was reloaded'
@@ -34,10 +34,14 @@ class Report(CommandInterface):
 
         super().__init__(application)
 
-    def execute(self):
+    def execute(self, *args):
         """
         Executes the report command.
 
+        Args:
+            *args: Optional number or name of the report, e.g. "report 1" or "report auction_winners",
+                   followed by "rebuild" to rebuild a materialized report, or "status".
+
         Returns:
             str: Message indicating the result of generating the report.
 
@@ -48,5 +52,7 @@ class Report(CommandInterface):
 
         if not self.application.is_in_manager_mode:
             raise Exception('To perform this action, you must be in manager mode')
+        elif args and args[-1].lower() == 'rebuild':
+            return self.application.report(' '.join(args[:-1]) or None, 'rebuild')
         else:
-            return self.application.report()
+            return self.application.report(' '.join(args) if args else None)
@@ -16,7 +16,9 @@ class Select(CommandInterface):
     """
     Select Command Class
 
-    A command class for selecting rows from the database.
+    A command class for selecting rows from the database. With inline argument "page",
+    optionally followed by page size, rows are browsed page by page, e.g. "select page 50".
+    Otherwise inline arguments are table name and column=value filters, e.g. "select bidder surname=Doe".
 
     Methods:
         execute: Executes the select command.
@@ -34,16 +36,35 @@ class Select(CommandInterface):
 
         super().__init__(application)
 
-    def execute(self):
+    def execute(self, *args):
         """
         Executes the select command.
 
+        Args:
+            *args: Optional "page" keyword followed by page size, or table name followed by column=value pairs.
+
         Raises:
-            Exception: If the action is attempted outside manager mode.
+            Exception: If the action is attempted outside manager mode or the arguments are invalid.
 
         """
 
         if not self.application.is_in_manager_mode:
             raise Exception('To perform this action, you must be in manager mode')
-        else:
-            self.application.crud_operation(self.application.CRUDOperation.SELECT)
+
+        if not args or args[0].lower() != 'page':
+            self.application.crud_operation(self.application.CRUDOperation.SELECT, args)
+            return
+
+        if len(args) > 2:
+            raise Exception('Invalid arguments, use "select" or "select page [size]"')
+
+        page_size = None
+        if len(args) == 2:
+            try:
+                page_size = int(args[1])
+            except ValueError:
+                page_size = 0
+            if page_size < 1:
+                raise Exception('Page size must be number 1 or higher')
+
+        self.application.paged_select(page_size)
@@ -0,0 +1,50 @@
+"""
+Stats Command Module
+
+This module defines the Stats command class.
+
+Classes:
+    Stats: A command class for showing recorded metrics.
+
+"""
+
+
+from .command import CommandInterface
+
+
+class Stats(CommandInterface):
+    """
+    Stats Command Class
+
+    A command class for showing latencies, row counts and bytes recorded for commands, queries,
+    reports and import stages, or slow statements by fingerprint, resetting them or writing them to the log.
+
+    Methods:
+        execute: Executes the stats command.
+
+    """
+
+    def __init__(self, application):
+        """
+        Initializes the Stats command with the application instance.
+
+        Args:
+            application: The application instance.
+
+        """
+
+        super().__init__(application)
+
+    def execute(self, *args):
+        """
+        Executes the stats command.
+
+        Args:
+            *args: Optional action, "slow", "reset" or "log".
+
+        Returns:
+            str: Message indicating the result of the action, None if the metrics were printed.
+
+        """
+
+        return self.application.stats(args[0] if args else None)
@@ -34,10 +34,13 @@ class Tables(CommandInterface):
 
         super().__init__(application)
 
-    def execute(self):
+    def execute(self, *args):
         """
         Executes the tables command.
 
+        Args:
+            *args: The inline arguments of the command.
+
         Returns:
             str: Message listing the available tables.
 
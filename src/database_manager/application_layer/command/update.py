@@ -34,10 +34,13 @@ class Update(CommandInterface):
 
         super().__init__(application)
 
-    def execute(self):
+    def execute(self, *args):
         """
         Executes the update command.
 
+        Args:
+            *args: Optional table name followed by column=value pairs, e.g. "bidder surname=Doe".
+
         Returns:
             None
 
@@ -49,4 +52,4 @@ class Update(CommandInterface):
         if not self.application.is_in_manager_mode:
             raise Exception('To perform this action, you must be in manager mode')
         else:
-            self.application.crud_operation(self.application.CRUDOperation.UPDATE)
+            self.application.crud_operation(self.application.CRUDOperation.UPDATE, args)
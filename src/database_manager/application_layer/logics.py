@@ -5,9 +5,20 @@ This module provides utility functions for data validation and file handling.
 
 Functions:
     validate_input: Validates user input based on the expected data type.
+    convert_datetime: Converts text from XML into a datetime.
+    convert_bool: Converts text from XML into a bool.
+    compile_converters: Returns the converters of a database entity, compiled once per entity.
+    get_row_getter: Returns a getter picking the values of a row in column order.
     retype_data: Retypes data from XML for database insertion.
-    load_xml: Loads XML data and parses it into element name and data.
-    load_file: Loads text data from a file.
+    iterate_xml: Incrementally parses an XML file and yields its data in batches.
+    parse_xml_file: Parses and retypes an XML file of one or more tables into spool files, used by import workers.
+    read_batch_spool: Reads retyped batches back from a spool file.
+    open_file: Opens a file with the expected suffix.
+
+Constants:
+    NULL_VALUES (tuple): The XML texts imported as null values.
+    FALSE_VALUES (tuple): The XML texts imported as False.
+    CONVERTERS (dict): The compiled converters of database entities keyed by their parameters.
 
 Exceptions:
     InvalidFileSuffixError: Raised when an unexpected file suffix is encountered.
@@ -15,7 +26,19 @@ Exceptions:
 """
 
 
+import os
+import pickle
+import tempfile
+import time
+import xml.etree.ElementTree as Et
 from datetime import datetime
+from enum import Enum
+from operator import itemgetter
+
+
+NULL_VALUES = ('none', 'null')
+FALSE_VALUES = ('0', 'false')
+CONVERTERS = {}
 
 
 class InvalidFileSuffixError(Exception):
@@ -66,77 +89,290 @@ def validate_input(typeof, user_data):
     return converted_input
 
 
+def convert_datetime(value):
+    """
+    Converts text from XML into a datetime, dates may be separated by "-", "." or "/".
+
+    Args:
+        value (str): The stripped text of the value.
+
+    Returns:
+        datetime: The converted date and time.
+
+    """
+
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.fromisoformat(value.replace('.', '-').replace('/', '-'))
+
+
+def convert_bool(value):
+    """
+    Converts text from XML into a bool, "0" and "false" are False.
+
+    Args:
+        value (str): The stripped text of the value.
+
+    Returns:
+        bool: The converted value.
+
+    """
+
+    return value.lower() not in FALSE_VALUES
+
+
+def compile_converters(params):
+    """
+    Returns the converters of a database entity, compiled once per entity and reused for every batch.
+    Strings are only stripped, enums are looked up by value and dates are parsed in ISO format.
+
+    Args:
+        params (dict): The parameters of the database entity.
+
+    Returns:
+        tuple: A tuple containing a list of converters in column order (None for strings)
+               and a dict caching the row getter of each set of XML tags.
+
+    """
+
+    key = tuple(params.items())
+    compiled = CONVERTERS.get(key)
+    if compiled is not None:
+        return compiled
+
+    converters = []
+    for typeof in params.values():
+        if typeof is str:
+            converters.append(None)
+        elif typeof is datetime:
+            converters.append(convert_datetime)
+        elif typeof is bool:
+            converters.append(convert_bool)
+        elif type(typeof) is type(Enum):
+            converters.append({member.value: member for member in typeof}.__getitem__)
+        else:
+            converters.append(typeof)
+
+    compiled = (converters, {})
+    CONVERTERS[key] = compiled
+    return compiled
+
+
+def get_row_getter(row, params, getters):
+    """
+    Returns a getter picking the values of a row in column order, resolved once per set of XML tags.
+
+    Args:
+        row (dict): A row extracted from XML.
+        params (dict): The parameters of the database entity.
+        getters (dict): The cached getters keyed by the sorted tags of a row.
+
+    Returns:
+        itemgetter: The getter returning a tuple of row values in column order.
+
+    Raises:
+        Exception: If the tags do not match the columns of the database table.
+
+    """
+
+    key = tuple(sorted(row))
+    getter = getters.get(key)
+    if getter is not None:
+        return getter
+
+    tags = {'identifier' if tag == 'ID' else tag.lower(): tag for tag in row}
+    if len(tags) != len(row) or tags.keys() != params.keys():
+        raise Exception('Data are not in format of database table')
+
+    getter = getters[key] = itemgetter(*(tags[name] for name in params))
+    return getter
+
+
 def retype_data(element_data, params):
     """
-    Retypes data from XML for database insertion.
+    Retypes data from XML for database insertion. Rows are returned as tuples in the order
+    of the entity parameters, so they can be inserted without building an entity object per row.
+    The batch is retyped column by column with the converters compiled for the entity.
 
     Args:
         element_data (list): The data extracted from XML.
         params (dict): The parameters of the database entity.
 
     Returns:
-        list: The retyped data ready for insertion into the database.
+        list: The retyped rows ready for insertion into the database.
 
     """
 
-    retyped_data = []
+    if not element_data:
+        return []
 
-    for row in element_data:
-        object_data = {}
-        for value in row:
-            try:
-                id_const = 'IDENTIFIER'
-                row[value] = row[value].strip()
-                if row[value].lower() == 'none' or row[value].lower() == 'null':
-                    retyped_value = None
-                else:
-                    retyped_value = params[value.lower() if value != 'ID' else id_const.lower()](row[value])
-                object_data[value.lower() if value != 'ID' else id_const.lower()] = retyped_value
-            except:
-                raise Exception('Data are not in format of database table')
-        retyped_data.append(object_data)
+    converters, getters = compile_converters(params)
+    getter = get_row_getter(element_data[0], params, getters)
+    count = len(converters)
+    retyped_columns = []
+
+    if any(len(row) != count for row in element_data):
+        raise Exception('Data are not in format of database table')
 
-    return retyped_data
+    try:
+        for convert, values in zip(converters, zip(*map(getter, element_data))):
+            if convert is None:
+                retyped_columns.append([None if len(value := text.strip()) == 4 and value.lower() in NULL_VALUES
+                                        else value for text in values])
+            else:
+                retyped_columns.append([None if len(value := text.strip()) == 4 and value.lower() in NULL_VALUES
+                                        else convert(value) for text in values])
+    except:
+        raise Exception('Data are not in format of database table')
+
+    return list(zip(*retyped_columns))
 
 
-def load_xml(xml_string):
+def iterate_xml(path, suffix, batch_size, mixed=False):
     """
-    Loads XML data and parses it into element name and data.
+    Incrementally parses an XML file and yields its data in batches. Processed elements
+    are cleared right away, so memory is bounded by batch size rather than file size.
 
     Args:
-        xml_string (ElementTree): The XML data.
+        path (str): The path to the XML file.
+        suffix (str): The expected file suffix.
+        batch_size (int): The maximum number of rows in one batch.
+        mixed (bool): Indicates whether rows of several tables are allowed, a batch then
+                      ends whenever the element name changes.
+
+    Yields:
+        tuple: A tuple containing the element name and a list of rows (dicts) extracted from XML.
+
+    Raises:
+        Exception: If the file cannot be opened or the import data are not consistent.
+        ElementTree.ParseError: If the file is not a valid XML.
+
+    """
+
+    file = open_file(path, suffix, 'rb')
+    with file:
+        element_name = None
+        batch = []
+        depth = 0
+        root = None
+
+        for event, element in Et.iterparse(file, events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = element
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth != 1:
+                continue
+
+            if element_name is None:
+                element_name = element.tag
+            if element_name != element.tag:
+                if not mixed:
+                    raise Exception('Import data are not consistent')
+                if batch:
+                    yield element_name, batch
+                    batch = []
+                element_name = element.tag
+
+            row_data = {}
+            for child in element:
+                row_data[child.tag] = child.text
+            batch.append(row_data)
+            root.clear()
+
+            if len(batch) >= batch_size:
+                yield element_name, batch
+                batch = []
+
+        if batch:
+            yield element_name, batch
+
+
+def parse_xml_file(path, suffix, batch_size, params):
+    """
+    Parses and retypes a whole XML file in batches, the file may contain rows of several tables.
+    Retyped batches are spooled into a temporary file per table, so only one batch is held in memory.
+    Runs in import worker processes, so it only takes and returns picklable values.
+
+    Args:
+        path (str): The path to the XML file.
+        suffix (str): The expected file suffix.
+        batch_size (int): The maximum number of rows in one batch.
+        params (dict): The parameters of every importable database entity keyed by lowercase element name.
 
     Returns:
-        tuple: A tuple containing the element name and the data extracted from XML.
+        tuple: A tuple containing a dict of (spool file path, number of rows) keyed by lowercase element name,
+               the number of rows and the parse time in seconds. The caller removes the spool files.
+
+    Raises:
+        Exception: If the file cannot be opened, a table does not exist or the data are not in format of database table.
+        ElementTree.ParseError: If the file is not a valid XML.
 
     """
 
-    element_name = None
-    element_data = []
+    start = time.perf_counter()
+    spools = {}
+    rows = 0
 
-    for index, data in enumerate(xml_string.findall('./*')):
-        if index == 0:
-            element_name = data.tag
-        if element_name != data.tag:
-            raise Exception('Import data are not consistent')
-        row_data = {}
-        for child in data:
-            row_data[child.tag] = child.text
-        element_data.append(row_data)
+    try:
+        for element_name, element_data in iterate_xml(path, suffix, batch_size, True):
+            element_name = element_name.lower()
+            if element_name not in params:
+                raise Exception('Invalid data, table to be imported in does not exist')
+            if element_name not in spools:
+                spools[element_name] = [tempfile.NamedTemporaryFile('wb', suffix='.spool', delete=False), 0]
+            spool = spools[element_name]
+            pickle.dump(retype_data(element_data, params[element_name]), spool[0], pickle.HIGHEST_PROTOCOL)
+            spool[1] += len(element_data)
+            rows += len(element_data)
+    except BaseException:
+        for file, _ in spools.values():
+            file.close()
+            os.remove(file.name)
+        raise
+
+    for file, _ in spools.values():
+        file.close()
+
+    spools = {element_name: (file.name, count) for element_name, (file, count) in spools.items()}
+    return spools, rows, time.perf_counter() - start
+
+
+def read_batch_spool(path):
+    """
+    Reads retyped batches back from a spool file written by parse_xml_file.
 
-    return element_name, element_data
+    Args:
+        path (str): The path to the spool file.
 
+    Yields:
+        list: A batch of retyped rows in column order.
 
-def load_file(path, suffix):
     """
-    Loads text data from a file.
+
+    with open(path, 'rb') as file:
+        while True:
+            try:
+                yield pickle.load(file)
+            except EOFError:
+                return
+
+
+def open_file(path, suffix, mode):
+    """
+    Opens a file with the expected suffix.
 
     Args:
         path (str): The path to the file.
         suffix (str): The expected file suffix.
+        mode (str): The mode in which the file is opened.
 
     Returns:
-        str: The text data from the file.
+        file: The opened file object.
 
     Raises:
         FileNotFoundError: If the file does not exist.
@@ -152,10 +388,7 @@ def load_file(path, suffix):
         if not path.endswith(suffix):
             raise InvalidFileSuffixError(suffix)
 
-        with open(path, 'r') as file:
-            xml_text = file.read()
-
-        return xml_text
+        return open(path, mode)
     except FileNotFoundError:
         raise Exception(f'File "{path}" does not exist')
     except PermissionError:
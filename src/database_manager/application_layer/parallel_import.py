@@ -0,0 +1,357 @@
+"""
+Parallel Import Module
+
+This module defines the ParallelImport class for importing many XML files at once.
+
+Classes:
+    ParallelImport: A class importing XML files with a pool of parser processes and a pool of writer threads.
+
+"""
+
+
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from .logics import parse_xml_file, read_batch_spool
+
+
+class ParallelImport:
+    """
+    A class importing XML files with a pool of parser processes and a pool of writer threads.
+    Files are parsed and retyped in worker processes, a file may contain rows of several tables.
+    Retyped batches are spooled into temporary files per file and table, so memory stays bounded by batch size.
+    The rows are then written by writer threads, each on its own pooled connection, table level by
+    table level in foreign key order planned from the schema, so referenced rows are committed first.
+    The tables of one file and level are written in one transaction.
+
+    Attributes:
+        GLOB_CHARS (str): Characters marking a path as a glob pattern.
+        _data_manager: The DataManager object the data are imported through.
+        _controller: The Controller object for printing progress and the report.
+        _logger: The logger object for logging import events.
+        suffix (str): The suffix of imported files.
+        batch_size (int): The number of rows parsed, retyped and inserted at once.
+        parse_workers (int): The number of parser processes, 0 for the number of CPUs.
+        writer_workers (int): The number of writer threads.
+        foreign_key_checks (bool): Indicates whether foreign keys are checked while writing,
+                                   if not, they are verified after all tables are written.
+
+    Methods:
+        is_multi_path(path): Checks whether a path is a directory or a glob pattern.
+        resolve_paths(path): Returns the files matching a path, directory or glob pattern.
+        run(paths, mode): Imports the files and prints the per-file report.
+        print_report(files): Prints rows, parse time, write time and throughput of every file and the failed batches.
+
+    """
+
+    GLOB_CHARS = '*?['
+
+    def __init__(self, data_manager, controller, logger, suffix, batch_size, parse_workers, writer_workers,
+                 foreign_key_checks=True):
+        """
+        Initializes the ParallelImport instance.
+
+        Args:
+            data_manager: The DataManager object the data are imported through.
+            controller: The Controller object for printing progress and the report.
+            logger: The logger object for logging import events.
+            suffix (str): The suffix of imported files.
+            batch_size (int): The number of rows parsed, retyped and inserted at once.
+            parse_workers (int): The number of parser processes, 0 for the number of CPUs.
+            writer_workers (int): The number of writer threads, limited to 1 without a connection pool.
+            foreign_key_checks (bool): Indicates whether foreign keys are checked while writing.
+
+        """
+
+        self._data_manager = data_manager
+        self._controller = controller
+        self._logger = logger
+        self.suffix = suffix
+        self.batch_size = batch_size
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.writer_workers = writer_workers if data_manager.is_pooled() else 1
+        self.foreign_key_checks = foreign_key_checks
+
+    @classmethod
+    def is_multi_path(cls, path: str):
+        """
+        Checks whether a path is a directory or a glob pattern.
+
+        Args:
+            path (str): The import path.
+
+        Returns:
+            bool: True if the path can match several files, False otherwise.
+
+        """
+
+        path = path.replace('\'', '')
+        return os.path.isdir(path) or any(char in path for char in cls.GLOB_CHARS)
+
+    def resolve_paths(self, path: str):
+        """
+        Returns the files matching a path, directory or glob pattern.
+
+        Args:
+            path (str): The file, directory or glob pattern.
+
+        Returns:
+            list: A sorted list of file paths.
+
+        Raises:
+            Exception: If no file matches the path.
+
+        """
+
+        path = path.replace('\'', '')
+        if os.path.isdir(path):
+            path = os.path.join(path, f'*{self.suffix}')
+
+        paths = sorted(file for file in glob.glob(path) if os.path.isfile(file))
+        if not paths:
+            raise Exception(f'No files found matching "{path}"')
+        return paths
+
+    def run(self, paths: list, mode: str):
+        """
+        Imports the files and prints the per-file report. All files are parsed first into spool files
+        of retyped batches, then their rows are streamed from the spools table level by table level,
+        so memory is bounded by batch size, not by the size of the files. The tables of one file and
+        level are written in one transaction. A failed file does not stop the import of the others,
+        its error is shown in the report with the tables committed on lower levels, and its remaining
+        tables are skipped.
+
+        Args:
+            paths (list): The paths of the imported files.
+            mode (str): The import mode ("insert" or "bulk").
+
+        Returns:
+            str: A message summarizing the import.
+
+        """
+
+        start = time.perf_counter()
+        entities, params = self._get_entities()
+        files = [{'path': path, 'tables': [], 'spools': {}, 'rows': 0, 'parse_time': 0.0, 'write_start': None,
+                  'write_time': 0.0, 'status': None, 'failures': [], 'written': 0, 'committed': []}
+                 for path in paths]
+        progress = {'parsed': 0, 'files': len(files), 'written': 0, 'rows': 0}
+        parts = []
+
+        try:
+            with ProcessPoolExecutor(max_workers=self.parse_workers) as parsers, \
+                    ThreadPoolExecutor(max_workers=self.writer_workers) as writers:
+                parse_futures = {parsers.submit(parse_xml_file, file['path'], self.suffix, self.batch_size,
+                                                params): file for file in files}
+
+                for future in as_completed(parse_futures):
+                    file = parse_futures[future]
+                    progress['parsed'] += 1
+                    try:
+                        file['spools'], file['rows'], file['parse_time'] = future.result()
+                    except Exception as e:
+                        self._fail_file(file, e)
+                        continue
+
+                    self._data_manager.metrics.record('import.parse', file['parse_time'], file['rows'],
+                                                      os.path.getsize(file['path']))
+
+                    file['tables'] = sorted(file['spools'])
+                    parts.extend((file, table, file['spools'][table]) for table in file['tables'])
+                    progress['rows'] += file['rows']
+                    self._print_progress(progress)
+
+                levels = self._data_manager.get_import_levels({table for _, table, _ in parts})
+
+                for level in sorted(set(levels.values())):
+                    level_parts = {}
+                    for file, table, spool in parts:
+                        if levels[table] == level and file['status'] is None:
+                            level_parts.setdefault(id(file), (file, []))[1].append((table, entities[table], spool))
+
+                    write_futures = {}
+                    for file, tables in level_parts.values():
+                        if file['write_start'] is None:
+                            file['write_start'] = time.perf_counter()
+                        future = writers.submit(self._write_tables, tables, mode)
+                        write_futures[future] = (file, tables)
+
+                    for future in as_completed(write_futures):
+                        file, tables = write_futures[future]
+                        try:
+                            rows, failures = future.result()
+                            file['failures'].extend(failures)
+                            file['written'] += rows
+                            file['committed'].extend(table for table, _, _ in tables)
+                            progress['written'] += rows
+                        except Exception as e:
+                            self._fail_file(file, e)
+                        file['write_time'] = time.perf_counter() - file['write_start']
+                        self._print_progress(progress)
+        finally:
+            self._remove_spools(files)
+
+        self._controller.print_progress('', True)
+        self.print_report(files)
+
+        elapsed = time.perf_counter() - start
+        imported = sum(1 for file in files if file['status'] is None)
+        partial = sum(1 for file in files if file['status'] is not None and file['committed'])
+        rate = progress['written'] / elapsed if elapsed > 0 else progress['written']
+        message = (f'Data imported from {imported} of {len(files)} files'
+                   f'{f", {partial} partially" if partial else ""} '
+                   f'({progress["written"]} rows, {rate:.0f} rows/s)')
+
+        if not self.foreign_key_checks:
+            message += self.verify_foreign_keys(levels)
+        return message
+
+    def _write_tables(self, tables: list, mode: str):
+        """
+        Writes tables of one file in one transaction, so a failure leaves none of them committed.
+        Failed batches are rolled back to their savepoint and reported, the other batches are kept.
+
+        Args:
+            tables (list): Tuples of table name, class name and (spool file path, number of rows) of the file.
+            mode (str): The import mode ("insert" or "bulk").
+
+        Returns:
+            tuple: The number of written rows and a list of (table, first row, last row, error) of failed batches.
+
+        """
+
+        rows = 0
+        failures = []
+        self._data_manager.begin_transaction(self.foreign_key_checks)
+        try:
+            for table, class_name, (path, count) in tables:
+                if mode == 'bulk':
+                    self._data_manager.bulk_import(class_name, read_batch_spool(path), self.foreign_key_checks)
+                    rows += count
+                else:
+                    imported, table_failures = self._data_manager.import_batches(class_name, read_batch_spool(path),
+                                                                                 self.foreign_key_checks)
+                    rows += imported
+                    failures.extend((table, *failure) for failure in table_failures)
+            self._data_manager.commit_transaction()
+        except Exception:
+            if self._data_manager.transactions.is_active:
+                self._data_manager.rollback_transaction()
+            raise
+        return rows, failures
+
+    def verify_foreign_keys(self, tables):
+        """
+        Verifies foreign keys of the written tables and prints the violated ones.
+
+        Args:
+            tables (iterable): The names of the written tables.
+
+        Returns:
+            str: A message suffix with the result of the verification.
+
+        """
+
+        violations = []
+        for table in sorted(tables):
+            for column, reference, count in self._data_manager.verify_foreign_keys(table):
+                violations.append([table, column, reference, count])
+
+        if not violations:
+            return ', foreign keys verified'
+
+        self._controller.print_table(['TABLE', 'COLUMN', 'REFERENCES', 'ORPHAN ROWS'], violations)
+        for violation in violations:
+            self._logger.error('Foreign key %s.%s has %s rows without referenced %s row',
+                               violation[0], violation[1], violation[3], violation[2])
+        return f', {len(violations)} foreign keys violated'
+
+    def _get_entities(self):
+        """
+        Returns the entity class and parameters of every importable table.
+
+        Returns:
+            tuple: A dict of class names and a dict of class parameters, both keyed by
+                   lowercase element name, e.g. "winning_offer".
+
+        """
+
+        entities, params = {}, {}
+        for table in self._data_manager.get_tables():
+            element_name = table.replace(' ', '_')
+            class_name, params[element_name] = self._data_manager.get_class_attributes(table, 'import', True)
+            entities[element_name] = class_name
+        return entities, params
+
+    def _remove_spools(self, files: list):
+        """
+        Removes the spool files of the parsed files.
+
+        Args:
+            files (list): The import states of the files.
+
+        """
+
+        for file in files:
+            for path, _ in file['spools'].values():
+                try:
+                    os.remove(path)
+                except OSError:
+                    self._logger.error('Spool file "%s" could not be removed', path)
+
+    def _fail_file(self, file: dict, error: Exception):
+        """
+        Marks a file as failed, keeping its first error.
+
+        Args:
+            file (dict): The import state of the file.
+            error (Exception): The error.
+
+        """
+
+        if file['status'] is None:
+            file['status'] = str(error) or type(error).__name__
+            self._logger.error('Import of "%s" failed: %s', file['path'], file['status'])
+
+    def _print_progress(self, progress: dict):
+        """
+        Prints the import progress on one line.
+
+        Args:
+            progress (dict): Counts of parsed files, all files, written rows and parsed rows.
+
+        """
+
+        self._controller.print_progress(f'Importing: parsed {progress["parsed"]}/{progress["files"]} files, '
+                                        f'written {progress["written"]}/{progress["rows"]} rows')
+
+    def print_report(self, files: list):
+        """
+        Prints rows, parse time, write time and throughput of every file, followed by the failed
+        batches with their rows counted per table of the file.
+
+        Args:
+            files (list): The import states of the files.
+
+        """
+
+        headers = ['FILE', 'TABLES', 'ROWS', 'PARSE S', 'WRITE S', 'ROWS/S', 'STATUS']
+        rows = []
+        failed_batches = []
+        for file in files:
+            elapsed = file['parse_time'] + file['write_time']
+            rate = file['rows'] / elapsed if elapsed > 0 else 0
+            status = file['status'] or (f'{len(file["failures"])} batches rolled back' if file['failures'] else 'OK')
+            if file['status'] and file['committed']:
+                status += f' ({file["written"]} rows of {", ".join(file["committed"])} committed)'
+            rows.append([os.path.basename(file['path']), ', '.join(file['tables']), file['rows'],
+                         f'{file["parse_time"]:.3f}', f'{file["write_time"]:.3f}', f'{rate:.0f}', status])
+            for table, first, last, error in file['failures']:
+                failed_batches.append([os.path.basename(file['path']), table, f'{first}-{last}', error])
+                self._logger.error('Import of rows %s-%s of "%s" from "%s" rolled back: %s',
+                                   first, last, table, file['path'], error)
+        self._controller.print_table(headers, rows)
+
+        if failed_batches:
+            self._controller.print_table(['FILE', 'TABLE', 'ROWS', 'ERROR'], failed_batches)
@@ -0,0 +1,218 @@
+"""
+Profiler Module
+
+This module defines the Profiler class for running commands under cProfile and tracemalloc.
+
+Classes:
+    Profiler: A class profiling single commands, every command of a session or a whole script.
+
+"""
+
+
+import cProfile
+import os
+import pstats
+import time
+import tracemalloc
+
+
+class Profiler:
+    """
+    A class profiling single commands, every command of a session or a whole script. CPU profiles
+    are collected by cProfile and saved as pstats files (readable by pstats, snakeviz, ...), memory
+    profiles are collected by tracemalloc and saved as snapshot files (readable by tracemalloc.Snapshot.load).
+    After every profiled run the top functions by cumulative time and the top allocation sites are printed.
+    Only the main process is profiled, parser processes of a directory or glob import are not.
+
+    Attributes:
+        MODES (tuple): The profiling modes, "cpu" for cProfile, "memory" for tracemalloc, "all" for both.
+        COMMAND (str): The name of the command arming the profiler, it is never profiled itself.
+        directory (str): The directory profile files are saved into.
+        top (int): The number of printed functions and allocation sites.
+        _controller: The Controller object for printing profiles.
+        _logger: The logger object for logging saved profiles.
+        _next (str): The mode the next command is profiled in, None if not armed.
+        _session (str): The mode every command is profiled in, None if not armed.
+        _is_active (bool): Indicates whether a profiled run is in progress.
+        runs (int): The number of profiled runs, numbering the profile files.
+
+    Methods:
+        arm(mode, session): Profiles the next command or every following command.
+        disarm(): Stops profiling of following commands.
+        get_status(): Returns a description of the armed profiling.
+        take(name): Returns the mode a command is profiled in.
+        run(label, mode, function, *args): Runs a function under the profilers and prints the profile.
+        report(label, elapsed, profile, snapshot, peak): Saves the profile files and prints the profile.
+
+    """
+
+    MODES = ('cpu', 'memory', 'all')
+    COMMAND = 'profile'
+
+    def __init__(self, directory: str, controller, logger, top: int = 20):
+        """
+        Initializes the Profiler instance.
+
+        Args:
+            directory (str): The directory profile files are saved into, created on first save.
+            controller: The Controller object for printing profiles.
+            logger: The logger object for logging saved profiles.
+            top (int): The number of printed functions and allocation sites.
+
+        """
+
+        self.directory = directory
+        self.top = top
+        self._controller = controller
+        self._logger = logger
+        self._next = None
+        self._session = None
+        self._is_active = False
+        self.runs = 0
+
+    def arm(self, mode: str = 'cpu', session: bool = False):
+        """
+        Profiles the next command, or every following command until disarmed.
+
+        Args:
+            mode (str): The profiling mode ("cpu", "memory" or "all").
+            session (bool): Indicates whether every following command is profiled.
+
+        Raises:
+            Exception: If the mode is unknown.
+
+        """
+
+        if mode not in self.MODES:
+            raise Exception(f'Invalid profiling mode, use {", ".join(self.MODES)}')
+
+        if session:
+            self._session = mode
+        else:
+            self._next = mode
+
+    def disarm(self):
+        """
+        Stops profiling of following commands.
+
+        """
+
+        self._next = None
+        self._session = None
+
+    def get_status(self):
+        """
+        Returns a description of the armed profiling.
+
+        Returns:
+            str: The description.
+
+        """
+
+        if self._session is not None:
+            return f'Profiling every command ({self._session}), saved into "{self.directory}"'
+        if self._next is not None:
+            return f'Profiling next command ({self._next}), saved into "{self.directory}"'
+        return 'Profiling is off'
+
+    def take(self, name: str):
+        """
+        Returns the mode a command is profiled in, an armed next command profile is consumed.
+        Commands running inside a profiled run are not profiled again.
+
+        Args:
+            name (str): The name of the command.
+
+        Returns:
+            str: The profiling mode, None if the command is not profiled.
+
+        """
+
+        if self._is_active or name == self.COMMAND:
+            return None
+
+        mode, self._next = self._next, None
+        return mode or self._session
+
+    def run(self, label: str, mode: str, function, *args):
+        """
+        Runs a function under the profilers of a mode, saves the profile files and prints
+        the profile. The profile is kept also when the function raises an exception.
+
+        Args:
+            label (str): The name of the profiled run used in file names, e.g. the command name.
+            mode (str): The profiling mode ("cpu", "memory" or "all").
+            function: The profiled callable.
+            *args: The arguments of the callable.
+
+        Returns:
+            Any: The result of the callable.
+
+        """
+
+        profile = cProfile.Profile() if mode in ('cpu', 'all') else None
+        is_tracing = mode in ('memory', 'all') and not tracemalloc.is_tracing()
+
+        self._is_active = True
+        if is_tracing:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            if profile is None:
+                return function(*args)
+            return profile.runcall(function, *args)
+        finally:
+            elapsed = time.perf_counter() - start
+            snapshot = None
+            peak = 0
+            if is_tracing:
+                snapshot = tracemalloc.take_snapshot()
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            self._is_active = False
+            self.report(label, elapsed, profile, snapshot, peak)
+
+    def report(self, label: str, elapsed: float, profile, snapshot, peak: int):
+        """
+        Saves the profile files and prints the top functions and allocation sites.
+
+        Args:
+            label (str): The name of the profiled run.
+            elapsed (float): The run time in seconds.
+            profile (cProfile.Profile): The CPU profile, None if not collected.
+            snapshot (tracemalloc.Snapshot): The memory snapshot, None if not collected.
+            peak (int): The peak traced memory in bytes.
+
+        """
+
+        self.runs += 1
+        os.makedirs(self.directory, exist_ok=True)
+        base = os.path.join(self.directory, f'{time.strftime("%Y%m%d_%H%M%S")}_{self.runs}_{label}')
+        files = []
+
+        if profile is not None:
+            profile.create_stats()
+            profile.dump_stats(f'{base}.prof')
+            files.append(f'{base}.prof')
+            stats = sorted(profile.stats.items(), key=lambda item: item[1][3], reverse=True)[:self.top]
+            self._controller.print_table(
+                ['CALLS', 'TOTAL S', 'CUMULATIVE S', 'FUNCTION'],
+                [[f'{calls}/{primitive}' if calls != primitive else calls, f'{total:.4f}', f'{cumulative:.4f}',
+                  pstats.func_std_string(function)]
+                 for function, (primitive, calls, total, cumulative, _) in stats])
+
+        if snapshot is not None:
+            snapshot.dump(f'{base}.tracemalloc')
+            files.append(f'{base}.tracemalloc')
+            sites = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)]).statistics('lineno')
+            self._controller.print_table(
+                ['SIZE KB', 'BLOCKS', 'ALLOCATION SITE'],
+                [[f'{site.size / 1024:.1f}', site.count, f'{site.traceback[0].filename}:{site.traceback[0].lineno}']
+                 for site in sites[:self.top]])
+
+        message = f'Profile of "{label}" ({elapsed:.3f} s'
+        if snapshot is not None:
+            message += f', peak memory {peak / 1024 / 1024:.1f} MB'
+        message += f') saved to {", ".join(files)}'
+        self._controller.print_message(message)
+        self._logger.info(message)
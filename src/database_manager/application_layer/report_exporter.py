@@ -0,0 +1,196 @@
+"""
+Report Exporter Module
+
+This module defines the ReportExporter class for writing reports into CSV and JSON Lines files.
+
+Classes:
+    ReportExporter: A class writing streamed report chunks into CSV or JSON Lines files, optionally gzip compressed.
+
+"""
+
+
+import csv
+import datetime
+import decimal
+import gzip
+import json
+import os
+
+
+class ReportExporter:
+    """
+    A class writing streamed report chunks into CSV or JSON Lines files, optionally gzip compressed.
+    Every chunk is written as it arrives, so an export holds one chunk of rows in memory whatever
+    the size of the report. The file is written under a temporary name and renamed when complete,
+    so other systems never read a partial export.
+
+    CSV files start with a header row of the view columns, NULL is written as an empty field.
+    JSON Lines files hold one object per row keyed by the view columns, dates are written
+    in ISO 8601 format and decimals as numbers.
+
+    Attributes:
+        FORMATS (dict): The export formats keyed by file suffix.
+        COMPRESSED_SUFFIX (str): The file suffix selecting gzip compression.
+        PARTIAL_SUFFIX (str): The suffix of files being written.
+        compress_level (int): The gzip compression level.
+
+    Methods:
+        get_format(path): Returns the format and compression of a file path.
+        export(path, headers, chunks): Writes report chunks into a file.
+        write_csv(file, headers, chunks): Writes report chunks as CSV.
+        write_jsonl(file, headers, chunks): Writes report chunks as JSON Lines.
+        to_json_value(value): Converts a value unknown to JSON.
+
+    """
+
+    FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+    COMPRESSED_SUFFIX = '.gz'
+    PARTIAL_SUFFIX = '.part'
+
+    def __init__(self, compress_level: int = 6):
+        """
+        Initializes the ReportExporter instance.
+
+        Args:
+            compress_level (int): The gzip compression level, 1 (fastest) to 9 (smallest).
+
+        """
+
+        self.compress_level = compress_level
+
+    def get_format(self, path: str):
+        """
+        Returns the format and compression of a file path, e.g. "csv" and True for "winners.csv.gz".
+
+        Args:
+            path (str): The path to the export file.
+
+        Returns:
+            tuple: A tuple containing the format ("csv" or "jsonl") and whether the file is gzip compressed.
+
+        Raises:
+            Exception: If the file suffix is not a known format.
+
+        """
+
+        base, suffix = os.path.splitext(path.lower())
+        compressed = suffix == self.COMPRESSED_SUFFIX
+        if compressed:
+            suffix = os.path.splitext(base)[1]
+
+        if suffix not in self.FORMATS:
+            raise Exception(f'Invalid export file, use suffix {", ".join(self.FORMATS)} '
+                            f'optionally followed by {self.COMPRESSED_SUFFIX}')
+        return self.FORMATS[suffix], compressed
+
+    def export(self, path: str, headers: list, chunks):
+        """
+        Writes report chunks into a file in the format of its suffix. The chunks are closed
+        when the export ends, so a streamed report releases its connection also on failure.
+
+        Args:
+            path (str): The path to the export file, missing directories are created.
+            headers (list): The column names of the report.
+            chunks (iterable): The row chunks of the report.
+
+        Returns:
+            tuple: A tuple containing the number of exported rows and the size of the file in bytes.
+
+        """
+
+        export_format, compressed = self.get_format(path)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        partial = path + self.PARTIAL_SUFFIX
+        writer = self.write_csv if export_format == 'csv' else self.write_jsonl
+        try:
+            if compressed:
+                file = gzip.open(partial, 'wt', compresslevel=self.compress_level, encoding='utf-8', newline='')
+            else:
+                file = open(partial, 'w', encoding='utf-8', newline='')
+            with file:
+                rows = writer(file, headers, chunks)
+            os.replace(partial, path)
+        except BaseException:
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+        finally:
+            close = getattr(chunks, 'close', None)
+            if close is not None:
+                close()
+
+        return rows, os.path.getsize(path)
+
+    @staticmethod
+    def write_csv(file, headers: list, chunks):
+        """
+        Writes report chunks as CSV with a header row.
+
+        Args:
+            file: The text file to write into.
+            headers (list): The column names of the report.
+            chunks (iterable): The row chunks of the report.
+
+        Returns:
+            int: The number of written rows.
+
+        """
+
+        writer = csv.writer(file)
+        writer.writerow(headers)
+
+        rows = 0
+        for chunk in chunks:
+            writer.writerows(chunk)
+            rows += len(chunk)
+        return rows
+
+    @classmethod
+    def write_jsonl(cls, file, headers: list, chunks):
+        """
+        Writes report chunks as JSON Lines, one object per row.
+
+        Args:
+            file: The text file to write into.
+            headers (list): The column names of the report.
+            chunks (iterable): The row chunks of the report.
+
+        Returns:
+            int: The number of written rows.
+
+        """
+
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=cls.to_json_value)
+
+        rows = 0
+        for chunk in chunks:
+            file.write(''.join(encoder.encode(dict(zip(headers, row))) + '\n' for row in chunk))
+            rows += len(chunk)
+        return rows
+
+    @staticmethod
+    def to_json_value(value):
+        """
+        Converts a value unknown to JSON, dates and times to ISO 8601 strings, decimals to numbers,
+        bytes to text and anything else to its string form.
+
+        Args:
+            value: The value to convert.
+
+        Returns:
+            Any: The JSON compatible value.
+
+        """
+
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+            return value.isoformat()
+        if isinstance(value, datetime.timedelta):
+            return str(value)
+        if isinstance(value, decimal.Decimal):
+            return int(value) if value == value.to_integral_value() else float(value)
+        if isinstance(value, (bytes, bytearray)):
+            return value.decode('utf-8', 'replace')
+        return str(value)
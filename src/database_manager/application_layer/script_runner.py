@@ -0,0 +1,168 @@
+"""
+Script Runner Module
+
+This module defines the ScriptRunner class for running commands non-interactively.
+
+Classes:
+    ScriptRunner: A class running commands read from a script file or standard input.
+
+"""
+
+
+import sys
+import time
+
+
+class ScriptRunner:
+    """
+    A class running commands read from a script file or standard input. Each line holds one command
+    with its inline arguments, empty lines and lines starting with "#" are skipped. Consecutive
+    insert, update and delete commands are grouped into one transaction, which is rolled back
+    when one of its commands fails.
+
+    Attributes:
+        WRITE_COMMANDS (tuple): The commands grouped into transactions.
+        _application: The application executing the commands.
+        _controller: The Controller object for printing output.
+        _logger: The logger object for logging script events.
+        _timings (dict): Command counts and total seconds keyed by command name.
+        errors (int): The number of failed commands.
+        transactions (int): The number of committed transactions.
+
+    Methods:
+        run(path): Runs all commands of a script.
+
+    """
+
+    WRITE_COMMANDS = ('insert', 'update', 'delete')
+
+    def __init__(self, application, controller, logger):
+        """
+        Initializes the ScriptRunner instance.
+
+        Args:
+            application: The application executing the commands.
+            controller: The Controller object for printing output.
+            logger: The logger object for logging script events.
+
+        """
+
+        self._application = application
+        self._controller = controller
+        self._logger = logger
+        self._timings = {}
+        self.errors = 0
+        self.transactions = 0
+
+    def run(self, path: str):
+        """
+        Runs all commands of a script and prints a timing summary.
+
+        Args:
+            path (str): The path to the script file, "-" for standard input.
+
+        Raises:
+            Exception: If the script file cannot be opened.
+
+        """
+
+        try:
+            script = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+        except OSError:
+            raise Exception(f'Script "{path}" could not be opened')
+
+        application = self._application
+        data_manager = application.get_data_manager()
+        application.is_running = True
+        application.is_in_script_mode = True
+        in_transaction = False
+        start = time.perf_counter()
+
+        try:
+            for number, line in enumerate(script, 1):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+
+                name = line.split()[0]
+                is_write = name in self.WRITE_COMMANDS and application.is_in_manager_mode
+                if in_transaction and not is_write:
+                    self._end_transaction(True)
+                    in_transaction = False
+                if is_write and not in_transaction:
+                    data_manager.begin_transaction()
+                    in_transaction = True
+
+                command_start = time.perf_counter()
+                try:
+                    output = application.invoker.execute_command(line)
+                    if output is not None:
+                        self._controller.print_message(output)
+                        self._logger.info(output)
+                except Exception as e:
+                    self.errors += 1
+                    self._controller.print_error(f'Line {number}: {e}')
+                    self._logger.error('Script line %s: %s', number, e)
+                    if in_transaction:
+                        self._end_transaction(False)
+                        in_transaction = False
+                finally:
+                    timing = self._timings.setdefault(name, [0, 0.0])
+                    timing[0] += 1
+                    timing[1] += time.perf_counter() - command_start
+
+                if not application.is_running:
+                    break
+        finally:
+            if in_transaction:
+                self._end_transaction(True)
+            application.is_in_script_mode = False
+            if script is not sys.stdin:
+                script.close()
+
+        self.print_summary(time.perf_counter() - start)
+
+    def _end_transaction(self, commit: bool):
+        """
+        Ends the open transaction of the data manager, counting committed transactions.
+
+        Args:
+            commit (bool): Indicates whether the transaction is committed or rolled back.
+
+        """
+
+        data_manager = self._application.get_data_manager()
+        try:
+            if commit:
+                data_manager.commit_transaction()
+            else:
+                data_manager.rollback_transaction()
+        except Exception as e:
+            self.errors += 1
+            self._controller.print_error(f'Transaction failed: {e}')
+            self._logger.error('Script transaction failed: %s', e)
+            return
+
+        if commit:
+            self.transactions += 1
+
+    def print_summary(self, elapsed: float):
+        """
+        Prints the number of runs and the total and average time of each command.
+
+        Args:
+            elapsed (float): The total run time of the script in seconds.
+
+        """
+
+        headers = ['COMMAND', 'COUNT', 'TOTAL S', 'AVG MS']
+        rows = [[name, count, f'{total:.3f}', f'{total / count * 1000:.2f}']
+                for name, (count, total) in self._timings.items()]
+        if rows:
+            self._controller.print_table(headers, rows)
+
+        commands = sum(count for count, _ in self._timings.values())
+        summary = (f'Script finished: {commands} commands, {self.errors} errors, '
+                   f'{self.transactions} transactions in {elapsed:.3f} s')
+        self._controller.print_message(summary)
+        self._logger.info(summary)
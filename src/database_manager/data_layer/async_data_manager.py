@@ -0,0 +1,273 @@
+"""
+AsyncDataManager Module
+
+This module defines the AsyncDataManager class for managing database operations from asyncio code.
+
+Classes:
+    AsyncDataManager: A class for managing database operations with coroutines.
+
+"""
+
+
+from .data_manager import DataManager
+from .query.builder import QueryBuilder
+from .report_cache import ReportCache
+from .schema_catalog import SchemaCatalog
+from .table import *
+
+
+class AsyncDataManager:
+    """
+    A class for managing database operations with coroutines. Every operation runs on its own pooled
+    connection, so independent operations (reports, imports, CRUD) gathered on one event loop overlap
+    their network waits. Queries are built by QueryBuilder from the same entity classes as in DataManager.
+
+    Attributes:
+        _connection (AsyncConnector): The connector providing async database connections through checkout/checkin.
+        database_name (str): The name of the database being managed.
+        query_builder (QueryBuilder): An instance of the QueryBuilder class for constructing SQL queries.
+        _tables (list): A list of table names used until the schema catalog is loaded.
+        catalog (SchemaCatalog): The schema metadata loaded on connect.
+        insert_batch_rows (int): The maximum number of rows in one multi-row import insert.
+        _max_packet (int): The server max_allowed_packet size, loaded on first import.
+        report_cache (ReportCache): The cache of report results, invalidated by writes into base tables.
+
+    """
+
+    get_tables = DataManager.get_tables
+    get_class_attributes = DataManager.get_class_attributes
+    get_table_name = DataManager.get_table_name
+
+    def __init__(self, connection, database_name, query_conf=None, cache_conf=None):
+        """
+        Initializes an AsyncDataManager object with the provided connection and database name.
+
+        Args:
+            connection (AsyncConnector): The async connector to the database.
+            database_name (str): The name of the database being managed.
+            query_conf (dict, optional): Query settings, only insert_batch_rows is used.
+            cache_conf (dict, optional): Report cache settings (report_ttl, report_max_entries, report_max_rows).
+
+        """
+
+        query_conf = query_conf or {}
+        cache_conf = cache_conf or {}
+
+        self._connection = connection
+        self.database_name = database_name
+        self.query_builder = QueryBuilder()
+        self._tables = ['owner', 'bidder', 'item', 'offer', 'winning offer', 'auction']
+        self.catalog = SchemaCatalog()
+        self.insert_batch_rows = query_conf.get('insert_batch_rows', 500)
+        self._max_packet = None
+        self.report_cache = ReportCache(cache_conf.get('report_ttl', 60),
+                                        cache_conf.get('report_max_entries', 16),
+                                        cache_conf.get('report_max_rows', 100000))
+
+    async def refresh_catalog(self):
+        """
+        Loads the schema catalog from information_schema in one round-trip, falling back
+        to a query without view dependencies on servers not providing them.
+
+        """
+
+        params = [self.database_name] * 3
+        try:
+            rows = await self.execute_query(SchemaCatalog.QUERY, params)
+            self.catalog.load(rows, True)
+        except:
+            rows = await self.execute_query(SchemaCatalog.QUERY_WITHOUT_VIEW_USAGE, params[:2])
+            self.catalog.load(rows, False)
+
+        self.report_cache.clear()
+
+    async def make_operation(self, operation: str, user_data: list, class_name: str):
+        """
+        Executes a database operation based on the provided parameters.
+
+        Args:
+            operation (str): The database operation ('insert', 'delete', 'select', 'update').
+            user_data (list): The data provided by the user for the operation.
+            class_name (str): The name of the class associated with the operation.
+
+        Returns:
+            list: The output of the executed query.
+
+        """
+
+        query_selector = {
+            'insert': self.query_builder.create_insert,
+            'delete': self.query_builder.create_delete,
+            'select': self.query_builder.create_select,
+            'update': self.query_builder.create_update
+        }
+
+        class_object = globals().get(class_name)
+        if operation == 'insert':
+            user_data.insert(0, None)
+        instance_object = class_object(*user_data,)
+
+        query, data = query_selector[operation](instance_object)
+
+        output = await self.execute_query(query, data)
+        if operation != 'select':
+            self.report_cache.invalidate(self.get_table_name(class_name))
+        return output
+
+    async def execute_query(self, query: str, data: list):
+        """
+        Executes a SQL query.
+
+        Args:
+            query (str): The SQL query to execute.
+            data (list): The data values to be used in the query.
+
+        Returns:
+            list: The output of the executed query.
+
+        """
+
+        conn = await self._connection.checkout()
+        try:
+            cursor = await conn.cursor()
+
+            try:
+                await cursor.execute(query, data if data else None)
+                output = list(await cursor.fetchall())
+            except Exception as e:
+                await conn.rollback()
+                raise Exception(self.get_error_message(e))
+            finally:
+                await cursor.close()
+
+            await conn.commit()
+        finally:
+            await self._connection.checkin(conn)
+
+        return output
+
+    async def execute_batch_queries(self, batches: list):
+        """
+        Executes several SQL queries on one connection and commits them together.
+
+        Args:
+            batches (list): A list of tuples containing the SQL query and its data values.
+
+        Returns:
+            bool: True if the queries are executed successfully.
+
+        """
+
+        conn = await self._connection.checkout()
+        try:
+            cursor = await conn.cursor()
+
+            try:
+                for query, data in batches:
+                    await cursor.execute(query, data if data else None)
+            except Exception as e:
+                await conn.rollback()
+                raise Exception(self.get_error_message(e))
+            finally:
+                await cursor.close()
+
+            await conn.commit()
+        finally:
+            await self._connection.checkin(conn)
+
+        return True
+
+    async def import_data(self, class_name: str, data: list):
+        """
+        Imports data into the database in multi-row inserts committed together.
+
+        Args:
+            class_name (str): The name of the class associated with the data.
+            data (list): The rows to be imported, each a tuple of values in the column order of the class.
+
+        Returns:
+            bool: True if the import is successful.
+
+        """
+
+        batches = self.query_builder.create_row_batches(globals().get(class_name), data, self.insert_batch_rows,
+                                                        await self.get_max_packet())
+
+        try:
+            return await self.execute_batch_queries(batches)
+        finally:
+            self.report_cache.invalidate(self.get_table_name(class_name))
+
+    async def get_max_packet(self):
+        """
+        Retrieves the usable statement size from the server max_allowed_packet, leaving room
+        for value escaping and protocol overhead.
+
+        Returns:
+            int: The maximum size of one statement in bytes.
+
+        """
+
+        if self._max_packet is None:
+            output = await self.execute_query('SELECT @@max_allowed_packet;', [])
+            self._max_packet = int(output[0][0])
+
+        return int(self._max_packet * 0.9)
+
+    async def get_views(self):
+        """
+        Retrieves a list of views in the database.
+
+        Returns:
+            list: A list of view names.
+
+        """
+
+        if not self.catalog.is_loaded:
+            await self.refresh_catalog()
+
+        return [view.replace('_', ' ') for view in self.catalog.get_views()]
+
+    async def get_report(self, report: str):
+        """
+        Retrieves a report from the database.
+
+        Args:
+            report (str): The name of the report to retrieve.
+
+        Returns:
+            tuple: A tuple containing the headers and data of the report.
+
+        """
+
+        cached = self.report_cache.get(report)
+        if cached is not None:
+            return cached
+
+        headers_output = self.catalog.get_columns(report)
+        if headers_output is None:
+            headers_output = [column[0] for column in await self.execute_query(f'DESCRIBE {report};', [])]
+
+        output = await self.execute_query(f'SELECT * FROM {report};', [])
+
+        tables = self.catalog.get_view_dependencies(report) if self.catalog.is_loaded else None
+        self.report_cache.put(report, headers_output, output, tables)
+
+        return headers_output, output
+
+    @staticmethod
+    def get_error_message(error: Exception):
+        """
+        Extracts the server message from a driver error, e.g. (1146, "Table ... doesn't exist").
+
+        Args:
+            error (Exception): The error raised by the driver.
+
+        Returns:
+            str: The error message.
+
+        """
+
+        if len(error.args) > 1:
+            return str(error.args[1])
+        return str(error)
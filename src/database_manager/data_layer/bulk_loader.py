@@ -0,0 +1,134 @@
+"""
+Bulk Loader Module
+
+This module provides functions for spooling retyped rows into a tab separated file
+readable by LOAD DATA LOCAL INFILE, and for reading such file back.
+
+Functions:
+    create_spool_file: Creates a temporary spool file.
+    write_spool_row: Writes one row into a spool file.
+    read_spool_rows: Reads rows from a spool file in batches.
+    to_spool_value: Converts a value into its spool file representation.
+    from_spool_value: Converts a spool file field back into a value.
+
+Constants:
+    NULL_VALUE (str): The spool file representation of a null value.
+    LOCAL_INFILE_ERRORS (tuple): Error numbers signalling that local infile is not allowed.
+
+"""
+
+
+import tempfile
+from datetime import datetime
+from enum import Enum
+
+
+NULL_VALUE = '\\N'
+LOCAL_INFILE_ERRORS = (1148, 2068, 3948, 3950)
+
+_ESCAPES = {'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r', '\0': '\\0'}
+_ESCAPE_TABLE = str.maketrans(_ESCAPES)
+_UNESCAPES = {'\\': '\\', 't': '\t', 'n': '\n', 'r': '\r', '0': '\0'}
+
+
+def create_spool_file():
+    """
+    Creates a temporary spool file, the caller is responsible for removing it.
+
+    Returns:
+        file: The opened spool file.
+
+    """
+
+    return tempfile.NamedTemporaryFile('w', suffix='.tsv', delete=False, encoding='utf-8', newline='')
+
+
+def write_spool_row(file, values: list):
+    """
+    Writes one row into a spool file.
+
+    Args:
+        file: The opened spool file.
+        values (list): The values of the row.
+
+    """
+
+    file.write('\t'.join(to_spool_value(value) for value in values))
+    file.write('\n')
+
+
+def read_spool_rows(path: str, batch_size: int):
+    """
+    Reads rows from a spool file in batches.
+
+    Args:
+        path (str): The path to the spool file.
+        batch_size (int): The maximum number of rows in one batch.
+
+    Yields:
+        list: A batch of rows, each a list of values (strings or None).
+
+    """
+
+    batch = []
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        for line in file:
+            batch.append([from_spool_value(field) for field in line[:-1].split('\t')])
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+    if batch:
+        yield batch
+
+
+def to_spool_value(value):
+    """
+    Converts a value into its spool file representation.
+
+    Args:
+        value: The value to convert.
+
+    Returns:
+        str: The escaped text of the value.
+
+    """
+
+    if value is None:
+        return NULL_VALUE
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+
+    return str(value).translate(_ESCAPE_TABLE)
+
+
+def from_spool_value(field: str):
+    """
+    Converts a spool file field back into a value.
+
+    Args:
+        field (str): The escaped text of the value.
+
+    Returns:
+        str: The unescaped text of the value, or None for null values.
+
+    """
+
+    if field == NULL_VALUE:
+        return None
+    if '\\' not in field:
+        return field
+
+    output = []
+    chars = iter(field)
+    for char in chars:
+        if char == '\\':
+            escaped = next(chars, '')
+            output.append(_UNESCAPES.get(escaped, escaped))
+        else:
+            output.append(char)
+    return ''.join(output)
@@ -9,7 +9,22 @@ Classes:
 """
 
 
+import logging
+import os
+import re
+import threading
+import time
+from .bulk_loader import *
+from .import_planner import ImportPlanner
+from .index_advisor import IndexAdvisor
+from .materialized_reports import MaterializedReports
+from .metrics import Metrics
+from .prepared import PreparedStatementCache, RECONNECT_ERRORS, UNSENT_ERRORS
 from .query.builder import QueryBuilder
+from .report_cache import ReportCache
+from .schema_catalog import SchemaCatalog
+from .slow_query_log import SlowQueryLog
+from .transaction import TransactionManager
 from .table import *
 
 
@@ -18,29 +33,86 @@ class DataManager:
     A class for managing database operations.
 
     Attributes:
-        _connection: The connection object to the database.
+        MAX_PREPARED_PARAMS (int): The maximum number of placeholders in one prepared statement.
+        _connection: The connector providing database connections through checkout/checkin.
         _application: The application object associated with the DataManager instance.
+        _logger: The logger for errors which must not hide the error of the operation.
         database_name (str): The name of the database being managed.
         query_builder (QueryBuilder): An instance of the QueryBuilder class for constructing SQL queries.
-        _tables (list): A list of table names in the database.
+        _tables (list): A list of table names used until the schema catalog is loaded.
+        catalog (SchemaCatalog): The schema metadata loaded on connect.
+        import_planner (ImportPlanner): The planner ordering imported tables by their foreign keys.
+        stream_results (bool): Indicates whether selects and reports are streamed in chunks.
+        fetch_chunk_size (int): The number of rows fetched from the server at once when streaming.
+        insert_batch_rows (int): The maximum number of rows in one multi-row import insert.
+        _max_packet (int): The server max_allowed_packet size, loaded on first import.
+        page_size (int): The default number of rows on one page of a paged select.
+        prepared_statements (bool): Indicates whether CRUD and import statements run through prepared cursors.
+        prepared_cache_size (int): The maximum number of prepared statements kept per connection.
+        _prepared_caches (dict): Prepared statement caches keyed by connection id.
+        _prepared_lock (threading.Lock): Guards the prepared statement caches shared by pooled worker threads.
+        report_cache (ReportCache): The cache of report results, invalidated by writes into base tables.
+        _view_dependencies (dict): Base tables of each view, loaded on first use.
+        transactions (TransactionManager): The explicit transactions, holding one connection per thread.
+        commit_rows (int): The number of imported rows committed together, 0 commits every batch.
+        metrics (Metrics): The metrics of queries, reports and import stages.
+        slow_queries (SlowQueryLog): The log of statements slower than its threshold.
+        index_advisor (IndexAdvisor): The advisor recording predicates of selects and deletes.
+        materialized (MaterializedReports): The summary tables reports are read from, tracking changed base rows.
 
     """
 
-    def __init__(self, connection, database_name):
+    MAX_PREPARED_PARAMS = 65535
+
+    def __init__(self, connection, database_name, query_conf=None, cache_conf=None, metrics=None, slow_queries=None,
+                 logger=None):
         """
         Initializes a DataManager object with the provided connection and database name.
 
         Args:
             connection: The connection object to the database.
             database_name (str): The name of the database being managed.
+            query_conf (dict, optional): Query settings (stream_results, fetch_chunk_size, insert_batch_rows,
+                                         prepared_statements, prepared_cache_size, page_size, commit_rows).
+            cache_conf (dict, optional): Report cache settings (report_ttl, report_max_entries, report_max_rows,
+                                         materialize_reports, materialize_max_keys).
+            metrics (Metrics, optional): The metrics queries and imports are recorded into.
+            slow_queries (SlowQueryLog, optional): The log slow statements are recorded into, disabled if not given.
+            logger (optional): The logger for errors which must not hide the error of the operation.
 
         """
 
+        query_conf = query_conf or {}
+        cache_conf = cache_conf or {}
+
         self._connection = connection
         self._application = None
+        self._logger = logger or logging.getLogger(__name__)
         self.database_name = database_name
         self.query_builder = QueryBuilder()
         self._tables = ['owner', 'bidder', 'item', 'offer', 'winning offer', 'auction']
+        self.catalog = SchemaCatalog()
+        self.import_planner = ImportPlanner(self.catalog)
+        self.stream_results = query_conf.get('stream_results', False)
+        self.fetch_chunk_size = query_conf.get('fetch_chunk_size', 500)
+        self.insert_batch_rows = query_conf.get('insert_batch_rows', 500)
+        self._max_packet = None
+        self.prepared_statements = query_conf.get('prepared_statements', False)
+        self.prepared_cache_size = query_conf.get('prepared_cache_size', 64)
+        self.page_size = query_conf.get('page_size', 20)
+        self._prepared_caches = {}
+        self._prepared_lock = threading.Lock()
+        self.report_cache = ReportCache(cache_conf.get('report_ttl', 60),
+                                        cache_conf.get('report_max_entries', 16),
+                                        cache_conf.get('report_max_rows', 100000))
+        self._view_dependencies = {}
+        self.transactions = TransactionManager(connection, self._logger)
+        self.commit_rows = query_conf.get('commit_rows', 0)
+        self.metrics = metrics or Metrics()
+        self.slow_queries = slow_queries or SlowQueryLog(False)
+        self.index_advisor = IndexAdvisor()
+        self.materialized = MaterializedReports(cache_conf.get('materialize_reports', False),
+                                                cache_conf.get('materialize_max_keys', 10000))
 
     def set_application(self, application):
         """
@@ -55,18 +127,38 @@ class DataManager:
 
     def get_tables(self):
         """
-        Retrieves a list of table names in the database.
+        Retrieves a list of table names in the database which have an entity class.
 
         Returns:
             list: A list of table names.
 
         """
 
-        return self._tables
+        if not self.catalog.is_loaded:
+            return self._tables
+
+        tables = []
+        for table in self.catalog.get_tables():
+            table = table.replace('_', ' ')
+            if isinstance(globals().get(table.title().replace(' ', '')), type):
+                tables.append(table)
+        return tables
+
+    def is_pooled(self):
+        """
+        Checks whether the connector hands out separate pooled connections, so operations may run concurrently.
+
+        Returns:
+            bool: True if pool mode is enabled, False otherwise.
+
+        """
+
+        pool_conf = getattr(self._connection, 'pool_conf', None)
+        return bool(pool_conf and pool_conf['enabled'])
 
     def try_connection(self):
         """
-        Attempts to establish a connection to the database.
+        Attempts to establish a connection to the database and loads the schema catalog on first success.
 
         Returns:
             bool: True if the connection is successful, False otherwise.
@@ -74,11 +166,37 @@ class DataManager:
         """
 
         try:
-            if self._connection.get_connection() is not None:
-                return True
+            conn = self._connection.checkout()
         except:
             return False
 
+        self._connection.checkin(conn)
+        if conn is not None and not self.catalog.is_loaded:
+            try:
+                self.refresh_catalog()
+            except:
+                pass
+        return conn is not None
+
+    def refresh_catalog(self):
+        """
+        Loads the schema catalog from information_schema in one round-trip, falling back
+        to a query without view dependencies on servers not providing them.
+
+        """
+
+        params = [self.database_name] * 3
+        try:
+            rows = self.execute_query(SchemaCatalog.QUERY, params)
+            self.catalog.load(rows)
+        except:
+            rows = self.execute_query(SchemaCatalog.QUERY_WITHOUT_VIEW_USAGE, params[:2])
+            self.catalog.load(rows, False)
+
+        self._view_dependencies = {}
+        self.report_cache.clear()
+        self.materialized.invalidate()
+
     def get_class_attributes(self, class_name: str, operation: str, is_import: bool):
         """
         Retrieves the attributes of a specified class for a database operation.
@@ -103,7 +221,7 @@ class DataManager:
                     annotations.pop('identifier')
         return class_name, annotations
 
-    def make_operation(self, operation: str, user_data: list, class_name: str):
+    def make_operation(self, operation: str, user_data: list, class_name: str, stream: bool = False):
         """
         Executes a database operation based on the provided parameters.
 
@@ -111,9 +229,10 @@ class DataManager:
             operation (str): The database operation ('insert', 'delete', 'select', 'update').
             user_data (list): The data provided by the user for the operation.
             class_name (str): The name of the class associated with the operation.
+            stream (bool): Indicates whether the output is streamed in chunks instead of fetched at once.
 
         Returns:
-            list: The output of the executed query.
+            list: The output of the executed query, or a generator of row chunks when streaming.
 
         """
 
@@ -130,44 +249,188 @@ class DataManager:
         instance_object = class_object(*user_data,)
 
         query, data = query_selector[operation](instance_object)
+        if operation in ('select', 'delete'):
+            self.index_advisor.record(*self.query_builder.get_predicate_columns(instance_object))
+
+        if stream:
+            return self.stream_query(query, data)
+
+        table = self.get_table_name(class_name)
+        changed = None
+        if operation != 'select' and self.materialized.is_tracked(table):
+            changed = self.get_changed_rows(instance_object, operation)
+
+        output = self.execute_query(query, data, self.prepared_statements)
+        if operation != 'select':
+            self.report_cache.invalidate(table)
+        if changed is not None:
+            self.materialized.track(table, *changed, operation == 'insert')
+        return output
 
-        return self.execute_query(query, data)
+    def get_changed_rows(self, instance_object, operation: str):
+        """
+        Retrieves the rows a write of an object changes, tracked for the materialized reports.
+        Updated and deleted rows are selected before the write, updated rows are returned
+        with their old and new values.
+
+        Args:
+            instance_object: The entity object of the write.
+            operation (str): The write operation ('insert', 'delete', 'update').
+
+        Returns:
+            tuple: A tuple containing the column names and a list of changed rows in column order.
 
-    def execute_query(self, query: str, data: list):
+        """
+
+        _, keys, _ = self.query_builder.get_table_schema(instance_object)
+        values = instance_object.get_values()
+        if operation == 'insert':
+            return keys, [tuple(values)]
+
+        rows = [tuple(row) for row in self.execute_query(*self.query_builder.create_changed_select(instance_object, operation))]
+        if operation == 'update':
+            rows += [tuple(old if new is None else new for old, new in zip(row, values)) for row in rows]
+        return keys, rows
+
+    def get_table_name(self, class_name: str):
+        """
+        Converts the name of an entity class into the name of its table.
+
+        Args:
+            class_name (str): The name of the class, e.g. "WinningOffer".
+
+        Returns:
+            str: The name of the table, e.g. "winning_offer".
+
+        """
+
+        return re.sub(r'(?<!^)(?=[A-Z])', '_', class_name).lower()
+
+    def get_page(self, class_name: str, user_data: list, boundary_id: int, page_size: int, backwards: bool = False):
+        """
+        Retrieves one page of rows filtered by user data using keyset pagination on ID.
+        The filter is recorded for the index advisor once per browse, on the first page.
+
+        Args:
+            class_name (str): The name of the class associated with the operation.
+            user_data (list): The filter values provided by the user.
+            boundary_id (int): The last ID of the previous page (first ID when going backwards), None for the first page.
+            page_size (int): The maximum number of rows on the page.
+            backwards (bool): Indicates whether the page before the boundary ID is selected.
+
+        Returns:
+            list: The rows of the page ordered by ID.
+
+        """
+
+        class_object = globals().get(class_name)
+        instance_object = class_object(*user_data,)
+
+        query, data = self.query_builder.create_page_select(instance_object, boundary_id, page_size, backwards)
+        if boundary_id is None and not backwards:
+            self.index_advisor.record(*self.query_builder.get_predicate_columns(instance_object))
+        output = self.execute_query(query, data, self.prepared_statements)
+
+        if backwards:
+            output.reverse()
+        return output
+
+    def execute_query(self, query: str, data: list, prepared: bool = False):
         """
         Executes a SQL query.
 
         Args:
             query (str): The SQL query to execute.
             data (list): The data values to be used in the query.
+            prepared (bool): Indicates whether the query runs through a cached prepared cursor.
 
         Returns:
             list: The output of the executed query.
 
         """
 
-        conn = self._connection.get_connection()
-        cursor = conn.cursor()
+        with self.metrics.measure('query.execute', size=len(query)) as timer:
+            conn = self._acquire()
+            try:
+                if prepared:
+                    output = self.execute_prepared(conn, query, data, not self.transactions.is_active)
+                    self._commit(conn)
+                    timer.rows = len(output)
+                    return output
 
-        try:
-            cursor.execute(query, data)
-            output = cursor.fetchall()
-        except Exception as e:
-            raise Exception(str(e).split(':')[1].strip())
+                cursor = conn.cursor()
+
+                try:
+                    output = self.execute_statement(conn, cursor, query, data)
+                except Exception as e:
+                    raise Exception(str(e).split(':')[1].strip())
+
+                self._commit(conn)
+                cursor.close()
+            finally:
+                self._release(conn)
 
-        conn.commit()
-        cursor.close()
+            timer.rows = len(output)
 
         return output
 
-    def import_data(self, class_name: str, data: list, attributes: list):
+    def stream_query(self, query: str, data: list, chunk_size: int = None):
+        """
+        Executes a SQL query on an unbuffered cursor and yields the output in chunks,
+        so the whole result set is never held in memory.
+
+        Args:
+            query (str): The SQL query to execute.
+            data (list): The data values to be used in the query.
+            chunk_size (int, optional): The number of rows per chunk, defaults to fetch_chunk_size.
+
+        Yields:
+            list: A chunk of rows of the executed query.
+
         """
-        Imports data into the database.
+
+        chunk_size = chunk_size or self.fetch_chunk_size
+
+        conn = self._acquire()
+        try:
+            cursor = conn.cursor(buffered=False)
+
+            try:
+                start = time.perf_counter()
+                cursor.execute(query, data)
+                elapsed = time.perf_counter() - start
+                fetched = 0
+                while True:
+                    start = time.perf_counter()
+                    rows = cursor.fetchmany(chunk_size)
+                    elapsed += time.perf_counter() - start
+                    if not rows:
+                        break
+                    fetched += len(rows)
+                    yield rows
+                if self.slow_queries.is_slow(elapsed):
+                    self.log_slow_query(conn, query, data, fetched, elapsed)
+            except GeneratorExit:
+                conn.consume_results()
+                raise
+            except Exception as e:
+                conn.consume_results()
+                raise Exception(str(e).split(':')[1].strip())
+
+            self._commit(conn)
+            cursor.close()
+        finally:
+            self._release(conn)
+
+    def import_data(self, class_name: str, data: list, foreign_key_checks: bool = True):
+        """
+        Imports data into the database. Rows are turned into insert statements directly,
+        without building an entity object per row.
 
         Args:
             class_name (str): The name of the class associated with the data.
-            data (list): The data to be imported.
-            attributes (list): The attributes of the class associated with the data.
+            data (list): The rows to be imported, each a tuple of values in the column order of the class.
+            foreign_key_checks (bool): Indicates whether foreign keys are checked while inserting.
 
         Returns:
             bool: True if the import is successful, False otherwise.
@@ -175,41 +438,572 @@ class DataManager:
         """
 
         class_object = globals().get(class_name)
-        object_list = []
 
-        for entry in data:
-            new_entry = [entry[key] for key in attributes]
-            object_list.append(class_object(*new_entry,))
+        max_rows = self.insert_batch_rows
+        if self.prepared_statements:
+            max_rows = min(max_rows, self.MAX_PREPARED_PARAMS // len(class_object.FIELDS))
+        max_bytes = self.get_max_packet()
+        with self.metrics.measure('import.build', len(data)) as timer:
+            batches = self.query_builder.create_row_batches(class_object, data, max_rows, max_bytes)
+            timer.bytes = sum(len(query) for query, _ in batches)
 
-        query, values = self.query_builder.create_import_insert(object_list)
+        try:
+            with self.metrics.measure('import.execute', len(data), timer.bytes):
+                imported = self.execute_batch_queries(batches, self.prepared_statements, foreign_key_checks)
+            self.materialized.track(self.get_table_name(class_name), class_object.FIELDS, data, True, foreign_key_checks)
+            return imported
+        finally:
+            self.report_cache.invalidate(self.get_table_name(class_name))
+
+    def import_batches(self, class_name: str, batches, foreign_key_checks: bool = True, first_row: int = 1):
+        """
+        Imports batches of data in transactions committed every commit_rows rows. Inside a transaction
+        each batch starts at a savepoint, so a failed batch is rolled back alone and the import continues
+        with the next batch, while rows of earlier batches stay in the transaction. When the server rolled
+        back the whole transaction, e.g. on a deadlock, the savepoint is gone, so the error of the batch is
+        raised and a transaction owned by the import is rolled back. With commit_rows 0 every batch is
+        committed on its own, unless a transaction is already open.
 
-        return self.execute_multiple_query(query, values)
+        Args:
+            class_name (str): The name of the class associated with the data.
+            batches (iterable): An iterable of row batches to be imported, rows in the column order of the class.
+            foreign_key_checks (bool): Indicates whether foreign keys are checked while inserting.
+            first_row (int): The position of the first row in the imported file, used in failure reports.
+
+        Returns:
+            tuple: The number of imported rows and a list of (first row, last row, error) of failed batches.
+
+        Raises:
+            Exception: If the transaction was rolled back by the server or cannot be committed.
 
-    def execute_multiple_query(self, query: str, data: list):
         """
-        Executes multiple SQL queries.
+
+        imported = 0
+        failures = []
+        pending = 0
+        row = first_row
+        owns_transaction = bool(self.commit_rows) and not self.transactions.is_active
+
+        if owns_transaction:
+            self.begin_transaction(foreign_key_checks)
+        try:
+            for data in batches:
+                in_transaction = self.transactions.is_active
+                try:
+                    if in_transaction:
+                        self.transactions.savepoint()
+                    self.import_data(class_name, data, foreign_key_checks)
+                    imported += len(data)
+                    pending += len(data)
+                except Exception as e:
+                    if in_transaction:
+                        try:
+                            self.transactions.rollback_to_savepoint()
+                        except Exception:
+                            raise e from None
+                    failures.append((row, row + len(data) - 1, str(e)))
+                row += len(data)
+
+                if owns_transaction and pending >= self.commit_rows:
+                    self.commit_transaction()
+                    self.begin_transaction(foreign_key_checks)
+                    pending = 0
+        except Exception:
+            if owns_transaction and self.transactions.is_active:
+                try:
+                    self.rollback_transaction()
+                except Exception as e:
+                    self._logger.error('Rolling back the import transaction failed: %s', e)
+            raise
+
+        if owns_transaction:
+            self.commit_transaction()
+        return imported, failures
+
+    def bulk_import(self, class_name: str, batches, foreign_key_checks: bool = True):
+        """
+        Imports data into the database with LOAD DATA LOCAL INFILE. Batches are spooled into
+        a temporary tab separated file, which is loaded with one statement. When the server or
+        client does not allow local infile, the spooled rows are inserted in multi-row batches instead.
 
         Args:
-            query (str): The SQL query to execute.
-            data (list): The data values to be used in the queries.
+            class_name (str): The name of the class associated with the data.
+            batches (iterable): An iterable of row batches to be imported, rows in the column order of the class.
+            foreign_key_checks (bool): Indicates whether foreign keys are checked while loading.
+
+        Returns:
+            bool: True if the import is successful, False otherwise.
+
+        """
+
+        class_object = globals().get(class_name)
+        name, keys, _ = self.query_builder.get_class_schema(class_object)
+        spooled = False
+        spool = create_spool_file()
+
+        try:
+            with spool:
+                for data in batches:
+                    self.query_builder.validate_import_values(keys, data)
+                    for value in data:
+                        write_spool_row(spool, value)
+                    spooled = spooled or bool(data)
+                    self.materialized.track(self.get_table_name(class_name), keys, data, True, foreign_key_checks)
+
+            if not spooled:
+                return True
+
+            if not self.load_spool_file(spool.name, name, keys, foreign_key_checks):
+                for rows in read_spool_rows(spool.name, self.insert_batch_rows):
+                    queries = self.query_builder.build_insert_batches(class_object, rows, self.insert_batch_rows, self.get_max_packet())
+                    self.execute_batch_queries(queries, foreign_key_checks=foreign_key_checks)
+        finally:
+            os.remove(spool.name)
+            self.report_cache.invalidate(self.get_table_name(class_name))
+
+        return True
+
+    def load_spool_file(self, path: str, name: str, keys: list, foreign_key_checks: bool = True):
+        """
+        Loads a spool file into a table with LOAD DATA LOCAL INFILE.
+
+        Args:
+            path (str): The path to the spool file.
+            name (str): The name of the table.
+            keys (list): The column names of the table in spool file order.
+            foreign_key_checks (bool): Indicates whether foreign keys are checked while loading,
+                                       inside a transaction the setting of the transaction applies.
+
+        Returns:
+            bool: True if the file was loaded, False if local infile is not allowed.
+
+        """
+
+        query = (f'LOAD DATA LOCAL INFILE %s INTO TABLE {name} CHARACTER SET utf8mb4 '
+                 "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' "
+                 f'({", ".join(keys)});')
+
+        conn = self._acquire()
+        unchecked = not foreign_key_checks and conn is not self.transactions.connection
+        try:
+            if unchecked:
+                self.set_foreign_key_checks(conn, False)
+
+            cursor = conn.cursor()
+
+            try:
+                with self.metrics.measure('import.execute', size=os.path.getsize(path)):
+                    self.execute_statement(conn, cursor, query, [path.replace('\\', '/')], False)
+            except Exception as e:
+                self._rollback(conn)
+                if getattr(e, 'errno', None) in LOCAL_INFILE_ERRORS:
+                    return False
+                raise Exception(str(e).split(':')[1].strip())
+
+            self._commit(conn)
+            cursor.close()
+        finally:
+            if unchecked:
+                self.restore_foreign_key_checks(conn)
+            self._release(conn)
+
+        return True
+
+    def get_max_packet(self):
+        """
+        Retrieves the usable statement size from the server max_allowed_packet, leaving room
+        for value escaping and protocol overhead.
+
+        Returns:
+            int: The maximum size of one statement in bytes.
+
+        """
+
+        if self._max_packet is None:
+            output = self.execute_query('SELECT @@max_allowed_packet;', [])
+            self._max_packet = int(output[0][0])
+
+        return int(self._max_packet * 0.9)
+
+    def execute_batch_queries(self, batches: list, prepared: bool = False, foreign_key_checks: bool = True):
+        """
+        Executes several SQL queries on one connection and commits them together.
+
+        Args:
+            batches (list): A list of tuples containing the SQL query and its data values.
+            prepared (bool): Indicates whether the queries run through cached prepared cursors.
+            foreign_key_checks (bool): Indicates whether foreign keys are checked while the queries run,
+                                       inside a transaction the setting of the transaction applies.
 
         Returns:
             bool: True if the queries are executed successfully, False otherwise.
 
         """
 
-        conn = self._connection.get_connection()
+        conn = self._acquire()
+        unchecked = not foreign_key_checks and conn is not self.transactions.connection
+        try:
+            if unchecked:
+                self.set_foreign_key_checks(conn, False)
+
+            if prepared:
+                try:
+                    for query, data in batches:
+                        self.execute_prepared(conn, query, data, False)
+                except Exception:
+                    self._rollback(conn)
+                    raise
+
+                self._commit(conn)
+                return True
+
+            cursor = conn.cursor()
+
+            try:
+                for query, data in batches:
+                    self.execute_statement(conn, cursor, query, data, False)
+            except Exception as e:
+                self._rollback(conn)
+                raise Exception(str(e).split(':')[1].strip())
+
+            self._commit(conn)
+            cursor.close()
+        finally:
+            if unchecked:
+                self.restore_foreign_key_checks(conn)
+            self._release(conn)
+
+        return True
+
+    def set_foreign_key_checks(self, conn, enabled: bool):
+        """
+        Enables or disables foreign key checks for the session of a connection.
+
+        Args:
+            conn: The connection of the session.
+            enabled (bool): Indicates whether foreign keys are checked.
+
+        """
+
         cursor = conn.cursor()
+        try:
+            cursor.execute(f'SET FOREIGN_KEY_CHECKS = {1 if enabled else 0};')
+        except Exception as e:
+            raise Exception(str(e).split(':')[1].strip())
+        finally:
+            cursor.close()
+
+    def restore_foreign_key_checks(self, conn):
+        """
+        Enables foreign key checks again after an import, logging a failure instead of
+        raising it, so it does not hide the error of the import.
+
+        Args:
+            conn: The connection of the session.
+
+        """
+
+        try:
+            self.set_foreign_key_checks(conn, True)
+        except Exception as e:
+            self._logger.error('Enabling foreign key checks failed: %s', e)
+
+    def get_import_levels(self, tables):
+        """
+        Assigns every imported table a level in foreign key order, tables of one level
+        can be loaded concurrently once all lower levels are loaded.
+
+        Args:
+            tables (iterable): The names of the imported tables, e.g. "winning offer".
+
+        Returns:
+            dict: A dict mapping the given table names to levels starting at 0.
+
+        Raises:
+            Exception: If the foreign keys of the tables form a cycle.
+
+        """
+
+        names = {table.replace(' ', '_'): table for table in tables}
+        levels = self.import_planner.get_levels(names)
+        return {names[table]: level for table, level in levels.items()}
+
+    def verify_foreign_keys(self, table: str):
+        """
+        Counts rows of a table whose foreign key values have no referenced row, used after
+        loading with foreign key checks disabled.
+
+        Args:
+            table (str): The name of the table, e.g. "winning offer".
+
+        Returns:
+            list: A list of (column, referenced table, number of orphan rows) for violated foreign keys.
+
+        """
+
+        table = table.replace(' ', '_')
+        foreign_keys = self.import_planner.get_foreign_keys(table)
+        if not foreign_keys:
+            return []
+
+        output = self.execute_query(self.query_builder.create_orphan_check(table, foreign_keys), [])
+        return [(column, reference, int(count)) for column, reference, count in output if int(count) > 0]
+
+    def advise_indexes(self):
+        """
+        Proposes indexes for the predicates recorded by the index advisor. The indexes are loaded
+        from information_schema.STATISTICS, rows and distinct values of the predicate columns
+        are counted with one query per table.
+
+        Returns:
+            list: The index proposals ranked by score, highest first.
+
+        """
+
+        columns = self.index_advisor.get_columns()
+        if not columns:
+            return []
+
+        indexes = IndexAdvisor.load_indexes(self.execute_query(IndexAdvisor.STATISTICS_QUERY, [self.database_name]))
+        statistics = {}
+        for table, table_columns in columns.items():
+            output = self.execute_query(IndexAdvisor.create_distinct_query(table, table_columns), [])
+            statistics[table] = (int(output[0][0]), dict(zip(table_columns, (int(count) for count in output[0][1:]))))
+
+        return self.index_advisor.advise(indexes, statistics)
+
+    def create_index(self, proposal: dict):
+        """
+        Creates a proposed index.
+
+        Args:
+            proposal (dict): The index proposal returned by advise_indexes.
+
+        """
+
+        self.execute_query(proposal['statement'], [])
+
+    def begin_transaction(self, foreign_key_checks: bool = True):
+        """
+        Begins a transaction, queries of the current thread run on one held connection
+        and are not committed until the transaction ends. Imports inside the transaction
+        keep its foreign key checks setting.
+
+        Args:
+            foreign_key_checks (bool): Indicates whether foreign keys are checked until the transaction ends.
+
+        Raises:
+            Exception: If a transaction is already open.
+
+        """
+
+        self.transactions.begin(foreign_key_checks)
+
+    def commit_transaction(self):
+        """
+        Commits the open transaction and releases its connection.
+
+        Raises:
+            Exception: If no transaction is open or the commit fails.
+
+        """
+
+        self.transactions.commit()
+
+    def rollback_transaction(self):
+        """
+        Rolls back the open transaction and releases its connection.
+
+        Raises:
+            Exception: If no transaction is open or the rollback fails.
+
+        """
+
+        self.transactions.rollback()
+
+    def transaction(self):
+        """
+        Returns the transaction manager for use in a with statement, which commits
+        on success and rolls back on error.
+
+        Returns:
+            TransactionManager: The transaction manager.
+
+        """
+
+        return self.transactions
+
+    def _acquire(self):
+        """
+        Returns the connection of the open transaction, or checks out a connection.
+
+        Returns:
+            connection: The connection to execute queries on.
+
+        """
+
+        conn = self.transactions.connection
+        return conn if conn is not None else self._connection.checkout()
+
+    def _release(self, conn):
+        """
+        Returns a connection to the connector unless it is held by the open transaction.
+
+        Args:
+            conn: The connection to release.
+
+        """
+
+        if conn is not self.transactions.connection:
+            self._connection.checkin(conn)
+
+    def _commit(self, conn):
+        """
+        Commits a connection unless it is held by the open transaction.
+
+        Args:
+            conn: The connection to commit.
+
+        """
+
+        if conn is not self.transactions.connection:
+            conn.commit()
+
+    def _rollback(self, conn):
+        """
+        Rolls back a connection unless it is held by the open transaction, which is
+        rolled back by its owner.
+
+        Args:
+            conn: The connection to roll back.
+
+        """
+
+        if conn is not self.transactions.connection:
+            conn.rollback()
+
+    def execute_prepared(self, conn, query: str, data: list, retry: bool):
+        """
+        Executes a SQL query through the prepared cursor cached for the connection and SQL text.
+        When the connection was lost or the server forgot the statement, the cache of the
+        connection is dropped so statements are prepared again, and the query is retried once
+        after reconnecting if retry is allowed. Writes are retried only when the error was raised
+        before the statement reached the server, a connection lost during a write may have applied it.
+
+        Args:
+            conn: The connection to execute the query on.
+            query (str): The SQL query to execute.
+            data (list): The data values to be used in the query.
+            retry (bool): Indicates whether the query may be retried, only safe outside of a larger transaction.
+
+        Returns:
+            list: The output of the executed query.
+
+        """
+
+        with self._prepared_lock:
+            cache = self._prepared_caches.get(id(conn))
+            if cache is None or cache.connection is not conn:
+                for key, stale in list(self._prepared_caches.items()):
+                    if stale.connection is not conn and not stale.connection.is_connected():
+                        self._prepared_caches.pop(key, None)
+                cache = PreparedStatementCache(conn, self.prepared_cache_size)
+                self._prepared_caches[id(conn)] = cache
 
         try:
-            cursor.executemany(query, data)
+            cursor = cache.get_cursor(query)
+            return self.execute_statement(conn, cursor, query, data)
         except Exception as e:
+            errno = getattr(e, 'errno', None)
+            if errno not in RECONNECT_ERRORS:
+                raise Exception(str(e).split(':')[1].strip())
+            cache.clear()
+            if not retry or (errno not in UNSENT_ERRORS and query.lstrip()[:6].upper() != 'SELECT'):
+                raise Exception(str(e).split(':')[1].strip())
+
+        try:
+            if not conn.is_connected():
+                conn.reconnect(attempts=1)
+            cursor = cache.get_cursor(query)
+            return self.execute_statement(conn, cursor, query, data)
+        except Exception as e:
+            cache.clear()
             raise Exception(str(e).split(':')[1].strip())
 
-        conn.commit()
-        cursor.close()
+    def execute_statement(self, conn, cursor, query: str, data, fetch: bool = True):
+        """
+        Executes one SQL statement on a cursor, timing it for the slow query log.
+
+        Args:
+            conn: The connection of the cursor, used to explain a slow statement.
+            cursor: The cursor to execute the statement on.
+            query (str): The SQL statement to execute.
+            data (list): The data values to be used in the statement.
+            fetch (bool): Indicates whether the output of the statement is fetched.
 
-        return True
+        Returns:
+            list: The output of the statement, empty if not fetched or the statement returned no rows.
+
+        """
+
+        start = time.perf_counter()
+        cursor.execute(query, data)
+        output = cursor.fetchall() if fetch and cursor.with_rows else []
+        elapsed = time.perf_counter() - start
+
+        if self.slow_queries.is_slow(elapsed):
+            self.log_slow_query(conn, query, data, len(output) if output else cursor.rowcount, elapsed)
+        return output
+
+    def log_slow_query(self, conn, query: str, data, rows: int, seconds: float):
+        """
+        Records a slow statement in the slow query log, with its plan if the statement is explained.
+        Explain statements run on the connection of the statement, so they see its transaction.
+
+        Args:
+            conn: The connection the statement ran on.
+            query (str): The SQL statement.
+            data (list): The data values of the statement.
+            rows (int): The number of returned or affected rows.
+            seconds (float): The run time of the statement in seconds.
+
+        """
+
+        plan = None
+        explain_queries = self.slow_queries.get_explain_queries(query)
+        if explain_queries:
+            plan = self.explain_query(conn, explain_queries, data)
+
+        self.slow_queries.record(query, len(data) if data else 0, rows, seconds, plan)
+
+    def explain_query(self, conn, explain_queries: list, data):
+        """
+        Runs the first explain statement the server supports.
+
+        Args:
+            conn: The connection to run the explain statements on.
+            explain_queries (list): The explain statements in order of preference.
+            data (list): The data values of the explained statement.
+
+        Returns:
+            list: A dict per plan row keyed by column name, or a dict with the error if no statement succeeded.
+
+        """
+
+        error = None
+        cursor = conn.cursor()
+        try:
+            for explain_query in explain_queries:
+                try:
+                    cursor.execute(explain_query, data)
+                    columns = [column[0] for column in cursor.description]
+                    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+                except Exception as e:
+                    error = str(e)
+        finally:
+            cursor.close()
+
+        return [{'error': error}]
 
     def get_views(self):
         """
@@ -220,20 +1014,25 @@ class DataManager:
 
         """
 
-        conn = self._connection.get_connection()
-        cursor = conn.cursor()
+        if self.catalog.is_loaded:
+            return [view.replace('_', ' ') for view in self.catalog.get_views()]
 
         query = f'SELECT TABLE_NAME FROM information_schema.VIEWS WHERE TABLE_SCHEMA = %s;'
 
+        conn = self._acquire()
         try:
-            cursor.execute(query, [self.database_name])
-            output = cursor.fetchall()
-            output = [str(line[0]).replace('_', ' ') for line in output]
-        except Exception as e:
-            raise Exception(str(e).split(':')[1].strip())
+            cursor = conn.cursor()
+
+            try:
+                output = self.execute_statement(conn, cursor, query, [self.database_name])
+                output = [str(line[0]).replace('_', ' ') for line in output]
+            except Exception as e:
+                raise Exception(str(e).split(':')[1].strip())
 
-        conn.commit()
-        cursor.close()
+            self._commit(conn)
+            cursor.close()
+        finally:
+            self._release(conn)
 
         return output
 
@@ -249,22 +1048,139 @@ class DataManager:
 
         """
 
-        conn = self._connection.get_connection()
-        cursor = conn.cursor()
+        cached = self.report_cache.get(report)
+        if cached is not None:
+            self.metrics.record('report.cached', 0.0, len(cached[1]))
+            return cached
 
         headers = f'DESCRIBE {report};'
         query = f'SELECT * FROM {report};'
+        headers_output = self.catalog.get_columns(report)
+        if self.materialized.is_materialized(report) and self.refresh_materialized(report):
+            query = self.materialized.create_report_query(report)
 
-        try:
-            cursor.execute(headers)
-            headers_output = [column[0] for column in cursor.fetchall()]
+        with self.metrics.measure('report.get') as timer:
+            conn = self._acquire()
+            try:
+                cursor = conn.cursor()
 
-            cursor.execute(query)
-            output = cursor.fetchall()
-        except Exception as e:
-            raise Exception(str(e).split(':')[1].strip())
+                try:
+                    if headers_output is None:
+                        headers_output = [column[0] for column in self.execute_statement(conn, cursor, headers, None)]
+
+                    output = self.execute_statement(conn, cursor, query, None)
+                except Exception as e:
+                    raise Exception(str(e).split(':')[1].strip())
+
+                self._commit(conn)
+                cursor.close()
+            finally:
+                self._release(conn)
+
+            timer.rows = len(output)
 
-        conn.commit()
-        cursor.close()
+        self.report_cache.put(report, headers_output, output, self.get_view_dependencies(report))
 
         return headers_output, output
+
+    def get_view_dependencies(self, view: str):
+        """
+        Retrieves the base tables a view depends on.
+
+        Args:
+            view (str): The name of the view.
+
+        Returns:
+            set: A set of lowercase table names, or None if the server does not provide view dependencies.
+
+        """
+
+        if self.catalog.is_loaded:
+            return self.catalog.get_view_dependencies(view)
+
+        if view not in self._view_dependencies:
+            query = ('SELECT TABLE_NAME FROM information_schema.VIEW_TABLE_USAGE '
+                     'WHERE VIEW_SCHEMA = %s AND VIEW_NAME = %s;')
+            try:
+                output = self.execute_query(query, [self.database_name, view])
+                self._view_dependencies[view] = {str(line[0]).lower() for line in output}
+            except:
+                self._view_dependencies[view] = None
+
+        return self._view_dependencies[view]
+
+    def stream_report(self, report: str):
+        """
+        Retrieves a report from the database with the data streamed in chunks.
+
+        Args:
+            report (str): The name of the report to retrieve.
+
+        Returns:
+            tuple: A tuple containing the headers and a generator of data chunks of the report.
+
+        """
+
+        cached = self.report_cache.get(report)
+        if cached is not None:
+            headers_output, output = cached
+            chunks = (output[index:index + self.fetch_chunk_size] for index in range(0, len(output), self.fetch_chunk_size))
+            return headers_output, chunks
+
+        headers = f'DESCRIBE {report};'
+        query = f'SELECT * FROM {report};'
+        if self.materialized.is_materialized(report) and self.refresh_materialized(report):
+            query = self.materialized.create_report_query(report)
+
+        headers_output = self.catalog.get_columns(report)
+        if headers_output is None:
+            headers_output = [column[0] for column in self.execute_query(headers, [])]
+
+        return headers_output, self.stream_query(query, [])
+
+    def refresh_materialized(self, report: str, rebuild: bool = False):
+        """
+        Brings the summary table of a materialized report up to date. Summary rows depending on tracked
+        changes are deleted and inserted again in one transaction, a stale summary table is rebuilt.
+        Inside an open explicit transaction nothing is refreshed, as a rebuild runs DDL statements which
+        would commit it. Pending changes are kept for the next refresh, a forced rebuild is postponed,
+        and the report is read from the view on the connection of the transaction unless the summary
+        table is up to date. A failed refresh, e.g. without the privilege to create tables, is logged
+        and the summary table stays stale, so the report is read from the view.
+
+        Args:
+            report (str): The name of the report.
+            rebuild (bool): Indicates whether the summary table is rebuilt even without tracked changes.
+
+        Returns:
+            bool: True if the summary table is up to date, False if the report must be read from the view.
+
+        """
+
+        if self.transactions.is_active:
+            if rebuild:
+                self.materialized.set_stale(report)
+            return self.materialized.is_current(report)
+
+        with self.materialized.refresh_lock:
+            changes = self.materialized.take(report)
+            if changes is None and not rebuild:
+                return True
+
+            rebuild = rebuild or changes[0]
+
+            if rebuild:
+                queries = self.materialized.create_rebuild_queries(report)
+            else:
+                queries = self.materialized.create_refresh_queries(report, changes[1])
+
+            try:
+                with self.metrics.measure('report.rebuild' if rebuild else 'report.refresh'):
+                    self.execute_batch_queries(queries)
+            except Exception as e:
+                self.materialized.set_stale(report)
+                self._logger.error('%s of summary table of "%s" failed, reading the view: %s',
+                                   'Rebuild' if rebuild else 'Refresh', report, e)
+                return False
+
+        return True
@@ -0,0 +1,112 @@
+"""
+Import Planner Module
+
+This module defines the ImportPlanner class ordering imported tables by their foreign keys.
+
+Classes:
+    ImportPlanner: A planner ordering tables so referenced tables are loaded first.
+
+"""
+
+
+class ImportPlanner:
+    """
+    A planner ordering tables so referenced tables are loaded first. Dependencies are read
+    from the schema catalog, DEFAULT_FOREIGN_KEYS is used until the catalog is loaded.
+
+    Attributes:
+        DEFAULT_FOREIGN_KEYS (dict): Foreign keys of the auction schema keyed by table name.
+        _catalog (SchemaCatalog): The schema catalog providing foreign keys.
+
+    Methods:
+        get_foreign_keys(table): Returns the foreign keys of a table.
+        get_levels(tables): Assigns every table a level, tables of one level do not reference each other.
+        order_tables(tables): Returns tables in topological order.
+
+    """
+
+    DEFAULT_FOREIGN_KEYS = {
+        'item': {'OWNER_ID': ('owner', 'ID')},
+        'auction': {'ITEM_ID': ('item', 'ID')},
+        'offer': {'AUCTION_ID': ('auction', 'ID'), 'BIDDER_ID': ('bidder', 'ID')},
+        'winning_offer': {'OFFER_ID': ('offer', 'ID')}
+    }
+
+    def __init__(self, catalog):
+        """
+        Initializes the ImportPlanner instance.
+
+        Args:
+            catalog (SchemaCatalog): The schema catalog providing foreign keys.
+
+        """
+
+        self._catalog = catalog
+
+    def get_foreign_keys(self, table: str):
+        """
+        Returns the foreign keys of a table.
+
+        Args:
+            table (str): The name of the table, e.g. "winning_offer".
+
+        Returns:
+            dict: A dict mapping column names to (referenced table, referenced column).
+
+        """
+
+        if self._catalog.is_loaded:
+            return self._catalog.get_foreign_keys(table) or {}
+        return dict(self.DEFAULT_FOREIGN_KEYS.get(table, {}))
+
+    def get_levels(self, tables):
+        """
+        Assigns every table a level, so each table only references tables of lower levels.
+        Only references between the given tables are considered, rows of other tables
+        are expected to be in the database already. Self references are ignored.
+
+        Args:
+            tables (iterable): The names of the imported tables.
+
+        Returns:
+            dict: A dict mapping table names to levels starting at 0.
+
+        Raises:
+            Exception: If the foreign keys of the tables form a cycle.
+
+        """
+
+        tables = set(tables)
+        dependencies = {table: {reference for reference, _ in self.get_foreign_keys(table).values()
+                                if reference in tables and reference != table}
+                        for table in tables}
+
+        levels = {}
+        while len(levels) < len(tables):
+            ready = [table for table in tables if table not in levels
+                     and all(reference in levels for reference in dependencies[table])]
+            if not ready:
+                cycle = ', '.join(sorted(table for table in tables if table not in levels))
+                raise Exception(f'Foreign keys of tables {cycle} form a cycle')
+            for table in ready:
+                levels[table] = max((levels[reference] + 1 for reference in dependencies[table]), default=0)
+
+        return levels
+
+    def order_tables(self, tables):
+        """
+        Returns tables in topological order, referenced tables first.
+
+        Args:
+            tables (iterable): The names of the imported tables.
+
+        Returns:
+            list: The table names ordered by level and name.
+
+        Raises:
+            Exception: If the foreign keys of the tables form a cycle.
+
+        """
+
+        levels = self.get_levels(tables)
+        return sorted(levels, key=lambda table: (levels[table], table))
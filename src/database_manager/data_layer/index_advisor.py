@@ -0,0 +1,262 @@
+"""
+Index Advisor Module
+
+This module defines the IndexAdvisor class proposing indexes for the predicates used at runtime.
+
+Classes:
+    IndexAdvisor: A class recording predicate column sets and proposing composite indexes for them.
+
+"""
+
+
+import threading
+
+
+class IndexAdvisor:
+    """
+    A class recording predicate column sets and proposing composite indexes for them. Selects and deletes
+    filter by equality on any combination of not null columns, every combination is counted per table.
+    Proposals are estimated from the indexes in information_schema.STATISTICS and the number of rows and
+    distinct values of the predicate columns, assuming independent columns:
+
+    - rows matched by a predicate: table rows / product of distinct values of its columns
+    - rows read today: table rows / product of distinct values of the longest index prefix bound by the predicate
+      (one row for a fully bound unique index, all rows without a usable index)
+
+    A proposed index holds the predicate columns, most selective first. Its score is the number of uses
+    times the rows it saves per use, predicates already served by an index are not proposed.
+    A proposal whose columns are a prefix of another proposal of the table is merged into it.
+
+    Attributes:
+        STATISTICS_QUERY (str): The query loading the indexes of the database.
+        PREFIX (str): The prefix of proposed index names.
+        MAX_NAME_LENGTH (int): The maximum length of an index name.
+        _predicates (dict): The number of uses keyed by (table, predicate columns).
+        _lock (threading.Lock): Guards the predicates.
+
+    Methods:
+        record(table, columns): Records one use of a predicate.
+        get_predicates(): Returns the recorded predicates.
+        get_columns(): Returns the predicate columns of every table.
+        reset(): Drops all recorded predicates.
+        load_indexes(rows): Groups the rows of the statistics query into indexes.
+        create_distinct_query(table, columns): Creates a query counting rows and distinct values of columns.
+        advise(indexes, statistics): Returns index proposals ranked by score.
+        estimate_rows(rows, distinct, columns): Estimates the number of rows matched by equality on columns.
+        estimate_read_rows(rows, distinct, columns, index): Estimates the number of rows read through an index.
+
+    """
+
+    STATISTICS_QUERY = ('SELECT TABLE_NAME, INDEX_NAME, NON_UNIQUE, COLUMN_NAME, SEQ_IN_INDEX '
+                        'FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = %s '
+                        'ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX;')
+    PREFIX = 'IX_'
+    MAX_NAME_LENGTH = 64
+
+    def __init__(self):
+        """
+        Initializes an IndexAdvisor without recorded predicates.
+
+        """
+
+        self._predicates = {}
+        self._lock = threading.Lock()
+
+    def record(self, table: str, columns: tuple):
+        """
+        Records one use of a predicate, predicates without columns are ignored.
+
+        Args:
+            table (str): The name of the table, e.g. "OFFER".
+            columns (tuple): The predicate columns in table order, e.g. ("AMOUNT", "BIDDER_ID").
+
+        """
+
+        if not columns:
+            return
+
+        key = (table.upper(), tuple(columns))
+        with self._lock:
+            self._predicates[key] = self._predicates.get(key, 0) + 1
+
+    def get_predicates(self):
+        """
+        Returns the recorded predicates.
+
+        Returns:
+            dict: The number of uses keyed by (table, predicate columns).
+
+        """
+
+        with self._lock:
+            return dict(self._predicates)
+
+    def get_columns(self):
+        """
+        Returns the predicate columns of every table.
+
+        Returns:
+            dict: Lists of column names keyed by table name.
+
+        """
+
+        columns = {}
+        for table, predicate in self.get_predicates():
+            table_columns = columns.setdefault(table, [])
+            table_columns.extend(column for column in predicate if column not in table_columns)
+        return columns
+
+    def reset(self):
+        """
+        Drops all recorded predicates.
+
+        """
+
+        with self._lock:
+            self._predicates = {}
+
+    @staticmethod
+    def load_indexes(rows: list):
+        """
+        Groups the rows of the statistics query into indexes.
+
+        Args:
+            rows (list): The rows returned by STATISTICS_QUERY, ordered by table, index and position.
+
+        Returns:
+            dict: Lists of (index name, is unique, column names) keyed by uppercase table name.
+
+        """
+
+        indexes = {}
+        for table, index, non_unique, column, _ in rows:
+            table_indexes = indexes.setdefault(str(table).upper(), {})
+            entry = table_indexes.setdefault(str(index), (str(index), not int(non_unique), []))
+            entry[2].append(str(column).upper())
+
+        return {table: list(table_indexes.values()) for table, table_indexes in indexes.items()}
+
+    @staticmethod
+    def create_distinct_query(table: str, columns: list):
+        """
+        Creates a query counting the rows of a table and the distinct values of columns.
+
+        Args:
+            table (str): The name of the table.
+            columns (list): The column names.
+
+        Returns:
+            str: The query returning one row, the number of rows followed by a distinct count per column.
+
+        """
+
+        return f'SELECT COUNT(*), {", ".join(f"COUNT(DISTINCT {column})" for column in columns)} FROM {table};'
+
+    def advise(self, indexes: dict, statistics: dict):
+        """
+        Returns index proposals for the recorded predicates ranked by score, highest first.
+
+        Args:
+            indexes (dict): The indexes of every table, as returned by load_indexes.
+            statistics (dict): (number of rows, distinct values keyed by column) keyed by table name.
+
+        Returns:
+            list: A dict per proposal with table, columns, uses, predicates, table_rows, rows_now, rows,
+                  score, name and statement.
+
+        """
+
+        proposals = {}
+        for (table, predicate), uses in self.get_predicates().items():
+            if table not in statistics:
+                continue
+            rows, distinct = statistics[table]
+            table_indexes = indexes.get(table, [])
+
+            columns = tuple(sorted(predicate, key=lambda column: (-distinct.get(column, 1), predicate.index(column))))
+            matched = self.estimate_rows(rows, distinct, columns)
+            read = min(self.estimate_read_rows(rows, distinct, set(columns), index) for index in table_indexes) \
+                if table_indexes else float(rows)
+            if read <= matched:
+                continue
+
+            proposal = proposals.get((table, columns))
+            if proposal is None:
+                proposal = proposals[(table, columns)] = {
+                    'table': table, 'columns': columns, 'uses': 0, 'predicates': 0, 'table_rows': rows,
+                    'rows_now': 0.0, 'rows': matched, 'score': 0.0
+                }
+            proposal['rows_now'] = max(proposal['rows_now'], read)
+            proposal['uses'] += uses
+            proposal['predicates'] += 1
+            proposal['score'] += uses * (read - matched)
+
+        merged = set()
+        for table, columns in sorted(proposals, key=lambda key: len(key[1])):
+            for other_table, other_columns in proposals:
+                if other_table == table and len(other_columns) > len(columns) \
+                        and other_columns[:len(columns)] == columns:
+                    proposal, other = proposals[(table, columns)], proposals[(other_table, other_columns)]
+                    other['uses'] += proposal['uses']
+                    other['predicates'] += proposal['predicates']
+                    other['score'] += proposal['score']
+                    merged.add((table, columns))
+                    break
+
+        ranked = []
+        for (table, columns), proposal in proposals.items():
+            if (table, columns) in merged:
+                continue
+            proposal['name'] = f'{self.PREFIX}{table}_{"_".join(columns)}'[:self.MAX_NAME_LENGTH]
+            proposal['statement'] = f'CREATE INDEX {proposal["name"]} ON {table} ({", ".join(columns)});'
+            ranked.append(proposal)
+
+        return sorted(ranked, key=lambda proposal: proposal['score'], reverse=True)
+
+    @staticmethod
+    def estimate_rows(rows: int, distinct: dict, columns):
+        """
+        Estimates the number of rows matched by equality on columns, assuming independent columns.
+
+        Args:
+            rows (int): The number of rows of the table.
+            distinct (dict): The number of distinct values keyed by column.
+            columns (iterable): The column names.
+
+        Returns:
+            float: The estimated number of rows, at least one for a table with rows.
+
+        """
+
+        estimate = float(rows)
+        for column in columns:
+            estimate /= max(distinct.get(column, 1), 1)
+        return max(estimate, min(rows, 1.0))
+
+    @classmethod
+    def estimate_read_rows(cls, rows: int, distinct: dict, columns: set, index: tuple):
+        """
+        Estimates the number of rows read through an index for equality on columns, using the longest
+        index prefix bound by the columns.
+
+        Args:
+            rows (int): The number of rows of the table.
+            distinct (dict): The number of distinct values keyed by column.
+            columns (set): The predicate column names.
+            index (tuple): The index, (index name, is unique, column names).
+
+        Returns:
+            float: The estimated number of read rows, all rows if the index is not usable.
+
+        """
+
+        _, is_unique, index_columns = index
+        prefix = []
+        for column in index_columns:
+            if column not in columns:
+                break
+            prefix.append(column)
+
+        if is_unique and len(prefix) == len(index_columns):
+            return min(rows, 1.0)
+        return cls.estimate_rows(rows, distinct, prefix)
@@ -0,0 +1,420 @@
+"""
+Materialized Reports Module
+
+This module defines the MaterializedReports class storing report (view) results in summary tables.
+
+Classes:
+    MaterializedReports: A class tracking changed base rows and creating the statements refreshing summary tables.
+
+"""
+
+
+import threading
+
+
+class MaterializedReports:
+    """
+    A class tracking changed base rows and creating the statements refreshing summary tables.
+    Each materialized view is stored in a table named PREFIX + view, holding the view columns and
+    hidden key columns (starting with "_") with the IDs of the base rows every summary row is made of.
+    Aggregated views are stored one level finer than the view, per bidder and auction, so the report
+    only sums a few rows per group and its run time no longer depends on the number of offers.
+
+    Writes done through the DataManager are tracked as keys of the changed base rows. A refresh deletes
+    the summary rows holding one of the keys and inserts them again from the base tables, restricted
+    to the same keys. Rows whose keys are unknown, too many keys, and the first report of a session
+    (changes of other clients are not tracked) make the view stale, which is refreshed by a full
+    rebuild into a new table swapped in with one RENAME TABLE.
+
+    Attributes:
+        PREFIX (str): The prefix of summary table names.
+        DEFINITIONS (dict): The materialized views keyed by view name, each a dict with:
+            columns (tuple): (column, expression) of the view columns in view order.
+            keys (tuple): (key column, expression) of the hidden key columns.
+            source (str): The joined base tables.
+            group_by (str): The grouping of the summary rows, None if not aggregated.
+            report (str): The query reading the view from the summary table, {table} is its name.
+            tracked (dict): {key column: base column} keyed by base table, mapping a changed base row
+                            to the keys of the summary rows depending on it.
+        enabled (bool): Indicates whether reports are read from summary tables.
+        max_keys (int): The maximum number of tracked keys per view, more make the view stale.
+        chunk_size (int): The maximum number of keys refreshed by one statement.
+        _pending (dict): Sets of tracked keys keyed by key columns, keyed by view name.
+        _stale (set): The names of views to be rebuilt.
+        _lock (threading.Lock): Guards the tracked changes.
+        refresh_lock (threading.Lock): Serializes refreshes, so a report never reads a table being created.
+
+    Methods:
+        is_materialized(view): Checks whether a view is read from its summary table.
+        is_tracked(table): Checks whether changes of a base table are tracked.
+        get_table(view): Returns the name of the summary table of a view.
+        track(table, columns, rows, inserted, foreign_key_checks): Records changed rows of a base table.
+        invalidate(table): Makes the views depending on a table stale.
+        set_stale(view): Makes a view stale.
+        is_current(view): Checks whether the summary table of a view has no pending changes.
+        take(view): Returns and drops the tracked changes of a view.
+        get_status(): Returns the refresh state of every materialized view.
+        create_select(view, where): Creates the query computing summary rows from the base tables.
+        create_report_query(view): Creates the query reading a view from its summary table.
+        create_rebuild_queries(view): Creates the statements rebuilding a summary table.
+        create_refresh_queries(view, changes): Creates the statements refreshing summary rows of tracked keys.
+
+    """
+
+    PREFIX = 'mv_'
+    DEFINITIONS = {
+        'auction_winners': {
+            'columns': (('SURNAME', 'bidder.SURNAME'),
+                        ('LAST_NAME', 'bidder.LAST_NAME'),
+                        ('AMOUNT', 'offer.AMOUNT'),
+                        ('AUCTION_DESCRIPTION', 'auction.AUCTION_DESCRIPTION'),
+                        ('ITEM_NAME', 'item.ITEM_NAME'),
+                        ('ITEM_DESCRIPTION', 'item.ITEM_DESCRIPTION'),
+                        ('OFFER_DATE', 'offer.OFFER_DATE')),
+            'keys': (('_OFFER_ID', 'offer.ID'),
+                     ('_AUCTION_ID', 'auction.ID'),
+                     ('_ITEM_ID', 'item.ID'),
+                     ('_BIDDER_ID', 'bidder.ID')),
+            'source': ('offer JOIN winning_offer ON winning_offer.OFFER_ID = offer.ID '
+                       'JOIN auction ON auction.ID = offer.AUCTION_ID '
+                       'JOIN item ON item.ID = auction.ITEM_ID '
+                       'JOIN bidder ON bidder.ID = offer.BIDDER_ID'),
+            'group_by': None,
+            'report': ('SELECT SURNAME, LAST_NAME, AMOUNT, AUCTION_DESCRIPTION, ITEM_NAME, ITEM_DESCRIPTION, OFFER_DATE '
+                       'FROM {table} ORDER BY SURNAME, LAST_NAME;'),
+            'tracked': {
+                'offer': {'_OFFER_ID': 'ID'},
+                'winning_offer': {'_OFFER_ID': 'OFFER_ID'},
+                'auction': {'_AUCTION_ID': 'ID'},
+                'item': {'_ITEM_ID': 'ID'},
+                'bidder': {'_BIDDER_ID': 'ID'}
+            }
+        },
+        'offer_counts_by_bidder': {
+            'columns': (('AUCTION_DESCRIPTION', 'auction.AUCTION_DESCRIPTION'),
+                        ('AUCTION_TYPE', 'auction.AUCTION_TYPE'),
+                        ('SURNAME', 'bidder.SURNAME'),
+                        ('LAST_NAME', 'bidder.LAST_NAME'),
+                        ('OFFERS_COUNT', 'COUNT(offer.BIDDER_ID)'),
+                        ('ITEM_NAME', 'item.ITEM_NAME')),
+            'keys': (('_BIDDER_ID', 'bidder.ID'),
+                     ('_AUCTION_ID', 'auction.ID'),
+                     ('_ITEM_ID', 'item.ID')),
+            'source': ('offer JOIN auction ON auction.ID = offer.AUCTION_ID '
+                       'JOIN item ON item.ID = auction.ITEM_ID '
+                       'JOIN bidder ON bidder.ID = offer.BIDDER_ID'),
+            'group_by': 'bidder.ID, auction.ID, item.ID',
+            'report': ('SELECT AUCTION_DESCRIPTION, AUCTION_TYPE, SURNAME, LAST_NAME, '
+                       'CAST(SUM(OFFERS_COUNT) AS SIGNED) AS OFFERS_COUNT, ITEM_NAME FROM {table} '
+                       'GROUP BY SURNAME, LAST_NAME, AUCTION_DESCRIPTION, AUCTION_TYPE, ITEM_NAME;'),
+            'tracked': {
+                'offer': {'_BIDDER_ID': 'BIDDER_ID', '_AUCTION_ID': 'AUCTION_ID'},
+                'auction': {'_AUCTION_ID': 'ID'},
+                'item': {'_ITEM_ID': 'ID'},
+                'bidder': {'_BIDDER_ID': 'ID'}
+            }
+        }
+    }
+
+    def __init__(self, enabled: bool = False, max_keys: int = 10000, chunk_size: int = 1000):
+        """
+        Initializes the MaterializedReports instance, every view is stale until its first rebuild.
+
+        Args:
+            enabled (bool): Indicates whether reports are read from summary tables.
+            max_keys (int): The maximum number of tracked keys per view, more make the view stale.
+            chunk_size (int): The maximum number of keys refreshed by one statement.
+
+        """
+
+        self.enabled = enabled
+        self.max_keys = max_keys
+        self.chunk_size = chunk_size
+        self._pending = {view: {} for view in self.DEFINITIONS}
+        self._stale = set(self.DEFINITIONS)
+        self._lock = threading.Lock()
+        self.refresh_lock = threading.Lock()
+
+    def is_materialized(self, view: str):
+        """
+        Checks whether a view is read from its summary table.
+
+        Args:
+            view (str): The name of the view, e.g. "auction_winners".
+
+        Returns:
+            bool: True if the view is materialized, False otherwise.
+
+        """
+
+        return self.enabled and view.lower() in self.DEFINITIONS
+
+    def is_tracked(self, table: str):
+        """
+        Checks whether changes of a base table are tracked.
+
+        Args:
+            table (str): The name of the table, e.g. "offer".
+
+        Returns:
+            bool: True if a materialized view depends on the table, False otherwise.
+
+        """
+
+        table = table.lower()
+        return self.enabled and any(table in definition['tracked'] for definition in self.DEFINITIONS.values())
+
+    def get_table(self, view: str):
+        """
+        Returns the name of the summary table of a view.
+
+        Args:
+            view (str): The name of the view.
+
+        Returns:
+            str: The name of the summary table, e.g. "mv_auction_winners".
+
+        """
+
+        return self.PREFIX + view.lower()
+
+    def track(self, table: str, columns: list, rows, inserted: bool = False, foreign_key_checks: bool = True):
+        """
+        Records changed rows of a base table as keys of the summary rows depending on them. A row inserted
+        with foreign keys checked and an unknown ID is not referenced by any other row yet, so keys taken
+        from its ID are skipped. Without the checks, orphan rows may already reference the generated ID,
+        so the view is made stale instead.
+
+        Args:
+            table (str): The name of the table, e.g. "offer".
+            columns (list): The column names of the rows, e.g. ["ID", "AMOUNT", ...].
+            rows (iterable): The changed rows, old and new values of updated rows, each a tuple in column order.
+            inserted (bool): Indicates whether the rows were inserted.
+            foreign_key_checks (bool): Indicates whether foreign keys were checked while inserting.
+
+        """
+
+        if not self.enabled:
+            return
+
+        table = table.lower()
+        columns = [column.upper() for column in columns]
+        rows = rows if isinstance(rows, list) else list(rows)
+
+        with self._lock:
+            for view, definition in self.DEFINITIONS.items():
+                mapping = definition['tracked'].get(table)
+                if mapping is None or view in self._stale:
+                    continue
+
+                key_columns = tuple(mapping)
+                indexes = [columns.index(mapping[key_column]) if mapping[key_column] in columns else None
+                           for key_column in key_columns]
+                keys = self._pending[view].setdefault(key_columns, set())
+
+                for row in rows:
+                    key = tuple(row[index] if index is not None else None for index in indexes)
+                    if None in key:
+                        if inserted and foreign_key_checks and all(mapping[key_column] == 'ID' for key_column, value
+                                            in zip(key_columns, key) if value is None):
+                            continue
+                        self._set_stale(view)
+                        break
+                    keys.add(key)
+
+                if view not in self._stale and sum(len(keys) for keys in self._pending[view].values()) > self.max_keys:
+                    self._set_stale(view)
+
+    def invalidate(self, table: str = None):
+        """
+        Makes the views depending on a table stale, used for changes whose rows are unknown.
+
+        Args:
+            table (str, optional): The name of the changed table, all views are made stale if not given.
+
+        """
+
+        with self._lock:
+            for view, definition in self.DEFINITIONS.items():
+                if table is None or table.lower() in definition['tracked']:
+                    self._set_stale(view)
+
+    def set_stale(self, view: str):
+        """
+        Makes a view stale, so it is rebuilt on its next refresh.
+
+        Args:
+            view (str): The name of the view.
+
+        """
+
+        with self._lock:
+            self._set_stale(view.lower())
+
+    def is_current(self, view: str):
+        """
+        Checks whether the summary table of a view has no pending changes and is not stale.
+
+        Args:
+            view (str): The name of the view.
+
+        Returns:
+            bool: True if the summary table is up to date, False otherwise.
+
+        """
+
+        view = view.lower()
+        with self._lock:
+            return view not in self._stale and not any(self._pending[view].values())
+
+    def take(self, view: str):
+        """
+        Returns and drops the tracked changes of a view. The caller makes the view stale
+        if the refresh fails.
+
+        Args:
+            view (str): The name of the view.
+
+        Returns:
+            tuple: A tuple containing whether the view must be rebuilt and the tracked keys keyed by key columns,
+                   or None if the summary table is up to date.
+
+        """
+
+        view = view.lower()
+        with self._lock:
+            if view in self._stale:
+                self._stale.discard(view)
+                self._pending[view] = {}
+                return True, {}
+
+            changes = {key_columns: keys for key_columns, keys in self._pending[view].items() if keys}
+            self._pending[view] = {}
+            return (False, changes) if changes else None
+
+    def get_status(self):
+        """
+        Returns the refresh state of every materialized view.
+
+        Returns:
+            list: A tuple per view with its name, summary table, whether it is stale and the number of tracked keys.
+
+        """
+
+        with self._lock:
+            return [(view, self.get_table(view), view in self._stale,
+                     sum(len(keys) for keys in self._pending[view].values()))
+                    for view in self.DEFINITIONS]
+
+    def create_select(self, view: str, where: str = None):
+        """
+        Creates the query computing summary rows of a view from the base tables.
+
+        Args:
+            view (str): The name of the view.
+            where (str, optional): The condition restricting the base rows.
+
+        Returns:
+            str: The select query, without a terminating semicolon.
+
+        """
+
+        definition = self.DEFINITIONS[view.lower()]
+        query = (f'SELECT {", ".join(f"{expression} AS {column}" for column, expression in definition["columns"] + definition["keys"])} '
+                 f'FROM {definition["source"]}')
+        if where:
+            query += f' WHERE {where}'
+        if definition['group_by']:
+            query += f' GROUP BY {definition["group_by"]}'
+        return query
+
+    def create_report_query(self, view: str):
+        """
+        Creates the query reading a view from its summary table.
+
+        Args:
+            view (str): The name of the view.
+
+        Returns:
+            str: The report query returning the view columns in view order.
+
+        """
+
+        return self.DEFINITIONS[view.lower()]['report'].format(table=self.get_table(view))
+
+    def create_rebuild_queries(self, view: str):
+        """
+        Creates the statements rebuilding a summary table. The rows are computed into a new table
+        indexed on the key columns, which replaces the old table with one atomic RENAME TABLE,
+        so reports keep reading the old rows during the rebuild.
+
+        Args:
+            view (str): The name of the view.
+
+        Returns:
+            list: A list of tuples containing the SQL statement and its data values.
+
+        """
+
+        table = self.get_table(view)
+        definition = self.DEFINITIONS[view.lower()]
+        indexes = ', '.join(f'INDEX ({column})' for column, _ in definition['keys'])
+
+        return [
+            (f'DROP TABLE IF EXISTS {table}_new, {table}_old;', []),
+            (f'CREATE TABLE {table}_new ({indexes}) {self.create_select(view)};', []),
+            (f'CREATE TABLE IF NOT EXISTS {table} LIKE {table}_new;', []),
+            (f'RENAME TABLE {table} TO {table}_old, {table}_new TO {table};', []),
+            (f'DROP TABLE {table}_old;', [])
+        ]
+
+    def create_refresh_queries(self, view: str, changes: dict):
+        """
+        Creates the statements refreshing the summary rows of tracked keys, a delete and an insert
+        per chunk of keys, e.g. "DELETE FROM mv_auction_winners WHERE _OFFER_ID IN (%s, %s);".
+
+        Args:
+            view (str): The name of the view.
+            changes (dict): Sets of keys keyed by key columns, as returned by take.
+
+        Returns:
+            list: A list of tuples containing the SQL statement and its data values.
+
+        """
+
+        table = self.get_table(view)
+        definition = self.DEFINITIONS[view.lower()]
+        expressions = dict(definition['keys'])
+        columns = ', '.join(column for column, _ in definition['columns'] + definition['keys'])
+
+        queries = []
+        for key_columns, keys in changes.items():
+            keys = list(keys)
+            if len(key_columns) == 1:
+                target, source, placeholder = key_columns[0], expressions[key_columns[0]], '%s'
+            else:
+                target = f'({", ".join(key_columns)})'
+                source = f'({", ".join(expressions[column] for column in key_columns)})'
+                placeholder = f'({", ".join("%s" for _ in key_columns)})'
+
+            for index in range(0, len(keys), self.chunk_size):
+                chunk = keys[index:index + self.chunk_size]
+                values = [value for key in chunk for value in key]
+                condition = f'IN ({", ".join(placeholder for _ in chunk)})'
+                queries.append((f'DELETE FROM {table} WHERE {target} {condition};', values))
+                queries.append((f'INSERT INTO {table} ({columns}) {self.create_select(view, f"{source} {condition}")};',
+                                list(values)))
+
+        return queries
+
+    def _set_stale(self, view: str):
+        """
+        Makes a view stale and drops its tracked keys, the caller must hold the lock.
+
+        Args:
+            view (str): The name of the view.
+
+        """
+
+        self._stale.add(view)
+        self._pending[view] = {}
@@ -0,0 +1,316 @@
+"""
+Metrics Module
+
+This module defines classes recording latencies, row counts and bytes of instrumented operations.
+
+Classes:
+    Metrics: A registry of operation metrics, periodically written to the log as JSON.
+    Histogram: A latency histogram with fixed buckets and counters of one operation.
+    Timer: A context manager recording one run of an operation.
+
+"""
+
+
+import json
+import threading
+import time
+from bisect import bisect_left
+
+
+class Histogram:
+    """
+    A latency histogram with fixed buckets and counters of one operation.
+
+    Attributes:
+        BUCKETS (tuple): The upper bounds of the buckets in milliseconds, the last bucket is unbounded.
+        buckets (list): The number of runs in each bucket.
+        count (int): The number of runs.
+        errors (int): The number of runs which raised an exception.
+        total (float): The total run time in seconds.
+        max (float): The longest run time in seconds.
+        rows (int): The number of processed rows.
+        bytes (int): The number of processed bytes.
+
+    Methods:
+        add(seconds, rows, size, error): Records one run.
+        get_percentile(quantile): Estimates a percentile of run times from the buckets.
+        to_dict(): Returns the counters and percentiles.
+
+    """
+
+    BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+    def __init__(self):
+        """
+        Initializes an empty Histogram.
+
+        """
+
+        self.buckets = [0] * (len(self.BUCKETS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.bytes = 0
+
+    def add(self, seconds: float, rows: int = 0, size: int = 0, error: bool = False):
+        """
+        Records one run.
+
+        Args:
+            seconds (float): The run time in seconds.
+            rows (int): The number of processed rows.
+            size (int): The number of processed bytes.
+            error (bool): Indicates whether the run raised an exception.
+
+        """
+
+        self.buckets[bisect_left(self.BUCKETS, seconds * 1000)] += 1
+        self.count += 1
+        self.errors += error
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.rows += rows
+        self.bytes += size
+
+    def get_percentile(self, quantile: float):
+        """
+        Estimates a percentile of run times as the upper bound of the bucket containing it,
+        limited by the longest run.
+
+        Args:
+            quantile (float): The quantile, e.g. 0.95.
+
+        Returns:
+            float: The estimated run time in milliseconds, 0 without runs.
+
+        """
+
+        if not self.count:
+            return 0.0
+
+        rank = quantile * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank and count:
+                bound = self.BUCKETS[index] if index < len(self.BUCKETS) else float('inf')
+                return min(bound, self.max * 1000)
+        return self.max * 1000
+
+    def to_dict(self):
+        """
+        Returns the counters, percentiles and non-empty buckets.
+
+        Returns:
+            dict: The metrics of the operation, times in milliseconds.
+
+        """
+
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'total_ms': round(self.total * 1000, 3),
+            'avg_ms': round(self.total * 1000 / self.count, 3) if self.count else 0.0,
+            'p50_ms': round(self.get_percentile(0.5), 3),
+            'p95_ms': round(self.get_percentile(0.95), 3),
+            'p99_ms': round(self.get_percentile(0.99), 3),
+            'max_ms': round(self.max * 1000, 3),
+            'rows': self.rows,
+            'bytes': self.bytes,
+            'buckets': {str(self.BUCKETS[index]) if index < len(self.BUCKETS) else 'inf': count
+                        for index, count in enumerate(self.buckets) if count}
+        }
+
+
+class Timer:
+    """
+    A context manager recording one run of an operation. Rows and bytes may be set
+    while the operation runs, a run raising an exception is counted as an error.
+
+    Attributes:
+        metrics (Metrics): The metrics the run is recorded into.
+        name (str): The name of the operation.
+        rows (int): The number of processed rows.
+        bytes (int): The number of processed bytes.
+        start (float): The start of the run.
+
+    """
+
+    __slots__ = ('metrics', 'name', 'rows', 'bytes', 'start')
+
+    def __init__(self, metrics, name: str, rows: int = 0, size: int = 0):
+        """
+        Initializes the Timer instance.
+
+        Args:
+            metrics (Metrics): The metrics the run is recorded into.
+            name (str): The name of the operation.
+            rows (int): The number of processed rows.
+            size (int): The number of processed bytes.
+
+        """
+
+        self.metrics = metrics
+        self.name = name
+        self.rows = rows
+        self.bytes = size
+        self.start = 0.0
+
+    def __enter__(self):
+        """
+        Starts measuring the run.
+
+        Returns:
+            Timer: The timer.
+
+        """
+
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Records the run.
+
+        Args:
+            exc_type: The type of the raised exception, None if none was raised.
+            exc_value: The raised exception.
+            traceback: The traceback of the raised exception.
+
+        Returns:
+            bool: False, exceptions are always propagated.
+
+        """
+
+        self.metrics.record(self.name, time.perf_counter() - self.start, self.rows, self.bytes, exc_type is not None)
+        return False
+
+
+class Metrics:
+    """
+    A registry of operation metrics. Every operation has a latency histogram with counters of runs,
+    errors, rows and bytes, kept since start or the last reset. The metrics are written to the log
+    as one JSON line every log_interval seconds, checked whenever a run is recorded.
+
+    Attributes:
+        LOG_PREFIX (str): The prefix of metrics log lines.
+        enabled (bool): Indicates whether runs are recorded.
+        log_interval (int): Seconds between metrics log lines, 0 disables logging.
+        _logger: The logger metrics are written to.
+        _histograms (dict): The histograms keyed by operation name.
+        _lock (threading.Lock): Guards the histograms.
+        _started (float): The time of start or the last reset.
+        _logged (float): The time of the last metrics log line.
+
+    Methods:
+        measure(name, rows, size): Returns a context manager recording one run of an operation.
+        record(name, seconds, rows, size, error): Records one run of an operation.
+        snapshot(): Returns the metrics of all operations.
+        reset(): Drops all metrics.
+        flush(): Writes the metrics to the log.
+
+    """
+
+    LOG_PREFIX = 'METRICS'
+
+    def __init__(self, enabled: bool = True, log_interval: int = 60, logger=None):
+        """
+        Initializes the Metrics instance.
+
+        Args:
+            enabled (bool): Indicates whether runs are recorded.
+            log_interval (int): Seconds between metrics log lines, 0 disables logging.
+            logger (optional): The logger metrics are written to.
+
+        """
+
+        self.enabled = enabled
+        self.log_interval = log_interval
+        self._logger = logger
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self._started = time.time()
+        self._logged = time.monotonic()
+
+    def measure(self, name: str, rows: int = 0, size: int = 0):
+        """
+        Returns a context manager recording one run of an operation.
+
+        Args:
+            name (str): The name of the operation, e.g. "query.execute".
+            rows (int): The number of processed rows, may be set on the returned timer.
+            size (int): The number of processed bytes, may be set on the returned timer.
+
+        Returns:
+            Timer: The context manager.
+
+        """
+
+        return Timer(self, name, rows, size)
+
+    def record(self, name: str, seconds: float, rows: int = 0, size: int = 0, error: bool = False):
+        """
+        Records one run of an operation and writes the metrics to the log when the interval elapsed.
+
+        Args:
+            name (str): The name of the operation.
+            seconds (float): The run time in seconds.
+            rows (int): The number of processed rows.
+            size (int): The number of processed bytes.
+            error (bool): Indicates whether the run raised an exception.
+
+        """
+
+        if not self.enabled:
+            return
+
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.add(seconds, rows, size, error)
+            is_due = self.log_interval and time.monotonic() - self._logged >= self.log_interval
+            if is_due:
+                self._logged = time.monotonic()
+
+        if is_due:
+            self.flush()
+
+    def snapshot(self):
+        """
+        Returns the metrics of all operations.
+
+        Returns:
+            dict: The metrics keyed by operation name, sorted by name.
+
+        """
+
+        with self._lock:
+            return {name: self._histograms[name].to_dict() for name in sorted(self._histograms)}
+
+    def reset(self):
+        """
+        Drops all metrics.
+
+        """
+
+        with self._lock:
+            self._histograms = {}
+            self._started = time.time()
+
+    def flush(self):
+        """
+        Writes the metrics to the log as one JSON line, e.g. METRICS {"since": ..., "metrics": {...}}.
+
+        """
+
+        self._logged = time.monotonic()
+        if self._logger is None:
+            return
+
+        metrics = self.snapshot()
+        if metrics:
+            line = {'since': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self._started)), 'metrics': metrics}
+            self._logger.info('%s %s', self.LOG_PREFIX, json.dumps(line, separators=(',', ':')))
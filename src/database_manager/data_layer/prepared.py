@@ -0,0 +1,112 @@
+"""
+Prepared Statement Cache Module
+
+This module defines a per-connection cache of prepared cursors.
+
+Classes:
+    PreparedStatementCache: A least recently used cache of prepared cursors bound to one connection.
+
+Constants:
+    RECONNECT_ERRORS (tuple): Error numbers signalling a lost connection or a lost prepared statement.
+    UNSENT_ERRORS (tuple): Reconnect errors raised before the statement reached the server, so it did not run.
+
+"""
+
+
+from collections import OrderedDict
+
+
+RECONNECT_ERRORS = (1243, 2006, 2013, 2055)
+UNSENT_ERRORS = (1243, 2006)
+
+
+class PreparedStatementCache:
+    """
+    A least recently used cache of prepared cursors bound to one connection. Each cursor keeps
+    its statement prepared on the server, so executing the same SQL text again skips parsing.
+
+    Attributes:
+        connection: The connection the cursors belong to.
+        max_size (int): The maximum number of prepared statements kept open.
+        _cursors (OrderedDict): Prepared cursors keyed by SQL text, least recently used first.
+
+    Methods:
+        get_cursor(query): Returns the prepared cursor for a SQL text.
+        clear(): Closes all cached cursors.
+
+    """
+
+    def __init__(self, connection, max_size):
+        """
+        Initializes the PreparedStatementCache for a connection.
+
+        Args:
+            connection: The connection the cursors belong to.
+            max_size (int): The maximum number of prepared statements kept open.
+
+        """
+
+        self.connection = connection
+        self.max_size = max_size
+        self._cursors = OrderedDict()
+
+    def get_cursor(self, query: str):
+        """
+        Returns the prepared cursor for a SQL text, creating it and evicting the least
+        recently used cursor if the cache is full.
+
+        Args:
+            query (str): The SQL text.
+
+        Returns:
+            cursor: A prepared cursor of the connection.
+
+        """
+
+        cursor = self._cursors.get(query)
+        if cursor is not None:
+            self._cursors.move_to_end(query)
+            return cursor
+
+        if len(self._cursors) >= self.max_size:
+            _, evicted = self._cursors.popitem(last=False)
+            self._close_cursor(evicted)
+
+        cursor = self.connection.cursor(prepared=True)
+        self._cursors[query] = cursor
+        return cursor
+
+    def clear(self):
+        """
+        Closes all cached cursors, their statements are prepared again on next use.
+
+        """
+
+        for cursor in self._cursors.values():
+            self._close_cursor(cursor)
+        self._cursors.clear()
+
+    def __len__(self):
+        """
+        Returns the number of cached prepared statements.
+
+        Returns:
+            int: The number of cached prepared statements.
+
+        """
+
+        return len(self._cursors)
+
+    def _close_cursor(self, cursor):
+        """
+        Closes a cursor, ignoring errors of already broken connections.
+
+        Args:
+            cursor: The cursor to close.
+
+        """
+
+        try:
+            cursor.close()
+        except:
+            pass
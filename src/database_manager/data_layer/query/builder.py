@@ -2,6 +2,7 @@
 Query Builder
 
 This module provides a class for dynamically constructing SQL queries based on object attributes.
+Generated statements are cached per entity class, operation and mask of not null columns.
 
 Classes:
     QueryBuilder: A class for dynamically constructing SQL queries.
@@ -9,18 +10,35 @@ Classes:
 """
 
 
+import re
+
+
 class QueryBuilder:
     """
     A class for dynamically constructing SQL queries based on object attributes.
 
+    Attributes:
+        _schemas (dict): Table name, column names and ID index cached per entity class.
+        _statements (dict): SQL statements cached per (entity class, operation, not null column mask or number of rows).
+        cache_hits (int): The number of statements served from the cache.
+        cache_misses (int): The number of statements built and stored in the cache.
+
     Methods:
-        get_schema(data: object) -> tuple: Extracts the schema information from the given object.
-        get_schema_values(data: list) -> list: Extracts the schema values from a list of objects.
-        create_import_insert(data: list) -> tuple: Creates an import insert query for a list of objects.
+        get_table_schema(data: object) -> tuple: Returns the cached table name, column names and ID index of an object.
+        get_class_schema(entity_class: type) -> tuple: Returns the cached table name, column names and ID index of an entity class.
+        get_statement(key: tuple, build: callable) -> str: Returns a cached statement, building it on first use.
+        get_cache_stats() -> dict: Returns the statement cache counters.
+        get_predicate_columns(data: object) -> tuple: Returns the table name and the columns a select or delete filters by.
+        create_row_batches(entity_class: type, rows: list, max_rows: int, max_bytes: int) -> list: Creates multi-row insert queries for rows in column order.
+        build_insert_batches(entity_class: type, values: list, max_rows: int, max_bytes: int) -> list: Splits rows into multi-row insert queries.
+        validate_import_values(keys: list, values: list): Checks that each imported row has at least one not null value.
         create_insert(data: object) -> tuple: Creates an insert query for a single object.
         create_delete(data: object) -> tuple: Creates a delete query for a single object.
         create_select(data: object) -> tuple: Creates a select query for a single object.
+        create_changed_select(data: object, operation: str) -> tuple: Creates a select query for the rows an update or delete changes.
         create_update(data: object) -> tuple: Creates an update query for a single object.
+        create_page_select(data: object, boundary_id: int, page_size: int, backwards: bool) -> tuple: Creates a keyset paginated select query.
+        create_orphan_check(table: str, foreign_keys: dict) -> str: Creates a query counting rows with dangling foreign keys.
         id_is_not_null(values: list, id_index: int) -> bool: Checks if the ID attribute is not null.
         are_not_all_none(values: list, id_index: int) -> bool: Checks if at least one attribute (except ID) is not null.
 
@@ -28,74 +46,191 @@ class QueryBuilder:
 
     def __init__(self):
         """
-        Initializes the QueryBuilder instance.
+        Initializes the QueryBuilder instance with an empty statement cache.
 
         """
 
-        pass
+        self._schemas = {}
+        self._statements = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
 
-    def get_schema(self, data: object):
+    def get_table_schema(self, data: object):
         """
-        Extracts the schema information from the given object.
+        Returns the table name, column names and ID index of an object, computed once per entity class.
 
         Args:
             data (object): The object from which to extract schema information.
 
         Returns:
-            tuple: A tuple containing the object name, attribute names (keys), and attribute values.
+            tuple: A tuple containing the object name, attribute names (keys) and the index of the ID attribute.
+
+        """
+
+        return self.get_class_schema(type(data))
+
+    def get_class_schema(self, entity_class: type):
+        """
+        Returns the table name, column names and ID index of an entity class, computed once per class.
+        The table name is the class name in upper snake case, e.g. "WINNING_OFFER".
+
+        Args:
+            entity_class (type): The entity class.
+
+        Returns:
+            tuple: A tuple containing the table name, column names (keys) and the index of the ID column.
 
         """
 
-        name = type(data).__name__.upper()
-        params = vars(data)
-        keys = [key.upper() for key in params.keys()]
-        values = list(params.values())
-        return name, keys, values
+        schema = self._schemas.get(entity_class)
+        if schema is None:
+            keys = [key.upper() for key in entity_class.FIELDS]
+            name = re.sub(r'(?<!^)(?=[A-Z])', '_', entity_class.__name__).upper()
+            schema = (name, keys, keys.index('ID'))
+            self._schemas[entity_class] = schema
+        return schema
 
-    def get_schema_values(self, data: list):
+    def get_statement(self, key: tuple, build):
         """
-        Extracts the schema values from a list of objects.
+        Returns a cached statement, building it on first use.
 
         Args:
-            data (list): A list of objects from which to extract schema values.
+            key (tuple): The cache key, (entity class, operation, not null column mask or number of rows).
+            build (callable): A function building the statement on cache miss.
+
+        Returns:
+            str: The SQL statement.
+
+        """
+
+        query = self._statements.get(key)
+        if query is None:
+            self.cache_misses += 1
+            query = build()
+            self._statements[key] = query
+        else:
+            self.cache_hits += 1
+        return query
+
+    def get_predicate_columns(self, data: object):
+        """
+        Returns the table name and the columns a select or delete of an object filters by.
+
+        Args:
+            data (object): The object whose not null values are used as filters.
+
+        Returns:
+            tuple: A tuple containing the table name and the filtered column names in table order.
+
+        """
+
+        name, keys, _ = self.get_table_schema(data)
+        return name, tuple(key for key, value in zip(keys, data.get_values()) if value is not None)
+
+    def get_cache_stats(self):
+        """
+        Returns the statement cache counters.
 
         Returns:
-            list: A list containing the schema values for each object in the input list.
+            dict: A dict containing cache hits, misses and the number of cached statements.
 
         """
 
-        final_vals = []
-        for value in data:
-            params = vars(value)
-            final_vals.append(list(params.values()))
-        return final_vals
+        return {'hits': self.cache_hits, 'misses': self.cache_misses, 'size': len(self._statements)}
 
-    def create_import_insert(self, data: list):
+    def create_row_batches(self, entity_class: type, rows: list, max_rows: int, max_bytes: int):
         """
-        Creates an import insert query for a list of objects.
+        Creates multi-row insert queries for rows already in column order, without building entity objects.
 
         Args:
-            data (list): A list of objects for which to create the import insert query.
+            entity_class (type): The entity class of the rows.
+            rows (list): A list of rows, each a tuple of values in the order of entity_class.FIELDS.
+            max_rows (int): The maximum number of rows in one statement.
+            max_bytes (int): The maximum estimated size of one statement in bytes.
 
         Returns:
-            tuple: A tuple containing the import insert query and the corresponding values.
+            list: A list of tuples containing a multi-row insert query and its flattened values.
 
         Raises:
             Exception: If at least one value must be not null in each object.
 
         """
 
-        name, keys, _ = self.get_schema(data[0])
-        values = self.get_schema_values(data)
-        id_index = keys.index('ID')
+        _, keys, _ = self.get_class_schema(entity_class)
+        self.validate_import_values(keys, rows)
+
+        return self.build_insert_batches(entity_class, rows, max_rows, max_bytes)
+
+    def build_insert_batches(self, entity_class: type, values: list, max_rows: int, max_bytes: int):
+        """
+        Splits rows into multi-row insert queries without validating them. The statement size is
+        estimated from the UTF-8 encoded values, doubled for escaping, so text with multi-byte
+        characters stays below max_allowed_packet.
+
+        Args:
+            entity_class (type): The entity class of the rows.
+            values (list): A list of rows, each a list of values in column order.
+            max_rows (int): The maximum number of rows in one statement.
+            max_bytes (int): The maximum estimated size of one statement in bytes.
+
+        Returns:
+            list: A list of tuples containing a multi-row insert query and its flattened values.
+
+        """
+
+        name, keys, _ = self.get_class_schema(entity_class)
+        prefix = f'INSERT INTO {name}({", ".join(key for key in keys)}) VALUES '
+        row_template = f'({", ".join("%s" for _ in keys)})'
+
+        def statement(rows):
+            return self.get_statement((entity_class, 'import', rows),
+                                      lambda: f'{prefix}{", ".join(row_template for _ in range(rows))};')
+
+        batches = []
+        batch_values = []
+        batch_rows = 0
+        batch_bytes = len(prefix)
 
         for value in values:
-            if not self.id_is_not_null(value, id_index) and not self.are_not_all_none(value, id_index):
-                raise Exception('At least one value must be not null in each object')
+            row_bytes = len(row_template) + 2 + sum(len(str(item).encode()) * 2 + 2 for item in value)
+            if batch_rows and (batch_rows >= max_rows or batch_bytes + row_bytes > max_bytes):
+                batches.append((statement(batch_rows), batch_values))
+                batch_values = []
+                batch_rows = 0
+                batch_bytes = len(prefix)
+            batch_values.extend(value)
+            batch_rows += 1
+            batch_bytes += row_bytes
+
+        if batch_rows:
+            batches.append((statement(batch_rows), batch_values))
+
+        return batches
+
+    def validate_import_values(self, keys: list, values: list):
+        """
+        Checks that each imported row has a valid ID or at least one not null value. The whole batch
+        is checked at once, counting the nulls of each row instead of testing every value.
 
-        query = f'INSERT INTO {name}({", ".join(key for key in keys)}) VALUES ({", ".join("%s" for _ in keys)});'
+        Args:
+            keys (list): The column names of the table.
+            values (list): A list of rows, each a list or tuple of values in column order.
 
-        return query, values
+        Raises:
+            Exception: If at least one value must be not null in each object.
+
+        """
+
+        id_index = keys.index('ID')
+        other_columns = len(keys) - 1
+
+        for value in values:
+            identifier = value[id_index]
+            if identifier is None:
+                if value.count(None) > other_columns:
+                    raise Exception('At least one value must be not null in each object')
+            elif identifier < 0 and value.count(None) >= other_columns:
+                raise Exception('At least one value must be not null in each object')
 
     def create_insert(self, data: object):
         """
@@ -112,13 +247,14 @@ class QueryBuilder:
 
         """
 
-        name, keys, values = self.get_schema(data)
-        id_index = keys.index('ID')
+        name, keys, id_index = self.get_table_schema(data)
+        values = data.get_values()
 
         if not self.are_not_all_none(values, id_index):
             raise Exception('At least one value must be not null')
 
-        query = f'INSERT INTO {name}({", ".join(keys[index] for index in range(len(keys))if index != id_index)}) VALUES ({", ".join("%s" for index in range(len(keys)) if index != id_index)});'
+        query = self.get_statement((type(data), 'insert', None),
+                                   lambda: f'INSERT INTO {name}({", ".join(keys[index] for index in range(len(keys))if index != id_index)}) VALUES ({", ".join("%s" for index in range(len(keys)) if index != id_index)});')
         values = [values[index] for index in range(len(values)) if index != id_index]
 
         return query, values
@@ -138,13 +274,15 @@ class QueryBuilder:
 
         """
 
-        name, keys, values = self.get_schema(data)
-        id_index = keys.index('ID')
+        name, keys, id_index = self.get_table_schema(data)
+        values = data.get_values()
 
         if not self.id_is_not_null(values, id_index) and not self.are_not_all_none(values, id_index):
             raise Exception('At least one value must be not null')
 
-        query = f'DELETE FROM {name} WHERE {" AND ".join(keys[index] + " = %s" for index in range(len(keys)) if values[index] is not None)};'
+        mask = tuple(value is not None for value in values)
+        query = self.get_statement((type(data), 'delete', mask),
+                                   lambda: f'DELETE FROM {name} WHERE {" AND ".join(keys[index] + " = %s" for index in range(len(keys)) if mask[index])};')
         values = [value for value in values if value is not None]
 
         return query, values
@@ -161,17 +299,41 @@ class QueryBuilder:
 
         """
 
-        name, keys, values = self.get_schema(data)
-        id_index = keys.index('ID')
+        name, keys, id_index = self.get_table_schema(data)
+        values = data.get_values()
 
         if not self.id_is_not_null(values, id_index) and not self.are_not_all_none(values, id_index):
-            query = f'SELECT * FROM {name};'
+            query = self.get_statement((type(data), 'select', None), lambda: f'SELECT * FROM {name};')
         else:
-            query = f'SELECT * FROM {name} WHERE {" AND ".join(keys[index] + " = %s" for index in range(len(keys)) if values[index] is not None)};'
+            mask = tuple(value is not None for value in values)
+            query = self.get_statement((type(data), 'select', mask),
+                                       lambda: f'SELECT * FROM {name} WHERE {" AND ".join(keys[index] + " = %s" for index in range(len(keys)) if mask[index])};')
         values = [value for value in values if value is not None]
 
         return query, values
 
+    def create_changed_select(self, data: object, operation: str):
+        """
+        Creates a select query for the rows an update or delete of a single object changes,
+        run before the write to capture the old values.
+
+        Args:
+            data (object): The object of the update or delete.
+            operation (str): The write operation ('update' or 'delete').
+
+        Returns:
+            tuple: A tuple containing the select query and the corresponding values.
+
+        """
+
+        if operation != 'update':
+            return self.create_select(data)
+
+        name, _, id_index = self.get_table_schema(data)
+        query = self.get_statement((type(data), 'changed', None), lambda: f'SELECT * FROM {name} WHERE ID = %s;')
+
+        return query, [data.get_values()[id_index]]
+
     def create_update(self, data: object):
         """
         Creates an update query for a single object.
@@ -187,8 +349,8 @@ class QueryBuilder:
 
         """
 
-        name, keys, values = self.get_schema(data)
-        id_index = keys.index('ID')
+        name, keys, id_index = self.get_table_schema(data)
+        values = data.get_values()
 
         if not self.id_is_not_null(values, id_index):
             raise Exception('ID must be number 0 or higher')
@@ -196,12 +358,72 @@ class QueryBuilder:
         if not self.are_not_all_none(values, id_index):
             raise Exception('At least one value except ID must be not null')
 
-        query = f'UPDATE {name} SET {", ".join(keys[index] + " = %s" for index in range(len(keys)) if index != id_index and values[index] is not None)} WHERE ID = %s;'
+        mask = tuple(value is not None for value in values)
+        query = self.get_statement((type(data), 'update', mask),
+                                   lambda: f'UPDATE {name} SET {", ".join(keys[index] + " = %s" for index in range(len(keys)) if index != id_index and mask[index])} WHERE ID = %s;')
         values = [value for value in values if value is not None]
         values.append(values.pop(0))
 
         return query, values
 
+    def create_page_select(self, data: object, boundary_id: int, page_size: int, backwards: bool = False):
+        """
+        Creates a keyset paginated select query for a single object. Rows are ordered by ID and
+        the page starts right after (or, going backwards, right before) the boundary ID, so each
+        page is one index range scan on the primary key.
+
+        Args:
+            data (object): The object for which to create the select query, not null values are used as filters.
+            boundary_id (int): The last ID of the previous page (first ID when going backwards), None for the first page.
+            page_size (int): The maximum number of rows on the page.
+            backwards (bool): Indicates whether the page before the boundary ID is selected.
+
+        Returns:
+            tuple: A tuple containing the select query and the corresponding values.
+
+        """
+
+        name, keys, id_index = self.get_table_schema(data)
+        values = data.get_values()
+
+        mask = tuple(value is not None for value in values)
+        has_boundary = boundary_id is not None
+
+        def build():
+            conditions = [keys[index] + ' = %s' for index in range(len(keys)) if mask[index]]
+            if has_boundary:
+                conditions.append('ID < %s' if backwards else 'ID > %s')
+            where = f' WHERE {" AND ".join(conditions)}' if conditions else ''
+            return f'SELECT * FROM {name}{where} ORDER BY ID {"DESC" if backwards else "ASC"} LIMIT %s;'
+
+        query = self.get_statement((type(data), 'page', mask, has_boundary, backwards), build)
+        values = [value for value in values if value is not None]
+        if has_boundary:
+            values.append(boundary_id)
+        values.append(page_size)
+
+        return query, values
+
+    def create_orphan_check(self, table: str, foreign_keys: dict):
+        """
+        Creates a query counting rows of a table whose foreign key values have no referenced row,
+        one result row per foreign key column.
+
+        Args:
+            table (str): The name of the table.
+            foreign_keys (dict): A dict mapping column names to (referenced table, referenced column).
+
+        Returns:
+            str: The verification query returning the column, referenced table and number of orphan rows.
+
+        """
+
+        checks = [f"SELECT '{column}', '{reference}', COUNT(*) FROM {table} c LEFT JOIN {reference} p "
+                  f'ON c.{column} = p.{reference_column} '
+                  f'WHERE c.{column} IS NOT NULL AND p.{reference_column} IS NULL'
+                  for column, (reference, reference_column) in sorted(foreign_keys.items())]
+        return ' UNION ALL '.join(checks) + ';'
+
     def id_is_not_null(self, values: list, id_index: int):
         """
         Checks if the ID attribute is not null.
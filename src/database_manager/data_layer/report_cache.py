@@ -0,0 +1,150 @@
+"""
+Report Cache Module
+
+This module defines a read-through cache of report (view) results.
+
+Classes:
+    ReportCache: A cache of report results with TTL, size based eviction and invalidation by base table.
+
+"""
+
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class ReportCache:
+    """
+    A cache of report results with TTL, size based eviction and invalidation by base table.
+    Entries are evicted least recently used first when max_entries or max_rows is exceeded.
+
+    Attributes:
+        ttl (int): Seconds an entry stays valid (0 disables the cache).
+        max_entries (int): The maximum number of cached reports.
+        max_rows (int): The maximum number of cached rows over all reports.
+        _entries (OrderedDict): Cached entries keyed by view name, least recently used first.
+        _rows (int): The number of currently cached rows.
+        _lock (threading.Lock): Guards the cache state.
+        hits (int): The number of reports served from the cache.
+        misses (int): The number of reports not found in the cache.
+
+    Methods:
+        get(view): Returns cached headers and rows of a view.
+        put(view, headers, rows, tables): Stores headers and rows of a view.
+        invalidate(table): Drops entries of views depending on a table.
+        clear(): Drops all entries.
+
+    """
+
+    def __init__(self, ttl=60, max_entries=16, max_rows=100000):
+        """
+        Initializes the ReportCache instance.
+
+        Args:
+            ttl (int): Seconds an entry stays valid (0 disables the cache).
+            max_entries (int): The maximum number of cached reports.
+            max_rows (int): The maximum number of cached rows over all reports.
+
+        """
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self._entries = OrderedDict()
+        self._rows = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, view: str):
+        """
+        Returns cached headers and rows of a view.
+
+        Args:
+            view (str): The name of the view.
+
+        Returns:
+            tuple: A tuple containing the headers and rows, or None if the view is not cached or expired.
+
+        """
+
+        with self._lock:
+            entry = self._entries.get(view)
+            if entry is None or entry['expires'] < time.monotonic():
+                if entry is not None:
+                    self._remove(view)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(view)
+            self.hits += 1
+            return entry['headers'], entry['rows']
+
+    def put(self, view: str, headers: list, rows: list, tables):
+        """
+        Stores headers and rows of a view.
+
+        Args:
+            view (str): The name of the view.
+            headers (list): The column names of the view.
+            rows (list): The rows of the view.
+            tables (set): The base tables the view depends on, None if unknown.
+
+        """
+
+        if not self.ttl or len(rows) > self.max_rows:
+            return
+
+        with self._lock:
+            if view in self._entries:
+                self._remove(view)
+
+            self._entries[view] = {
+                'headers': headers,
+                'rows': rows,
+                'tables': tables,
+                'expires': time.monotonic() + self.ttl
+            }
+            self._rows += len(rows)
+
+            while len(self._entries) > self.max_entries or self._rows > self.max_rows:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, table: str):
+        """
+        Drops entries of views depending on a table, including views with unknown dependencies.
+
+        Args:
+            table (str): The name of the changed table.
+
+        """
+
+        table = table.lower()
+        with self._lock:
+            for view in list(self._entries):
+                tables = self._entries[view]['tables']
+                if tables is None or table in tables:
+                    self._remove(view)
+
+    def clear(self):
+        """
+        Drops all entries.
+
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._rows = 0
+
+    def _remove(self, view: str):
+        """
+        Removes an entry, the caller must hold the lock.
+
+        Args:
+            view (str): The name of the view.
+
+        """
+
+        entry = self._entries.pop(view)
+        self._rows -= len(entry['rows'])
@@ -0,0 +1,191 @@
+"""
+Schema Catalog Module
+
+This module defines the SchemaCatalog class holding database metadata in memory.
+
+Classes:
+    SchemaCatalog: An in-memory catalog of tables, columns, keys, views and view dependencies.
+
+"""
+
+
+class SchemaCatalog:
+    """
+    An in-memory catalog of tables, columns, keys, views and view dependencies,
+    loaded from information_schema in a single round-trip.
+
+    Attributes:
+        QUERY (str): The query loading the whole catalog.
+        QUERY_WITHOUT_VIEW_USAGE (str): The fallback query for servers without information_schema.VIEW_TABLE_USAGE.
+        _tables (dict): Table and view metadata keyed by lowercase name.
+        _view_dependencies (dict): Base tables of each view keyed by lowercase view name, None if unknown.
+        is_loaded (bool): Indicates whether the catalog was loaded.
+
+    Methods:
+        load(rows, has_view_usage): Loads the catalog from the rows of the catalog query.
+        get_tables(): Returns the names of base tables.
+        get_views(): Returns the names of views.
+        get_columns(name): Returns the column names of a table or view.
+        get_column_types(name): Returns the column data types of a table or view.
+        get_primary_key(name): Returns the primary key columns of a table.
+        get_foreign_keys(name): Returns the foreign keys of a table.
+        get_view_dependencies(view): Returns the base tables a view depends on.
+
+    """
+
+    _COLUMNS = ("SELECT 'column', c.TABLE_NAME, t.TABLE_TYPE, c.COLUMN_NAME, c.DATA_TYPE, c.COLUMN_KEY, c.ORDINAL_POSITION "
+                'FROM information_schema.COLUMNS c JOIN information_schema.TABLES t '
+                'ON t.TABLE_SCHEMA = c.TABLE_SCHEMA AND t.TABLE_NAME = c.TABLE_NAME '
+                'WHERE c.TABLE_SCHEMA = %s')
+    _FOREIGN_KEYS = ("SELECT 'foreign_key', k.TABLE_NAME, NULL, k.COLUMN_NAME, k.REFERENCED_TABLE_NAME, "
+                     'k.REFERENCED_COLUMN_NAME, k.ORDINAL_POSITION '
+                     'FROM information_schema.KEY_COLUMN_USAGE k '
+                     'WHERE k.TABLE_SCHEMA = %s AND k.REFERENCED_TABLE_NAME IS NOT NULL')
+    _VIEW_USAGE = ("SELECT 'view_table', u.VIEW_NAME, NULL, NULL, u.TABLE_NAME, NULL, NULL "
+                   'FROM information_schema.VIEW_TABLE_USAGE u WHERE u.VIEW_SCHEMA = %s')
+
+    QUERY = f'{_COLUMNS} UNION ALL {_FOREIGN_KEYS} UNION ALL {_VIEW_USAGE} ORDER BY 1, 2, 7;'
+    QUERY_WITHOUT_VIEW_USAGE = f'{_COLUMNS} UNION ALL {_FOREIGN_KEYS} ORDER BY 1, 2, 7;'
+
+    def __init__(self):
+        """
+        Initializes an empty SchemaCatalog.
+
+        """
+
+        self._tables = {}
+        self._view_dependencies = {}
+        self.is_loaded = False
+
+    def load(self, rows: list, has_view_usage: bool = True):
+        """
+        Loads the catalog from the rows of the catalog query, replacing previous content.
+
+        Args:
+            rows (list): The rows returned by QUERY or QUERY_WITHOUT_VIEW_USAGE.
+            has_view_usage (bool): Indicates whether the rows contain view dependencies.
+
+        """
+
+        tables = {}
+        view_dependencies = {}
+
+        for kind, table, table_type, column, value, key, _ in rows:
+            table = str(table).lower()
+            if kind == 'column':
+                entry = tables.setdefault(table, {'is_view': False, 'columns': [], 'types': [],
+                                                  'primary_key': [], 'foreign_keys': {}})
+                entry['is_view'] = str(table_type).upper() == 'VIEW'
+                entry['columns'].append(str(column))
+                entry['types'].append(str(value).lower())
+                if str(key).upper() == 'PRI':
+                    entry['primary_key'].append(str(column))
+            elif kind == 'foreign_key':
+                if table in tables:
+                    tables[table]['foreign_keys'][str(column)] = (str(value).lower(), str(key))
+            elif kind == 'view_table':
+                view_dependencies.setdefault(table, set()).add(str(value).lower())
+
+        for name, entry in tables.items():
+            if entry['is_view']:
+                view_dependencies[name] = view_dependencies.get(name, set()) if has_view_usage else None
+
+        self._tables = tables
+        self._view_dependencies = view_dependencies
+        self.is_loaded = True
+
+    def get_tables(self):
+        """
+        Returns the names of base tables.
+
+        Returns:
+            list: A list of lowercase table names.
+
+        """
+
+        return [name for name, entry in self._tables.items() if not entry['is_view']]
+
+    def get_views(self):
+        """
+        Returns the names of views.
+
+        Returns:
+            list: A list of lowercase view names.
+
+        """
+
+        return [name for name, entry in self._tables.items() if entry['is_view']]
+
+    def get_columns(self, name: str):
+        """
+        Returns the column names of a table or view.
+
+        Args:
+            name (str): The name of the table or view.
+
+        Returns:
+            list: A list of column names in ordinal order, or None if not in catalog.
+
+        """
+
+        entry = self._tables.get(name.lower())
+        return list(entry['columns']) if entry is not None else None
+
+    def get_column_types(self, name: str):
+        """
+        Returns the column data types of a table or view.
+
+        Args:
+            name (str): The name of the table or view.
+
+        Returns:
+            dict: A dict mapping column names to lowercase data types, or None if not in catalog.
+
+        """
+
+        entry = self._tables.get(name.lower())
+        return dict(zip(entry['columns'], entry['types'])) if entry is not None else None
+
+    def get_primary_key(self, name: str):
+        """
+        Returns the primary key columns of a table.
+
+        Args:
+            name (str): The name of the table.
+
+        Returns:
+            list: A list of primary key column names, or None if not in catalog.
+
+        """
+
+        entry = self._tables.get(name.lower())
+        return list(entry['primary_key']) if entry is not None else None
+
+    def get_foreign_keys(self, name: str):
+        """
+        Returns the foreign keys of a table.
+
+        Args:
+            name (str): The name of the table.
+
+        Returns:
+            dict: A dict mapping column names to (referenced table, referenced column), or None if not in catalog.
+
+        """
+
+        entry = self._tables.get(name.lower())
+        return dict(entry['foreign_keys']) if entry is not None else None
+
+    def get_view_dependencies(self, view: str):
+        """
+        Returns the base tables a view depends on.
+
+        Args:
+            view (str): The name of the view.
+
+        Returns:
+            set: A set of lowercase table names, or None if unknown.
+
+        """
+
+        return self._view_dependencies.get(view.lower())
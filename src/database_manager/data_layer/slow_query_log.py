@@ -0,0 +1,219 @@
+"""
+Slow Query Log Module
+
+This module defines the SlowQueryLog class recording SQL statements slower than a threshold.
+
+Classes:
+    SlowQueryLog: A log of slow statements with their plans, aggregated by normalized SQL fingerprint.
+
+"""
+
+
+import json
+import re
+import threading
+
+
+class SlowQueryLog:
+    """
+    A log of slow statements with their plans, aggregated by normalized SQL fingerprint. Every statement
+    reaching the threshold is written to the logger as one JSON line with the SQL text, the number of
+    parameters and rows, the run time and optionally its EXPLAIN (or EXPLAIN ANALYZE) output. Statements
+    differing only in literal values and in the number of inserted rows share one fingerprint, whose count,
+    total and maximum run time show which statement patterns need attention.
+
+    Attributes:
+        EXPLAIN_MODES (tuple): The explain modes, "off", "explain" for EXPLAIN or "analyze" for EXPLAIN ANALYZE,
+                               which falls back to EXPLAIN on servers not supporting it.
+        EXPLAINABLE (tuple): The statement types which are explained.
+        MAX_SQL_LENGTH (int): The maximum length of logged SQL texts, longer texts are truncated.
+        MAX_FINGERPRINTS (int): The maximum number of aggregated fingerprints, further ones are counted as OTHER.
+        LOG_PREFIX (str): The prefix of slow statement log lines.
+        SUMMARY_PREFIX (str): The prefix of summary log lines.
+        enabled (bool): Indicates whether statements are recorded.
+        threshold_ms (int): The run time in milliseconds from which a statement is slow.
+        explain (str): The explain mode.
+        _logger: The logger slow statements are written to.
+        _fingerprints (dict): The aggregates keyed by fingerprint.
+        _lock (threading.Lock): Guards the aggregates.
+
+    Methods:
+        is_slow(seconds): Checks whether a run time reaches the threshold.
+        get_explain_queries(query): Returns the statements explaining a query, in order of preference.
+        record(query, params, rows, seconds, plan): Records a slow statement.
+        get_summary(): Returns the aggregates sorted by total run time.
+        reset(): Drops all aggregates.
+        flush(): Writes the aggregates to the log.
+        get_fingerprint(query): Normalizes a SQL text, replacing literals and placeholders.
+
+    """
+
+    EXPLAIN_MODES = ('off', 'explain', 'analyze')
+    EXPLAINABLE = ('SELECT', 'UPDATE', 'DELETE')
+    MAX_SQL_LENGTH = 2000
+    MAX_FINGERPRINTS = 1000
+    LOG_PREFIX = 'SLOW_QUERY'
+    SUMMARY_PREFIX = 'SLOW_QUERY_SUMMARY'
+
+    _STRING = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"")
+    _NUMBER = re.compile(r'(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b')
+    _PLACEHOLDER = re.compile(r'%s|%\(\w+\)s|\?')
+    _VALUE_LIST = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)')
+    _VALUE_LISTS = re.compile(r'VALUES\s*\(\?\+\)(?:\s*,\s*\(\?\+\))*', re.IGNORECASE)
+    _WHITESPACE = re.compile(r'\s+')
+
+    def __init__(self, enabled: bool = True, threshold_ms: int = 500, explain: str = 'off', logger=None):
+        """
+        Initializes the SlowQueryLog instance.
+
+        Args:
+            enabled (bool): Indicates whether statements are recorded.
+            threshold_ms (int): The run time in milliseconds from which a statement is slow, 0 records every statement.
+            explain (str): The explain mode ("off", "explain" or "analyze").
+            logger (optional): The logger slow statements are written to.
+
+        """
+
+        self.enabled = enabled
+        self.threshold_ms = threshold_ms
+        self.explain = explain
+        self._logger = logger
+        self._fingerprints = {}
+        self._lock = threading.Lock()
+
+    def is_slow(self, seconds: float):
+        """
+        Checks whether a run time reaches the threshold.
+
+        Args:
+            seconds (float): The run time in seconds.
+
+        Returns:
+            bool: True if the statement is recorded as slow, False otherwise.
+
+        """
+
+        return self.enabled and seconds * 1000 >= self.threshold_ms
+
+    def get_explain_queries(self, query: str):
+        """
+        Returns the statements explaining a query, in order of preference. EXPLAIN ANALYZE runs
+        the query, so it is used for selects only.
+
+        Args:
+            query (str): The SQL query.
+
+        Returns:
+            list: The explain statements, empty if the query is not explained.
+
+        """
+
+        keyword = query.lstrip()[:6].upper()
+        if self.explain == 'off' or keyword not in self.EXPLAINABLE:
+            return []
+        if self.explain == 'analyze' and keyword == 'SELECT':
+            return [f'EXPLAIN ANALYZE {query}', f'EXPLAIN {query}']
+        return [f'EXPLAIN {query}']
+
+    def record(self, query: str, params: int, rows: int, seconds: float, plan=None):
+        """
+        Records a slow statement into its fingerprint aggregate and writes it to the log.
+
+        Args:
+            query (str): The SQL text.
+            params (int): The number of parameters of the statement.
+            rows (int): The number of returned or affected rows, -1 if unknown.
+            seconds (float): The run time in seconds.
+            plan (list, optional): The explain output, a dict per plan row.
+
+        """
+
+        fingerprint = self.get_fingerprint(query)
+
+        with self._lock:
+            aggregate = self._fingerprints.get(fingerprint)
+            if aggregate is None:
+                if len(self._fingerprints) >= self.MAX_FINGERPRINTS:
+                    fingerprint = 'OTHER'
+                    aggregate = self._fingerprints.get(fingerprint)
+                if aggregate is None:
+                    aggregate = self._fingerprints[fingerprint] = {'count': 0, 'total': 0.0, 'max': 0.0, 'rows': 0}
+            aggregate['count'] += 1
+            aggregate['total'] += seconds
+            aggregate['max'] = max(aggregate['max'], seconds)
+            aggregate['rows'] += max(rows, 0)
+
+        if self._logger is None:
+            return
+
+        entry = {
+            'fingerprint': fingerprint,
+            'sql': query if len(query) <= self.MAX_SQL_LENGTH else query[:self.MAX_SQL_LENGTH] + '...',
+            'params': params,
+            'rows': rows,
+            'elapsed_ms': round(seconds * 1000, 3)
+        }
+        if plan is not None:
+            entry['plan'] = plan
+        self._logger.warning('%s %s', self.LOG_PREFIX, json.dumps(entry, separators=(',', ':'), default=str))
+
+    def get_summary(self):
+        """
+        Returns the aggregates sorted by total run time, longest first.
+
+        Returns:
+            list: A dict per fingerprint with count, total, average and maximum run time in milliseconds and rows.
+
+        """
+
+        with self._lock:
+            items = list(self._fingerprints.items())
+
+        return [{'fingerprint': fingerprint,
+                 'count': aggregate['count'],
+                 'total_ms': round(aggregate['total'] * 1000, 3),
+                 'avg_ms': round(aggregate['total'] * 1000 / aggregate['count'], 3),
+                 'max_ms': round(aggregate['max'] * 1000, 3),
+                 'rows': aggregate['rows']}
+                for fingerprint, aggregate in sorted(items, key=lambda item: item[1]['total'], reverse=True)]
+
+    def reset(self):
+        """
+        Drops all aggregates.
+
+        """
+
+        with self._lock:
+            self._fingerprints = {}
+
+    def flush(self):
+        """
+        Writes the aggregates to the log as one JSON line, e.g. SLOW_QUERY_SUMMARY [{"fingerprint": ...}].
+
+        """
+
+        summary = self.get_summary()
+        if self._logger is not None and summary:
+            self._logger.warning('%s %s', self.SUMMARY_PREFIX, json.dumps(summary, separators=(',', ':')))
+
+    @classmethod
+    def get_fingerprint(cls, query: str):
+        """
+        Normalizes a SQL text, replacing string and number literals and placeholders with "?",
+        value lists with "(?+)" and the rows of an insert with "VALUES (?+)...", so inserts
+        of any number of rows share one fingerprint.
+
+        Args:
+            query (str): The SQL text, e.g. "INSERT INTO OWNER(ID, NAME) VALUES (%s, %s), (%s, %s);".
+
+        Returns:
+            str: The fingerprint, e.g. "INSERT INTO OWNER(ID, NAME) VALUES (?+)...".
+
+        """
+
+        fingerprint = cls._STRING.sub('?', query)
+        fingerprint = cls._PLACEHOLDER.sub('?', fingerprint)
+        fingerprint = cls._NUMBER.sub('?', fingerprint)
+        fingerprint = cls._VALUE_LIST.sub('(?+)', fingerprint)
+        fingerprint = cls._VALUE_LISTS.sub('VALUES (?+)...', fingerprint)
+        return cls._WHITESPACE.sub(' ', fingerprint).strip().rstrip(';').strip()
@@ -43,6 +43,8 @@ class Auction(DatabaseEntity):
 
     """
 
+    __slots__ = ('start_date', 'end_date', 'auction_type', 'auction_description', 'item_id')
+
     def __init__(self, identifier: int, start_date: datetime, end_date: datetime, auction_type: AuctionType, auction_description: str, item_id: int):
         """
         Initializes an Auction object with the provided attributes.
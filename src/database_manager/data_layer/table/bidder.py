@@ -26,6 +26,8 @@ class Bidder(DatabaseEntity):
 
     """
 
+    __slots__ = ('surname', 'last_name', 'address', 'post_code', 'phone_number')
+
     def __init__(self, identifier: int, surname: str, last_name: str, address: str, post_code: int, phone_number: str):
         """
         Initializes a Bidder object with the provided attributes.
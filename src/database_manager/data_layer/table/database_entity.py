@@ -10,17 +10,39 @@ Classes:
 
 
 from abc import ABC
+from operator import attrgetter
 
 
 class DatabaseEntity(ABC):
     """
-    An abstract base class representing a database entity.
+    An abstract base class representing a database entity. Entities keep their attributes in
+    __slots__ instead of a per-instance dict, FIELDS holds the attribute names in column order.
 
     Attributes:
+        FIELDS (tuple): The attribute names in column order, extended by every subclass with its __slots__.
         id (int): The unique identifier of the database entity.
 
+    Methods:
+        get_values(): Returns the attribute values in column order.
+
     """
 
+    __slots__ = ('id',)
+    FIELDS = ('id',)
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Extends the field order of a subclass with its own __slots__ and prepares the getter of its values.
+
+        Args:
+            **kwargs: Keyword arguments passed to the parent class.
+
+        """
+
+        super().__init_subclass__(**kwargs)
+        cls.FIELDS = cls.__bases__[0].FIELDS + tuple(cls.__dict__.get('__slots__', ()))
+        cls._get_fields = attrgetter(*cls.FIELDS)
+
     def __init__(self, identifier: int):
         """
         Initializes a DatabaseEntity object with the provided identifier.
@@ -31,4 +53,14 @@ class DatabaseEntity(ABC):
         """
 
         self.id = identifier
-    
\ No newline at end of file
+
+    def get_values(self):
+        """
+        Returns the attribute values in column order.
+
+        Returns:
+            list: The values of FIELDS.
+
+        """
+
+        return list(self._get_fields(self))
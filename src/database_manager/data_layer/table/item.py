@@ -25,6 +25,8 @@ class Item(DatabaseEntity):
 
     """
 
+    __slots__ = ('item_name', 'item_description', 'start_price', 'owner_id')
+
     def __init__(self, identifier: int, item_name: str, item_description: str, start_price: float, owner_id: int):
         """
         Initializes an Item object with the provided attributes.
@@ -26,6 +26,8 @@ class Offer(DatabaseEntity):
 
     """
 
+    __slots__ = ('amount', 'offer_date', 'auction_id', 'bidder_id')
+
     def __init__(self, identifier: int, amount: float, offer_date: datetime, auction_id: int, bidder_id: int):
         """
         Initializes an Offer object with the provided attributes.
@@ -28,6 +28,8 @@ class Owner(DatabaseEntity):
 
     """
 
+    __slots__ = ('surname', 'last_name', 'address', 'post_code', 'phone_number', 'is_verified', 'email')
+
     def __init__(self, identifier: int, surname: str, last_name: str, address: str, post_code: int, phone_number: str, is_verified: bool, email: str):
         """
         Initializes an Owner object with the provided attributes.
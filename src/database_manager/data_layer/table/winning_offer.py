@@ -22,6 +22,8 @@ class WinningOffer(DatabaseEntity):
 
     """
 
+    __slots__ = ('offer_id',)
+
     def __init__(self, identifier: int, offer_id: int):
         """
         Initializes a WinningOffer object with the provided attributes.
@@ -0,0 +1,253 @@
+"""
+Transaction Manager Module
+
+This module defines the TransactionManager class for explicit transactions on pooled connections.
+
+Classes:
+    TransactionManager: A class holding one connection per thread for the duration of a transaction.
+
+"""
+
+
+import threading
+
+
+class TransactionManager:
+    """
+    A class holding one connection per thread for the duration of a transaction. While a transaction
+    is active, the DataManager runs queries of the thread on the held connection and leaves committing
+    to the transaction. Can be used as a context manager, which commits on success and rolls back on error.
+
+    Attributes:
+        SAVEPOINT (str): The name of the savepoint marking the start of the current batch.
+        _connector: The connector providing database connections through checkout/checkin.
+        _logger: The logger for errors which must not hide the end of the transaction.
+        _local (threading.local): The connection held by the transaction of each thread and
+                                  whether foreign keys are checked in the transaction.
+
+    Methods:
+        begin(foreign_key_checks): Begins a transaction.
+        commit(): Commits the transaction and releases its connection.
+        rollback(): Rolls back the transaction and releases its connection.
+        savepoint(): Marks the start of a batch inside the transaction.
+        rollback_to_savepoint(): Rolls back the batch started by the last savepoint.
+
+    """
+
+    SAVEPOINT = 'batch_start'
+
+    def __init__(self, connector, logger):
+        """
+        Initializes the TransactionManager instance.
+
+        Args:
+            connector: The connector providing database connections through checkout/checkin.
+            logger: The logger for errors which must not hide the end of the transaction.
+
+        """
+
+        self._connector = connector
+        self._logger = logger
+        self._local = threading.local()
+
+    @property
+    def connection(self):
+        """
+        Returns the connection held by the transaction of the current thread.
+
+        Returns:
+            connection: The held connection, None outside of a transaction.
+
+        """
+
+        return getattr(self._local, 'connection', None)
+
+    @property
+    def is_active(self):
+        """
+        Checks whether the current thread has an open transaction.
+
+        Returns:
+            bool: True if a transaction is open, False otherwise.
+
+        """
+
+        return self.connection is not None
+
+    def begin(self, foreign_key_checks: bool = True):
+        """
+        Begins a transaction on a connection checked out for the current thread.
+
+        Args:
+            foreign_key_checks (bool): Indicates whether foreign keys are checked until the transaction ends.
+
+        Raises:
+            Exception: If a transaction is already open or cannot be started.
+
+        """
+
+        if self.is_active:
+            raise Exception('Transaction is already open')
+
+        conn = self._connector.checkout()
+        try:
+            conn.start_transaction()
+            if not foreign_key_checks:
+                self._set_foreign_key_checks(conn, False)
+        except Exception as e:
+            self._connector.checkin(conn)
+            raise Exception(str(e).split(':')[1].strip())
+        self._local.connection = conn
+        self._local.foreign_key_checks = foreign_key_checks
+
+    def commit(self):
+        """
+        Commits the transaction and releases its connection.
+
+        Raises:
+            Exception: If no transaction is open or the commit fails.
+
+        """
+
+        self._end(True)
+
+    def rollback(self):
+        """
+        Rolls back the transaction and releases its connection.
+
+        Raises:
+            Exception: If no transaction is open or the rollback fails.
+
+        """
+
+        self._end(False)
+
+    def savepoint(self):
+        """
+        Marks the start of a batch inside the transaction, replacing the previous mark.
+
+        Raises:
+            Exception: If no transaction is open or the savepoint cannot be set.
+
+        """
+
+        self._execute(f'SAVEPOINT {self.SAVEPOINT};')
+
+    def rollback_to_savepoint(self):
+        """
+        Rolls back the batch started by the last savepoint, keeping earlier work of the transaction.
+
+        Raises:
+            Exception: If no transaction is open or the rollback fails.
+
+        """
+
+        self._execute(f'ROLLBACK TO SAVEPOINT {self.SAVEPOINT};')
+
+    def _execute(self, query: str):
+        """
+        Executes a transaction control statement on the held connection.
+
+        Args:
+            query (str): The statement to execute.
+
+        Raises:
+            Exception: If no transaction is open or the statement fails.
+
+        """
+
+        conn = self.connection
+        if conn is None:
+            raise Exception('No transaction is open')
+
+        cursor = conn.cursor()
+        try:
+            cursor.execute(query)
+        except Exception as e:
+            raise Exception(str(e).split(':')[1].strip())
+        finally:
+            cursor.close()
+
+    def _set_foreign_key_checks(self, conn, enabled: bool):
+        """
+        Enables or disables foreign key checks for the session of a connection.
+
+        Args:
+            conn: The connection of the session.
+            enabled (bool): Indicates whether foreign keys are checked.
+
+        """
+
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f'SET FOREIGN_KEY_CHECKS = {1 if enabled else 0};')
+        finally:
+            cursor.close()
+
+    def _end(self, commit: bool):
+        """
+        Ends the transaction and releases its connection, with foreign key checks enabled again.
+        A failure to enable them is logged, so it does not hide the result of the transaction.
+
+        Args:
+            commit (bool): Indicates whether the transaction is committed or rolled back.
+
+        Raises:
+            Exception: If no transaction is open or ending it fails.
+
+        """
+
+        conn = self.connection
+        if conn is None:
+            raise Exception('No transaction is open')
+
+        self._local.connection = None
+        try:
+            if commit:
+                conn.commit()
+            else:
+                conn.rollback()
+        except Exception as e:
+            raise Exception(str(e).split(':')[1].strip())
+        finally:
+            if not self._local.foreign_key_checks:
+                try:
+                    self._set_foreign_key_checks(conn, True)
+                except Exception as e:
+                    self._logger.error('Enabling foreign key checks failed: %s', e)
+            self._connector.checkin(conn)
+
+    def __enter__(self):
+        """
+        Begins a transaction when entering the context.
+
+        Returns:
+            TransactionManager: The transaction manager.
+
+        """
+
+        self.begin()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Commits the transaction if the context exits normally, otherwise rolls it back.
+
+        Args:
+            exc_type: The type of the raised exception, None if none was raised.
+            exc_value: The raised exception.
+            traceback: The traceback of the raised exception.
+
+        Returns:
+            bool: False, exceptions are always propagated.
+
+        """
+
+        if not self.is_active:
+            return False
+
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
@@ -19,9 +19,10 @@ class Controller:
     Methods:
         get_input(subdir=None): Prompts the user for input and returns the entered command.
         print_outlined_message(message: str, length: int): Prints a message surrounded by a border.
-        print_table(headers: list, values: list): Prints a table with headers and corresponding values.
+        print_table(headers: list, values: list, chunked: bool): Prints a table with headers and corresponding values.
         print_message(message: str): Prints a message.
         print_error(message: str): Prints an error message.
+        print_progress(message: str, done: bool): Prints a progress message over the previous one.
         print_choice(options: str): Prints a list of options for user choice.
 
     """
@@ -65,18 +66,36 @@ class Controller:
         output = outline_text(message, length)
         print(output)
 
-    def print_table(self, headers: list, values: list):
+    def print_table(self, headers: list, values: list, chunked: bool = False):
         """
         Prints a table with headers and corresponding values.
 
         Args:
             headers (list): A list of strings representing table headers.
-            values (list): A list of lists representing table values.
+            values (list): A list of lists representing table values, or an iterable of such lists when chunked.
+            chunked (bool): Indicates whether values arrive in chunks, which are printed as they come.
+                            Column widths are taken from the first chunk, wider later values are shortened.
 
         """
 
-        table, length = generate_text_table(headers, values)
-        self.print_outlined_message(table, length)
+        if not chunked:
+            table, length = generate_text_table(headers, values)
+            self.print_outlined_message(table, length)
+            return
+
+        chunks = iter(values)
+        first_chunk = next(chunks, [])
+        column_widths = get_column_widths(headers, first_chunk)
+        length = sum(column_widths) + (len(column_widths) - 1) * 3
+
+        print('=' * length)
+        print('\n'.join(generate_header_rows(headers, column_widths)))
+        for row in generate_data_rows(first_chunk, column_widths):
+            print(row)
+        for chunk in chunks:
+            for row in generate_data_rows(chunk, column_widths, True):
+                print(row)
+        print('=' * length)
 
     def print_message(self, message: str):
         """
@@ -100,6 +119,18 @@ class Controller:
 
         print(f'Error: {message}')
 
+    def print_progress(self, message: str, done: bool = False):
+        """
+        Prints a progress message over the previous one on the same line.
+
+        Args:
+            message (str): The progress message to be printed.
+            done (bool): Indicates whether the progress is finished and the line is ended.
+
+        """
+
+        print(f'\r{message}', end='\n' if done else '', flush=True)
+
     def print_choice(self, options: str):
         """
         Prints a list of options for user choice.
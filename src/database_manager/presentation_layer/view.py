@@ -7,6 +7,9 @@ Functions:
     outline_text(message: str, length: int): Creates a bordered text block.
     reformat_console_text(console: str, subdir: list): Reformat the console prompt with a subdirectory.
     generate_text_table(headers: list, data: list): Generates a text-based table.
+    get_column_widths(headers: list, data: list): Calculates column widths of a table.
+    generate_header_rows(headers: list, column_widths: list): Generates the header and separator rows of a table.
+    generate_data_rows(data: list, column_widths: list, clip: bool): Generates the data rows of a table.
     replace_chars(text: str): Replaces specific characters in a string.
 
 """
@@ -70,10 +73,46 @@ def generate_text_table(headers: list, data: list):
 
     """
 
-    column_widths = []
+    column_widths = get_column_widths(headers, data)
+
+    table_parts = [*generate_header_rows(headers, column_widths), *generate_data_rows(data, column_widths)]
+    table = "\n".join(table_parts)
+
+    total_width = sum(column_widths) + (len(column_widths) - 1) * 3
+    return table, total_width
+
+
+def get_column_widths(headers: list, data: list):
+    """
+    Calculates column widths of a table.
+
+    Args:
+        headers (list): A list of strings representing table headers.
+        data (list): A list of lists representing table data.
+
+    Returns:
+        list: A list of column widths.
+
+    """
+
+    widths = []
     for column in zip(headers, *data):
-        max_length = max(len(str(item)) for item in column)
-        column_widths.append(max_length)
+        widths.append(max(len(str(item)) for item in column))
+    return widths
+
+
+def generate_header_rows(headers: list, column_widths: list):
+    """
+    Generates the header and separator rows of a table.
+
+    Args:
+        headers (list): A list of strings representing table headers.
+        column_widths (list): A list of column widths.
+
+    Returns:
+        list: A list containing the header row and the separator row.
+
+    """
 
     header_row_parts = []
     for header, width in zip(headers, column_widths):
@@ -85,18 +124,34 @@ def generate_text_table(headers: list, data: list):
         separator_row_parts.append("-" * column_widths[index])
     separator_row = "-|-".join(separator_row_parts)
 
+    return [header_row, separator_row]
+
+
+def generate_data_rows(data: list, column_widths: list, clip: bool = False):
+    """
+    Generates the data rows of a table.
+
+    Args:
+        data (list): A list of lists representing table data.
+        column_widths (list): A list of column widths.
+        clip (bool): Indicates whether values wider than their column are shortened with "...".
+
+    Returns:
+        list: A list of formatted data rows.
+
+    """
+
     data_rows = []
     for row in data:
         row_parts = []
         for item, width in zip(row, column_widths):
-            row_parts.append(str(item).ljust(width))
+            item = str(item)
+            if clip and len(item) > width:
+                item = item[:width - 3] + '...' if width > 3 else item[:width]
+            row_parts.append(item.ljust(width))
         data_rows.append(" | ".join(row_parts))
 
-    table_parts = [header_row, separator_row, *data_rows]
-    table = "\n".join(table_parts)
-
-    total_width = sum(column_widths) + (len(column_widths) - 1) * 3
-    return table, total_width
+    return data_rows
 
 
 def replace_chars(text):
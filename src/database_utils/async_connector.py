@@ -0,0 +1,158 @@
+"""
+Async MySQL Connector
+
+This module provides a class for establishing and managing MySQL connections from asyncio code,
+through a connection pool of an async driver (aiomysql by default).
+
+Classes:
+    AsyncConnector: A class for establishing and managing async MySQL connections.
+
+"""
+
+
+import asyncio
+
+try:
+    import aiomysql
+except ImportError:
+    aiomysql = None
+
+
+class AsyncConnector:
+    """
+    A class for establishing and managing async MySQL connections. Connections are taken from a pool,
+    so independent coroutines run their queries on separate connections and overlap their network waits.
+
+    Attributes:
+        host (str): The hostname or IP address of the MySQL server.
+        port (int): The port number of the MySQL server.
+        user (str): The username for authentication.
+        password (str): The password for authentication.
+        name (str): The name of the MySQL database.
+        attempts (int): The maximum number of connection attempts.
+        timeout (int): The timeout for each connection attempt (in seconds).
+        pool_conf (dict): Pool settings (min_size, max_size, max_lifetime).
+        allow_local_infile (bool): Indicates whether LOAD DATA LOCAL INFILE is allowed on new connections.
+        backend: The driver module or object providing create_pool(), aiomysql if not given.
+        pool: The pool of the driver, created on first checkout.
+        _pool_lock (asyncio.Lock): Guards the creation of the pool.
+
+    Methods:
+        checkout(): Takes a connection for exclusive use.
+        checkin(connection): Returns a connection taken by checkout().
+        close_connection(): Closes the connection pool.
+
+    """
+
+    def __init__(self, host, port, user, password, name, attempts, timeout, pool_conf=None,
+                 allow_local_infile=False, backend=None):
+        """
+        Initializes the AsyncConnector instance with connection parameters.
+
+        Args:
+            host (str): The hostname or IP address of the MySQL server.
+            port (int): The port number of the MySQL server.
+            user (str): The username for authentication.
+            password (str): The password for authentication.
+            name (str): The name of the MySQL database.
+            attempts (int): The maximum number of connection attempts.
+            timeout (int): The timeout for each connection attempt (in seconds).
+            pool_conf (dict, optional): Pool settings (min_size, max_size, max_lifetime).
+            allow_local_infile (bool): Indicates whether LOAD DATA LOCAL INFILE is allowed on new connections.
+            backend (optional): The driver providing create_pool(), e.g. a FakeAsyncBackend, aiomysql if not given.
+
+        Raises:
+            Exception: If no backend is given and aiomysql is not installed.
+
+        """
+
+        if backend is None and aiomysql is None:
+            raise Exception('Async mode requires the "aiomysql" package')
+
+        pool_conf = pool_conf or {}
+
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.name = name
+        self.attempts = attempts
+        self.timeout = timeout
+        self.pool_conf = pool_conf
+        self.allow_local_infile = allow_local_infile
+        self.backend = backend or aiomysql
+        self.pool = None
+        self._pool_lock = asyncio.Lock()
+
+    async def checkout(self):
+        """
+        Takes a connection from the pool for exclusive use, creating the pool on first use.
+
+        Returns:
+            connection: An async MySQL connection object.
+
+        Raises:
+            Exception: If the pool cannot be created after maximum attempts.
+
+        """
+
+        if self.pool is None:
+            async with self._pool_lock:
+                if self.pool is None:
+                    self.pool = await self._create_pool()
+        return await self.pool.acquire()
+
+    async def checkin(self, connection):
+        """
+        Returns a connection taken by checkout() to the pool.
+
+        Args:
+            connection: An async MySQL connection object.
+
+        """
+
+        if self.pool is not None:
+            await self.pool.release(connection)
+
+    async def _create_pool(self):
+        """
+        Creates the connection pool of the backend, a max_lifetime of 0 disables recycling.
+
+        Returns:
+            pool: The connection pool.
+
+        Raises:
+            Exception: If the pool cannot be created after maximum attempts.
+
+        """
+
+        max_lifetime = self.pool_conf.get('max_lifetime', 0)
+        attempt = 0
+        while attempt < self.attempts:
+            try:
+                return await self.backend.create_pool(host=self.host,
+                                                      port=int(self.port),
+                                                      user=self.user,
+                                                      password=self.password,
+                                                      db=self.name,
+                                                      connect_timeout=self.timeout,
+                                                      minsize=self.pool_conf.get('min_size', 1),
+                                                      maxsize=self.pool_conf.get('max_size', 10),
+                                                      pool_recycle=max_lifetime or -1,
+                                                      local_infile=self.allow_local_infile,
+                                                      autocommit=False)
+            except:
+                attempt += 1
+
+        raise Exception('Connection to database failed')
+
+    async def close_connection(self):
+        """
+        Closes the connection pool and waits for its connections to close.
+
+        """
+
+        if self.pool is not None:
+            self.pool.close()
+            await self.pool.wait_closed()
+            self.pool = None
@@ -1,7 +1,8 @@
 """
 MySQL Connector
 
-This module provides a singleton class for establishing and managing MySQL connections.
+This module provides a singleton class for establishing and managing MySQL connections,
+either as a single shared connection or through a bounded connection pool.
 
 Classes:
     Connector: A singleton class for establishing and managing MySQL connections.
@@ -9,7 +10,9 @@ Classes:
 """
 
 
+import threading
 from mysql import connector
+from .pool import ConnectionPool
 
 
 class Connector:
@@ -26,10 +29,16 @@ class Connector:
         timeout (int): The timeout for each connection attempt (in seconds).
         default_conf (tuple): A tuple containing default connection configuration
                               (host, port, user, password, name, timeout).
+        pool_conf (dict): Pool settings (enabled, min_size, max_size, idle_timeout, max_lifetime, checkout_timeout).
+        allow_local_infile (bool): Indicates whether LOAD DATA LOCAL INFILE is allowed on new connections.
         connection: MySQL connection object.
+        pool (ConnectionPool): The connection pool, if pool mode is enabled.
+        _pool_lock (threading.Lock): Guards the creation of the pool, so concurrent first checkouts share one pool.
 
     Methods:
         get_connection(): Establishes a MySQL connection.
+        checkout(): Takes a connection for exclusive use.
+        checkin(connection): Returns a connection taken by checkout().
         close_connection(): Closes the current MySQL connection.
 
     """
@@ -49,7 +58,8 @@ class Connector:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self, host, port, user, password, name, attempts, timeout, default_conf=None):
+    def __init__(self, host, port, user, password, name, attempts, timeout, default_conf=None, pool_conf=None,
+                 allow_local_infile=False):
         """
         Initializes the Connector instance with connection parameters.
 
@@ -63,6 +73,9 @@ class Connector:
             timeout (int): The timeout for each connection attempt (in seconds).
             default_conf (tuple): A tuple containing default connection configuration
                                   (host, port, user, password, name, timeout).
+            pool_conf (dict): Pool settings (enabled, min_size, max_size, idle_timeout, max_lifetime,
+                              checkout_timeout), pool mode is disabled when not provided.
+            allow_local_infile (bool): Indicates whether LOAD DATA LOCAL INFILE is allowed on new connections.
 
         """
         self.host = host
@@ -73,7 +86,11 @@ class Connector:
         self.attempts = attempts
         self.timeout = timeout
         self.default_conf = default_conf
+        self.pool_conf = pool_conf
+        self.allow_local_infile = allow_local_infile
         self.connection = None
+        self.pool = None
+        self._pool_lock = threading.Lock()
 
     def get_connection(self):
         """
@@ -87,41 +104,89 @@ class Connector:
 
         """
 
-        if self.connection is not None:
-            return self.connection
-        else:
-            attempt = 0
-            while attempt < self.attempts:
-                try:
-                    if self.connection is None:
-                        self.connection = connector.connect(host=self.host,
-                                                            port=self.port,
-                                                            user=self.user,
-                                                            password=self.password,
-                                                            database=self.name,
-                                                            connection_timeout=self.timeout)
-                    else:
-                        return self.connection
-                except:
-                    attempt += 1
-            else:
-                if self.default_conf is not None:
-                    try:
-                        self.connection = connector.connect(host=self.default_conf[0],
-                                                            port=self.default_conf[1],
-                                                            user=self.default_conf[2],
-                                                            password=self.default_conf[3],
-                                                            database=self.default_conf[4],
-                                                            connection_timeout=self.default_conf[5])
-                    finally:
-                        if self.connection is not None:
-                            return self.connection
+        if self.connection is None:
+            self.connection = self._open_connection()
+        return self.connection
+
+    def checkout(self):
+        """
+        Takes a connection for exclusive use, from the pool if pool mode is enabled,
+        otherwise the shared connection.
+
+        Returns:
+            connection: A MySQL connection object.
+
+        """
+
+        if self.pool_conf is None or not self.pool_conf['enabled']:
+            return self.get_connection()
+
+        if self.pool is None:
+            with self._pool_lock:
+                if self.pool is None:
+                    self.pool = ConnectionPool(self._open_connection,
+                                               min_size=self.pool_conf['min_size'],
+                                               max_size=self.pool_conf['max_size'],
+                                               idle_timeout=self.pool_conf['idle_timeout'],
+                                               max_lifetime=self.pool_conf['max_lifetime'],
+                                               checkout_timeout=self.pool_conf['checkout_timeout'])
+        return self.pool.checkout()
+
+    def checkin(self, connection):
+        """
+        Returns a connection taken by checkout(), the shared connection stays open.
+
+        Args:
+            connection: A MySQL connection object.
+
+        """
+
+        if self.pool is not None:
+            self.pool.checkin(connection)
+
+    def _open_connection(self):
+        """
+        Opens a new MySQL connection, falling back to the default configuration.
+
+        Returns:
+            connection: A MySQL connection object.
+
+        Raises:
+            Exception: If connection fails after maximum attempts.
+
+        """
+
+        attempt = 0
+        while attempt < self.attempts:
+            try:
+                return connector.connect(host=self.host,
+                                         port=self.port,
+                                         user=self.user,
+                                         password=self.password,
+                                         database=self.name,
+                                         connection_timeout=self.timeout,
+                                         allow_local_infile=self.allow_local_infile)
+            except:
+                attempt += 1
+
+        if self.default_conf is not None:
+            return connector.connect(host=self.default_conf[0],
+                                     port=self.default_conf[1],
+                                     user=self.default_conf[2],
+                                     password=self.default_conf[3],
+                                     database=self.default_conf[4],
+                                     connection_timeout=self.default_conf[5],
+                                     allow_local_infile=self.allow_local_infile)
+
+        raise Exception('Connection to database failed')
 
     def close_connection(self):
         """
-        Closes the current MySQL connection.
+        Closes the current MySQL connection and the connection pool.
 
         """
 
         if self.connection is not None:
             self.connection.close()
+        if self.pool is not None:
+            self.pool.close()
@@ -0,0 +1,268 @@
+"""
+Fake Async Backend
+
+This module provides an in-memory stand-in for an async MySQL driver, used to run the async
+data layer without a database server, e.g. in tests.
+
+Classes:
+    FakeAsyncBackend: A driver stand-in creating fake pools.
+    FakeAsyncPool: A pool of fake connections.
+    FakeAsyncConnection: A fake connection recording executed queries.
+    FakeAsyncCursor: A fake cursor returning rows of the responder.
+
+"""
+
+
+import asyncio
+
+
+class FakeAsyncBackend:
+    """
+    A driver stand-in creating fake pools, with the create_pool() interface of aiomysql.
+
+    Attributes:
+        responder: A callable taking the query and its data and returning the result rows.
+        latency (float): Seconds every query waits, simulating the network round-trip.
+        queries (list): Tuples of executed queries and their data, shared by all connections.
+        commits (int): The number of commits over all connections.
+        rollbacks (int): The number of rollbacks over all connections.
+        open_cursors (int): The number of cursors created and not closed yet.
+        active_queries (int): The number of queries currently waiting for the latency.
+        max_active_queries (int): The highest number of queries waiting at the same time.
+        pools (list): The settings of every created pool.
+
+    Methods:
+        create_pool(**kwargs): Creates a fake pool.
+
+    """
+
+    def __init__(self, responder=None, latency=0.0):
+        """
+        Initializes the FakeAsyncBackend instance.
+
+        Args:
+            responder (optional): A callable taking the query and its data and returning the result rows,
+                                  every query returns no rows if not given.
+            latency (float): Seconds every query waits, simulating the network round-trip.
+
+        """
+
+        self.responder = responder or (lambda query, data: [])
+        self.latency = latency
+        self.queries = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.open_cursors = 0
+        self.active_queries = 0
+        self.max_active_queries = 0
+        self.pools = []
+
+    async def create_pool(self, **kwargs):
+        """
+        Creates a fake pool.
+
+        Args:
+            **kwargs: The pool settings, recorded in pools, only maxsize is used.
+
+        Returns:
+            FakeAsyncPool: The fake pool.
+
+        """
+
+        self.pools.append(kwargs)
+        return FakeAsyncPool(self, kwargs.get('maxsize', 10))
+
+
+class FakeAsyncPool:
+    """
+    A pool of fake connections limited to a maximum size.
+
+    Attributes:
+        backend (FakeAsyncBackend): The backend the pool belongs to.
+        _semaphore (asyncio.Semaphore): Limits the number of connections in use.
+
+    Methods:
+        acquire(): Takes a connection.
+        release(connection): Returns a connection.
+        close(): Closes the pool.
+        wait_closed(): Waits until the pool is closed.
+
+    """
+
+    def __init__(self, backend, max_size):
+        """
+        Initializes the FakeAsyncPool instance.
+
+        Args:
+            backend (FakeAsyncBackend): The backend the pool belongs to.
+            max_size (int): The maximum number of connections in use.
+
+        """
+
+        self.backend = backend
+        self._semaphore = asyncio.Semaphore(max_size)
+
+    async def acquire(self):
+        """
+        Takes a connection, waiting while all connections are in use.
+
+        Returns:
+            FakeAsyncConnection: A fake connection.
+
+        """
+
+        await self._semaphore.acquire()
+        return FakeAsyncConnection(self.backend)
+
+    async def release(self, connection):
+        """
+        Returns a connection.
+
+        Args:
+            connection (FakeAsyncConnection): The connection taken by acquire().
+
+        """
+
+        self._semaphore.release()
+
+    def close(self):
+        """
+        Closes the pool.
+
+        """
+
+    async def wait_closed(self):
+        """
+        Waits until the pool is closed.
+
+        """
+
+
+class FakeAsyncConnection:
+    """
+    A fake connection recording executed queries into its backend.
+
+    Attributes:
+        backend (FakeAsyncBackend): The backend the connection belongs to.
+
+    Methods:
+        cursor(): Creates a cursor.
+        begin(): Begins a transaction.
+        commit(): Commits the transaction.
+        rollback(): Rolls back the transaction.
+
+    """
+
+    def __init__(self, backend):
+        """
+        Initializes the FakeAsyncConnection instance.
+
+        Args:
+            backend (FakeAsyncBackend): The backend the connection belongs to.
+
+        """
+
+        self.backend = backend
+
+    async def cursor(self):
+        """
+        Creates a cursor.
+
+        Returns:
+            FakeAsyncCursor: A fake cursor.
+
+        """
+
+        self.backend.open_cursors += 1
+        return FakeAsyncCursor(self)
+
+    async def begin(self):
+        """
+        Begins a transaction.
+
+        """
+
+    async def commit(self):
+        """
+        Commits the transaction.
+
+        """
+
+        self.backend.commits += 1
+
+    async def rollback(self):
+        """
+        Rolls back the transaction.
+
+        """
+
+        self.backend.rollbacks += 1
+
+
+class FakeAsyncCursor:
+    """
+    A fake cursor returning rows of the responder.
+
+    Attributes:
+        connection (FakeAsyncConnection): The connection the cursor belongs to.
+        _rows (list): The rows of the last executed query.
+
+    Methods:
+        execute(query, data): Executes a query.
+        fetchall(): Returns the rows of the last executed query.
+        close(): Closes the cursor.
+
+    """
+
+    def __init__(self, connection):
+        """
+        Initializes the FakeAsyncCursor instance.
+
+        Args:
+            connection (FakeAsyncConnection): The connection the cursor belongs to.
+
+        """
+
+        self.connection = connection
+        self._rows = []
+
+    async def execute(self, query, data=None):
+        """
+        Executes a query, waiting for the latency of the backend.
+
+        Args:
+            query (str): The SQL query.
+            data (list, optional): The data values of the query.
+
+        """
+
+        backend = self.connection.backend
+        if backend.latency:
+            backend.active_queries += 1
+            backend.max_active_queries = max(backend.max_active_queries, backend.active_queries)
+            try:
+                await asyncio.sleep(backend.latency)
+            finally:
+                backend.active_queries -= 1
+        backend.queries.append((query, data))
+        self._rows = list(backend.responder(query, data))
+
+    async def fetchall(self):
+        """
+        Returns the rows of the last executed query.
+
+        Returns:
+            list: The rows of the last executed query.
+
+        """
+
+        rows, self._rows = self._rows, []
+        return rows
+
+    async def close(self):
+        """
+        Closes the cursor.
+
+        """
+
+        self.connection.backend.open_cursors -= 1
@@ -0,0 +1,288 @@
+"""
+Connection Pool
+
+This module provides a bounded, thread-safe pool of database connections.
+
+Classes:
+    PooledConnection: A record holding a pooled connection and its lifetime information.
+    ConnectionPool: A bounded pool with checkout/checkin, idle eviction, lifetime recycling and health ping.
+
+"""
+
+
+import threading
+import time
+from collections import deque
+
+
+class PooledConnection:
+    """
+    A record holding a pooled connection and its lifetime information.
+
+    Attributes:
+        connection: The underlying database connection.
+        created_at (float): The monotonic time the connection was opened.
+        last_used (float): The monotonic time the connection was last returned to the pool.
+
+    """
+
+    def __init__(self, connection):
+        """
+        Initializes the PooledConnection with a freshly opened connection.
+
+        Args:
+            connection: The underlying database connection.
+
+        """
+
+        self.connection = connection
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class ConnectionPool:
+    """
+    A bounded pool with checkout/checkin, idle eviction, lifetime recycling and health ping.
+
+    Attributes:
+        _factory (callable): A function opening a new database connection.
+        min_size (int): The number of connections kept open even when idle.
+        max_size (int): The maximum number of connections open at the same time.
+        idle_timeout (int): Seconds after which an idle connection above min_size is closed (0 disables).
+        max_lifetime (int): Seconds after which a connection is recycled (0 disables).
+        checkout_timeout (int): Seconds to wait for a free connection before failing.
+        _idle (deque): Connections currently waiting in the pool.
+        _in_use (dict): Connections currently checked out, keyed by connection id.
+        _reserved (int): The number of slots reserved for connections being opened or checked outside the lock.
+        _condition (threading.Condition): Guards the pool state.
+
+    Methods:
+        checkout(): Takes a healthy connection from the pool.
+        checkin(connection): Returns a connection to the pool.
+        close(): Closes every connection owned by the pool.
+        size(): Returns the number of open connections.
+
+    """
+
+    def __init__(self, factory, min_size=1, max_size=5, idle_timeout=300, max_lifetime=3600, checkout_timeout=10):
+        """
+        Initializes the ConnectionPool and opens min_size connections.
+
+        Args:
+            factory (callable): A function opening a new database connection.
+            min_size (int): The number of connections kept open even when idle.
+            max_size (int): The maximum number of connections open at the same time.
+            idle_timeout (int): Seconds after which an idle connection above min_size is closed (0 disables).
+            max_lifetime (int): Seconds after which a connection is recycled (0 disables).
+            checkout_timeout (int): Seconds to wait for a free connection before failing.
+
+        Raises:
+            ValueError: If the pool sizes are invalid.
+
+        """
+
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError('Invalid pool size, expected 0 <= min size <= max size and max size >= 1')
+
+        self._factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self.checkout_timeout = checkout_timeout
+        self._idle = deque()
+        self._in_use = {}
+        self._reserved = 0
+        self._condition = threading.Condition()
+
+        for _ in range(min_size):
+            self._idle.append(PooledConnection(self._factory()))
+
+    def size(self):
+        """
+        Returns the number of open connections.
+
+        Returns:
+            int: The number of idle and checked out connections.
+
+        """
+
+        with self._condition:
+            return len(self._idle) + len(self._in_use)
+
+    def checkout(self):
+        """
+        Takes a healthy connection from the pool, opening a new one if the pool is not full.
+        A slot is reserved under the lock, the idle connection is checked (or a new one opened)
+        and broken connections are closed outside it, so a slow server does not block
+        checkins and other checkouts.
+
+        Returns:
+            connection: A database connection reserved for the caller.
+
+        Raises:
+            Exception: If no connection becomes available within checkout_timeout.
+
+        """
+
+        deadline = time.monotonic() + self.checkout_timeout
+        while True:
+            pooled = None
+            timed_out = False
+            with self._condition:
+                evicted = self._evict_idle()
+                reserved = bool(self._idle) or len(self._in_use) + self._reserved < self.max_size
+                if reserved:
+                    self._reserved += 1
+                    if self._idle:
+                        pooled = self._idle.pop()
+                elif not evicted:
+                    remaining = deadline - time.monotonic()
+                    timed_out = remaining <= 0 or not self._condition.wait(remaining)
+
+            for evicted_pooled in evicted:
+                self._discard(evicted_pooled)
+
+            if not reserved:
+                if timed_out:
+                    raise Exception('No database connection available in pool')
+                continue
+
+            if pooled is not None and (self._is_expired(pooled) or not self._is_healthy(pooled)):
+                self._discard(pooled)
+                self._release_slot()
+                continue
+
+            if pooled is None:
+                try:
+                    pooled = PooledConnection(self._factory())
+                except:
+                    self._release_slot()
+                    raise
+
+            with self._condition:
+                self._reserved -= 1
+                self._in_use[id(pooled.connection)] = pooled
+            return pooled.connection
+
+    def checkin(self, connection):
+        """
+        Returns a connection to the pool, recycling it if it exceeded max_lifetime.
+
+        Args:
+            connection: A connection previously obtained through checkout().
+
+        """
+
+        if connection is None:
+            return
+
+        with self._condition:
+            pooled = self._in_use.pop(id(connection), None)
+            if pooled is None:
+                return
+            expired = self._is_expired(pooled)
+            if not expired:
+                pooled.last_used = time.monotonic()
+                self._idle.append(pooled)
+            self._condition.notify()
+
+        if expired:
+            self._discard(pooled)
+
+    def close(self):
+        """
+        Closes every connection owned by the pool.
+
+        """
+
+        with self._condition:
+            owned = list(self._idle) + list(self._in_use.values())
+            self._idle.clear()
+            self._in_use.clear()
+            self._condition.notify_all()
+
+        for pooled in owned:
+            self._discard(pooled)
+
+    def _release_slot(self):
+        """
+        Releases a slot reserved by checkout() and wakes a waiting checkout.
+
+        """
+
+        with self._condition:
+            self._reserved -= 1
+            self._condition.notify()
+
+    def _evict_idle(self):
+        """
+        Removes idle connections above min_size that were not used for idle_timeout seconds,
+        the caller must hold the lock and close them after releasing it.
+
+        Returns:
+            list: The removed pooled connections.
+
+        """
+
+        if not self.idle_timeout:
+            return []
+
+        now = time.monotonic()
+        kept = deque()
+        evicted = []
+        while self._idle:
+            pooled = self._idle.popleft()
+            open_count = len(kept) + len(self._idle) + len(self._in_use) + self._reserved
+            if open_count >= self.min_size and now - pooled.last_used > self.idle_timeout:
+                evicted.append(pooled)
+            else:
+                kept.append(pooled)
+        self._idle = kept
+        return evicted
+
+    def _is_expired(self, pooled):
+        """
+        Checks whether a connection exceeded max_lifetime.
+
+        Args:
+            pooled (PooledConnection): The pooled connection.
+
+        Returns:
+            bool: True if the connection should be recycled, False otherwise.
+
+        """
+
+        return bool(self.max_lifetime) and time.monotonic() - pooled.created_at > self.max_lifetime
+
+    def _is_healthy(self, pooled):
+        """
+        Pings the server through the connection.
+
+        Args:
+            pooled (PooledConnection): The pooled connection.
+
+        Returns:
+            bool: True if the server answered, False otherwise.
+
+        """
+
+        try:
+            pooled.connection.ping(reconnect=False)
+            return True
+        except:
+            return False
+
+    def _discard(self, pooled):
+        """
+        Closes a pooled connection, ignoring errors of already broken connections.
+
+        Args:
+            pooled (PooledConnection): The pooled connection.
+
+        """
+
+        try:
+            pooled.connection.close()
+        except:
+            pass
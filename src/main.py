@@ -15,13 +15,19 @@ from database_manager import *
 
 def main():
     # Parse command line arguments (if any)
-    arguments().parse_args()
+    args = arguments().parse_args()
 
     conf_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../', 'config'))
 
     # Load configuration from file
     conf_loader = ConfigLoader(f'{conf_path}/config.ini')
     config, name, logs = conf_loader.load_config()
+    pool_config = conf_loader.load_pool_config()
+    query_config = conf_loader.load_query_config()
+    import_config = conf_loader.load_import_config()
+    cache_config = conf_loader.load_cache_config()
+    metrics_config = conf_loader.load_metrics_config()
+    slow_query_config = conf_loader.load_slow_query_config()
     default_config = ['127.0.0.1', '3306', 'root', '', 'AUCTIONS', 3]
     log_format = '%(asctime)s - %(levelname)s - %(message)s'
 
@@ -35,12 +41,32 @@ def main():
         logging.error('Invalid config log path, using default location')
     logger = logging.getLogger(__name__)
 
+    # Set up slow query log, written into its own file
+    slow_query_logger = logging.getLogger('slow_query')
+    slow_query_logger.propagate = False
+    if slow_query_config['enabled']:
+        try:
+            handler = logging.FileHandler(slow_query_config['log_file'])
+        except:
+            print('Invalid config slow query log path, using default location')
+            logger.error('Invalid config slow query log path, using default location')
+            handler = logging.FileHandler('slow_queries.log')
+        handler.setFormatter(logging.Formatter(log_format))
+        slow_query_logger.addHandler(handler)
+
     # Establish database connection
-    connection = connector.Connector(*config[:-1], default_conf=default_config)
+    connection = connector.Connector(*config[:-1], default_conf=default_config, pool_conf=pool_config,
+                                     allow_local_infile=import_config['allow_local_infile'])
 
     # Initialize application components
-    application = Application(config[len(config) - 1], logger)
-    data_manager = DataManager(connection, name)
+    profile_config = {'directory': args.profile_dir, 'top': args.profile_top}
+    application = Application(config[len(config) - 1], logger, import_conf=import_config,
+                              profile_conf=profile_config)
+    metrics = Metrics(metrics_config['enabled'], metrics_config['log_interval'], logger)
+    slow_queries = SlowQueryLog(slow_query_config['enabled'], slow_query_config['threshold_ms'],
+                                slow_query_config['explain'], slow_query_logger)
+    data_manager = DataManager(connection, name, query_conf=query_config, cache_conf=cache_config, metrics=metrics,
+                               slow_queries=slow_queries, logger=logger)
     controller = Controller()
 
     # Set up application components
@@ -52,7 +78,14 @@ def main():
 
     # Start the application
     try:
-        application.start()
+        if args.script is not None and args.profile is not None:
+            application.profiler.run('script', args.profile, application.run_script, args.script)
+        elif args.script is not None:
+            application.run_script(args.script)
+        else:
+            if args.profile is not None:
+                application.profiler.arm(args.profile, True)
+            application.start()
     except Exception as e:
         print('\nProgram terminated..')
         logger.critical('An exception occurred in runtime: %s', e)
@@ -60,6 +93,8 @@ def main():
         print('\nProgram terminated..')
         logger.info('Program was closed')
     finally:
+        metrics.flush()
+        slow_queries.flush()
         connection.close_connection()
 
 
@@ -0,0 +1,13 @@
+"""
+Test Configuration
+
+This module makes the packages in src importable from the tests.
+
+"""
+
+
+import os
+import sys
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../', 'src')))
@@ -0,0 +1,170 @@
+"""
+Async Data Manager Tests
+
+This module tests AsyncDataManager and AsyncConnector on FakeAsyncBackend, without a database server.
+
+"""
+
+
+import asyncio
+import time
+
+import pytest
+
+from database_manager.data_layer.async_data_manager import AsyncDataManager
+from database_utils.async_connector import AsyncConnector
+from database_utils.fake_async_backend import FakeAsyncBackend
+
+
+def create_data_manager(backend, pool_conf=None):
+    """
+    Creates an AsyncDataManager on a connector using the fake backend.
+
+    Args:
+        backend (FakeAsyncBackend): The fake backend.
+        pool_conf (dict, optional): Pool settings of the connector.
+
+    Returns:
+        AsyncDataManager: The data manager.
+
+    """
+
+    connector = AsyncConnector('localhost', 3306, 'user', 'password', 'auctions', 1, 1,
+                               pool_conf or {'max_size': 10}, backend=backend)
+    return AsyncDataManager(connector, 'auctions', query_conf={'insert_batch_rows': 2})
+
+
+def packet_responder(query, data):
+    """
+    Answers the max_allowed_packet query, every other query returns no rows.
+
+    Args:
+        query (str): The SQL query.
+        data (list): The data values of the query.
+
+    Returns:
+        list: The result rows.
+
+    """
+
+    return [(4194304,)] if query.startswith('SELECT @@max_allowed_packet') else []
+
+
+def failing_responder(query, data):
+    """
+    Fails inserts into the bidder table, every other query is answered by packet_responder.
+
+    Args:
+        query (str): The SQL query.
+        data (list): The data values of the query.
+
+    Returns:
+        list: The result rows.
+
+    Raises:
+        Exception: If the query inserts into the bidder table.
+
+    """
+
+    if query.startswith('INSERT INTO BIDDER'):
+        raise Exception(1062, "Duplicate entry '1' for key 'PRIMARY'")
+    return packet_responder(query, data)
+
+
+def test_gathered_operations_overlap():
+    backend = FakeAsyncBackend(latency=0.1)
+    data_manager = create_data_manager(backend)
+
+    async def run():
+        start = time.perf_counter()
+        await asyncio.gather(*[data_manager.make_operation('select', [None] * 6, 'Bidder') for _ in range(5)])
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(run())
+
+    assert backend.max_active_queries == 5
+    assert elapsed < 0.3
+    assert backend.commits == 5
+    assert backend.open_cursors == 0
+
+
+def test_gathered_operations_limited_by_pool_size():
+    backend = FakeAsyncBackend(latency=0.05)
+    data_manager = create_data_manager(backend, {'max_size': 2})
+
+    async def run():
+        await asyncio.gather(*[data_manager.make_operation('select', [None] * 6, 'Bidder') for _ in range(6)])
+
+    asyncio.run(run())
+
+    assert backend.max_active_queries == 2
+    assert len(backend.queries) == 6
+
+
+def test_failed_import_rolls_back():
+    backend = FakeAsyncBackend(failing_responder)
+    data_manager = create_data_manager(backend)
+    rows = [(index, 'Doe', 'John', 'Main St', 12345, '555-0100') for index in range(1, 6)]
+
+    with pytest.raises(Exception, match='Duplicate entry'):
+        asyncio.run(data_manager.import_data('Bidder', rows))
+
+    assert backend.rollbacks == 1
+    assert backend.commits == 1
+    assert backend.open_cursors == 0
+    assert len([query for query, _ in backend.queries if query.startswith('INSERT')]) == 1
+
+
+def test_failed_operation_does_not_affect_gathered_operations():
+    backend = FakeAsyncBackend(failing_responder, latency=0.01)
+    data_manager = create_data_manager(backend)
+    owners = [(1, 'Doe', 'Anna', 'Main St', 12345, '555-0100', True, 'anna@example.com')]
+    bidders = [(1, 'Doe', 'John', 'Main St', 12345, '555-0100')]
+
+    async def run():
+        await data_manager.get_max_packet()
+        return await asyncio.gather(data_manager.import_data('Owner', owners),
+                                    data_manager.import_data('Bidder', bidders),
+                                    data_manager.make_operation('select', [None] * 6, 'Bidder'),
+                                    return_exceptions=True)
+
+    owner_result, bidder_result, select_result = asyncio.run(run())
+
+    assert owner_result is True
+    assert isinstance(bidder_result, Exception)
+    assert select_result == []
+    assert backend.rollbacks == 1
+    assert backend.commits == 3
+    assert backend.open_cursors == 0
+
+
+def test_failed_query_closes_cursor():
+    def responder(query, data):
+        raise Exception(1146, "Table 'auctions.missing' doesn't exist")
+
+    backend = FakeAsyncBackend(responder)
+    data_manager = create_data_manager(backend)
+
+    with pytest.raises(Exception, match="doesn't exist"):
+        asyncio.run(data_manager.execute_query('SELECT * FROM missing;', []))
+
+    assert backend.rollbacks == 1
+    assert backend.commits == 0
+    assert backend.open_cursors == 0
+
+
+def test_concurrent_checkouts_create_one_pool():
+    backend = FakeAsyncBackend()
+    connector = AsyncConnector('localhost', 3306, 'user', 'password', 'auctions', 1, 1,
+                               {'max_size': 10, 'max_lifetime': 0}, backend=backend)
+
+    async def run():
+        connections = await asyncio.gather(*[connector.checkout() for _ in range(5)])
+        for connection in connections:
+            await connector.checkin(connection)
+        await connector.close_connection()
+
+    asyncio.run(run())
+
+    assert len(backend.pools) == 1
+    assert backend.pools[0]['pool_recycle'] == -1